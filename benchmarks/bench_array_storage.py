@@ -0,0 +1,62 @@
+"""compares memory and construction time of List[float] fields stored as lists and arrays
+
+run with: python -m benchmarks.bench_array_storage
+"""
+import random
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.validation import Validator
+from data_validation.validation_func import is_between
+
+RECORDS = 50
+READINGS = 10_000
+REPEAT = 5
+RANGE = ArgFunctionWrapper(is_between, value_range=(-50.0, 50.0))
+
+
+@dataclass
+class ListTelemetry(Container):
+    readings: List[float] = Validator(validator_func=RANGE)
+
+
+@dataclass
+class ArrayTelemetry(Container):
+    readings: List[float] = Validator(validator_func=RANGE, storage="array")
+
+
+@dataclass
+class PyArrayTelemetry(Container):
+    readings: List[float] = Validator(validator_func=RANGE, storage="pyarray")
+
+
+def _peak_per_record(cls, records) -> float:
+    """bytes allocated per instance, the input records themselves excluded"""
+    tracemalloc.start()
+    instances = [cls(readings=record) for record in records]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return current / len(records)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    # strings force a cast, so list storage has to box every reading
+    records = [
+        [str(rng.uniform(-50, 50)) for _ in range(READINGS)] for _ in range(RECORDS)
+    ]
+    for cls in (ListTelemetry, ArrayTelemetry, PyArrayTelemetry):
+        memory = _peak_per_record(cls, records)
+        seconds = min(
+            timeit.repeat(lambda: cls(readings=records[0]), number=10, repeat=REPEAT)
+        ) / 10
+        print(f"{cls.__name__:<20} {memory / 1024:>10.1f}KiB {seconds * 1e3:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""compares the item-wise and the batch validation of Scope.ITEM Sequences
+
+run with: python -m benchmarks.bench_batch_validation
+"""
+import random
+import timeit
+from dataclasses import dataclass
+from typing import List
+
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.validation import Validator
+from data_validation.validation_func import is_between
+
+READINGS = 10_000
+NUMBER = 20
+REPEAT = 5
+
+
+def _item_wise_is_between(value, value_range):
+    """is_between without its batch implementation"""
+    return is_between(value, value_range)
+
+
+@dataclass
+class BatchSensor(Container):
+    readings: List[float] = Validator(
+        validator_func=ArgFunctionWrapper(is_between, value_range=(-50.0, 50.0))
+    )
+
+
+@dataclass
+class ItemSensor(Container):
+    readings: List[float] = Validator(
+        validator_func=ArgFunctionWrapper(_item_wise_is_between, value_range=(-50.0, 50.0))
+    )
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    rng = random.Random(0)
+    readings = [rng.uniform(-50, 50) for _ in range(READINGS)]
+    item_wise = _best_of(lambda: ItemSensor(readings=readings))
+    batch = _best_of(lambda: BatchSensor(readings=readings))
+    print(f"{f'item-wise x {READINGS}':<28} {item_wise * 1e3:>8.2f}ms")
+    print(f"{f'batch x {READINGS}':<28} {batch * 1e3:>8.2f}ms")
+    print(f"{'speedup':<28} {item_wise / batch:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
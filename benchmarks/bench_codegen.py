@@ -0,0 +1,62 @@
+"""compares the construction time of the dataclass __init__ and the one generated by
+compiled for Person, Child and Job_Position
+
+run with: python -m benchmarks.bench_codegen
+"""
+import json
+import timeit
+from dataclasses import dataclass
+
+from data_validation.codegen import compiled
+from data_validation.init_loggers import LoggingConfig
+from sample.example_dataclasses import Child, Job_Position, Person
+from tests import TEST_FILE_PATH
+
+NUMBER = 5_000
+REPEAT = 5
+
+
+@compiled
+@dataclass
+class CompiledPerson(Person):
+    pass
+
+
+@compiled
+@dataclass
+class CompiledChild(Child):
+    pass
+
+
+@compiled
+@dataclass
+class CompiledJob_Position(Job_Position):
+    pass
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    with TEST_FILE_PATH.open() as file:
+        test_dict = json.load(file)
+    # the default case of a few fields is logged, which would dominate the comparison
+    LoggingConfig.set_enabled(False)
+    cases = [
+        (Person, CompiledPerson, test_dict["single_person"]),
+        (Child, CompiledChild, test_dict["example_child"]),
+        (Job_Position, CompiledJob_Position, test_dict["job_position"]),
+    ]
+    for regular, fast, kwargs in cases:
+        regular_time = _best_of(lambda: regular(**kwargs))
+        compiled_time = _best_of(lambda: fast(**kwargs))
+        print(
+            f"{regular.__name__:<14} dataclass {regular_time * 1e6:>8.2f}us "
+            + f"compiled {compiled_time * 1e6:>8.2f}us "
+            + f"speedup {regular_time / compiled_time:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
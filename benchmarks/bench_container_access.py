@@ -0,0 +1,64 @@
+"""compares indexing a Person position by position through the previous __getitem__, which
+rebuilt the flattened dict and its key list on every access, with the key index cached per
+combination of stored fields
+
+run with: python -m benchmarks.bench_container_access
+"""
+import json
+import time
+
+from data_validation.init_loggers import LoggingConfig
+from sample.example_dataclasses import Person
+from tests import TEST_FILE_PATH
+
+COUNT = 2_000
+REPEAT = 5
+
+
+def _legacy_getitem(instance, item):
+    """__getitem__ before the key index, kept as reference"""
+    return list(iter(instance.as_flattened_dict()))[item]
+
+
+def _best_of(func) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    with TEST_FILE_PATH.open() as file:
+        kwargs = json.load(file)["single_person"]
+    LoggingConfig.set_enabled(False)
+    persons = [Person(**kwargs) for _ in range(COUNT)]
+    size = len(list(persons[0]))
+
+    def legacy_loop():
+        for person in persons:
+            for index in range(size):
+                _legacy_getitem(person, index)
+
+    def indexed_loop():
+        for person in persons:
+            for index in range(size):
+                person[index]
+
+    def key_loop():
+        for person in persons:
+            for key in person:
+                person[key]
+
+    legacy = _best_of(legacy_loop)
+    indexed = _best_of(indexed_loop)
+    print(
+        f"positional access before {legacy * 1e3:>8.1f}ms after {indexed * 1e3:>8.1f}ms "
+        + f"speedup {legacy / indexed:>6.1f}x"
+    )
+    print(f"key access of all {size} keys {_best_of(key_loop) * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
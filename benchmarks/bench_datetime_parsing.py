@@ -0,0 +1,50 @@
+"""compares datetime.strptime against the cached parsers of data_validation.datetime_parsing
+
+run with: python -m benchmarks.bench_datetime_parsing
+"""
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from data_validation.datetime_parsing import get_datetime_parser, parse_datetimes
+
+FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S")
+N_VALUES = 10_000
+REPEAT = 5
+
+
+def _sample_strings(dateformat: str, n: int, distinct: int) -> list:
+    start = datetime(1950, 1, 1)
+    pool = [
+        (start + timedelta(days=random.randrange(30_000), seconds=random.randrange(86_400)))
+        .strftime(dateformat)
+        for _ in range(distinct)
+    ]
+    return [random.choice(pool) for _ in range(n)]
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    random.seed(0)
+    print(f"{'format':<20} {'distinct':>8} {'strptime':>10} {'parser':>10} {'batch':>10}")
+    for dateformat in FORMATS:
+        parser = get_datetime_parser(dateformat)
+        for distinct in (N_VALUES, 100):
+            values = _sample_strings(dateformat, N_VALUES, distinct)
+            assert [datetime.strptime(v, dateformat) for v in values] == parse_datetimes(
+                values, dateformat
+            )
+            strptime = _best_of(lambda: [datetime.strptime(v, dateformat) for v in values])
+            single = _best_of(lambda: [parser(v) for v in values])
+            batch = _best_of(lambda: parse_datetimes(values, dateformat))
+            print(
+                f"{dateformat:<20} {distinct:>8} {strptime * 1e3:>8.1f}ms "
+                + f"{single * 1e3:>8.1f}ms {batch * 1e3:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""compares exporting validated Persons and Job_Positions by the previous chain of type checks
+in as_flattened_dict with the ExportPlan, and building a DataFrame from a list of records
+with Container.to_frame
+
+run with: python -m benchmarks.bench_export
+"""
+import json
+import logging
+import pathlib as pl
+import time
+from typing import Sequence
+
+import pandas as pd
+
+from data_validation.data_parsing import ARRAY_TYPES, Container
+from data_validation.init_loggers import LoggingConfig
+from sample.example_dataclasses import Job_Position, Person
+from tests import TEST_FILE_PATH
+
+COUNT = 20_000
+REPEAT = 5
+
+
+def _legacy_flattened_dict(instance) -> dict:
+    """as_flattened_dict before the ExportPlan, kept as reference"""
+    output_dict = {}
+    for key, value in instance._stored_items():
+        if type(value) in [int, float, str, bool] or value is None:
+            output_dict[key] = value
+        elif isinstance(value, pl.Path):
+            output_dict[key] = str(value)
+        elif isinstance(value, dict):
+            output_dict.update({f"{key}_{k}": v for k, v in value.items()})
+        elif issubclass(type(value), Container):
+            output_dict.update(
+                {f"{value.__class__.__name__}_{k}": v for k, v in value._stored_items()}
+            )
+        elif isinstance(value, logging.Logger):
+            pass
+        elif isinstance(value, ARRAY_TYPES):
+            output_dict[key] = ",".join([str(v) for v in value.tolist()])
+        elif isinstance(value, Sequence):
+            output_dict[key] = ",".join([str(v) for v in value])
+        else:
+            output_dict[key] = str(value)
+    return output_dict
+
+
+def _best_of(func) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _report(label: str, reference: float, optimized: float) -> None:
+    print(
+        f"{label:<28} before {reference * 1e3:>8.1f}ms after {optimized * 1e3:>8.1f}ms "
+        + f"speedup {reference / optimized:>5.2f}x"
+    )
+
+
+def main() -> None:
+    with TEST_FILE_PATH.open() as file:
+        test_dict = json.load(file)
+    LoggingConfig.set_enabled(False)
+    for cls, key in ((Person, "single_person"), (Job_Position, "job_position")):
+        instances = [cls(**test_dict[key]) for _ in range(COUNT)]
+        _report(
+            f"{cls.__name__}.as_flattened_dict",
+            _best_of(lambda: [_legacy_flattened_dict(instance) for instance in instances]),
+            _best_of(lambda: [instance.as_flattened_dict() for instance in instances]),
+        )
+        _report(
+            f"{cls.__name__} DataFrame",
+            _best_of(
+                lambda: pd.DataFrame([_legacy_flattened_dict(instance) for instance in instances])
+            ),
+            _best_of(lambda: cls.to_frame(instances)),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""compares the path validators and the glob cast with and without an active stat cache
+
+run with: python -m benchmarks.bench_filesystem
+"""
+import pathlib as pl
+import tempfile
+import timeit
+
+from data_validation.filesystem import stat_cache
+from data_validation.validation_func import is_file
+from sample.example_type_mapping import _cast_from_path_pattern_to_list
+
+FILES = 1_000
+# every path is checked this often per run, e.g. a folder shared by many records
+CHECKS = 3
+REPEAT = 5
+
+
+def _check_all(files) -> None:
+    for _ in range(CHECKS):
+        for file in files:
+            is_file(file)
+
+
+def _check_all_cached(files) -> None:
+    with stat_cache():
+        _check_all(files)
+
+
+def _glob_many(folder: pl.Path, patterns) -> None:
+    for pattern in patterns:
+        _cast_from_path_pattern_to_list(pattern, folder=folder)
+
+
+def _glob_many_cached(folder: pl.Path, patterns) -> None:
+    with stat_cache():
+        _glob_many(folder, patterns)
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = pl.Path(tmp)
+        for sub in range(10):
+            (folder / f"sub_{sub}").mkdir()
+        files = [folder / f"sub_{i % 10}" / f"file_{i}.txt" for i in range(FILES)]
+        for file in files:
+            file.touch()
+        patterns = [f"file_{i}?.txt" for i in range(1, 21)]
+
+        rows = [
+            (f"is_file x {FILES * CHECKS}", _best_of(lambda: _check_all(files))),
+            (f"is_file x {FILES * CHECKS} with stat_cache", _best_of(lambda: _check_all_cached(files))),
+            (f"rglob x {len(patterns)}", _best_of(lambda: _glob_many(folder, patterns))),
+            (
+                f"rglob x {len(patterns)} with stat_cache",
+                _best_of(lambda: _glob_many_cached(folder, patterns)),
+            ),
+        ]
+    for name, seconds in rows:
+        print(f"{name:<36} {seconds * 1e3:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
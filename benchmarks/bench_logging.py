@@ -0,0 +1,115 @@
+"""compares the logging of the Validators and Containers before and after the logger setup
+was made lazy and LoggingConfig.set_enabled was added, both measured in the same run
+
+before: the handlers were set up on every construction and each message was formatted and
+written to the console and the log file
+after: the loggers are set up once per class and disabled logging skips the calls entirely
+
+run with: python -m benchmarks.bench_logging
+"""
+import io
+import json
+import logging
+import tempfile
+import timeit
+import pathlib as pl
+
+import data_validation.init_loggers as log_util
+from sample.example_dataclasses import Occupations, Person
+from tests import TEST_FILE_PATH
+
+NUMBER = 2_000
+REPEAT = 5
+
+
+def _legacy_logger_setup() -> logging.Logger:
+    """setup as previously done by every Validator and Container"""
+    logger = log_util.init_console_logger(logging.getLogger())
+    log_util.init_file_logger(logger)
+    return log_util.init_console_logger(logging.getLogger(Person.__name__))
+
+
+def _handler_logger(log_file: pl.Path) -> logging.Logger:
+    """logger writing to a stream and a file like the console and file handler of
+    init_loggers, the stream is kept in memory so the benchmark doesn't print"""
+    logger = logging.getLogger("bench_logging")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    formatter = logging.Formatter(
+        log_util.LoggingConfig._LOG_FORMAT, datefmt=log_util.LoggingConfig._DATEFORMAT
+    )
+    for handler in (logging.StreamHandler(io.StringIO()), logging.FileHandler(log_file)):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    return logger
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def _report(label: str, before: float, after: float) -> None:
+    print(
+        f"{label:<28} before {before * 1e6:>8.2f}us after {after * 1e6:>8.2f}us "
+        + f"speedup {before / after:>6.1f}x"
+    )
+
+
+def main() -> None:
+    with TEST_FILE_PATH.open() as file:
+        kwargs = json.load(file)["single_person"]
+    # an item which isn't an option of the Enum is logged by _handle_callables
+    invalid = dict(kwargs, occupation="Astronaut")
+    validator = Person.__dict__["occupation"]
+
+    def construct_invalid():
+        try:
+            Person(**invalid)
+        except Exception:
+            pass
+
+    def legacy_construct_invalid():
+        _legacy_logger_setup()
+        construct_invalid()
+
+    def legacy_log_call():
+        # eagerly formatted message passed to a logger with handlers
+        logger.error(f"value {'Astronaut'} is not a valid option of {Occupations}")
+
+    def log_call():
+        if validator._logging_enabled():
+            validator._get_logger().error(
+                "value %s is not a valid option of %s", "Astronaut", Occupations
+            )
+
+    with tempfile.TemporaryDirectory() as directory:
+        logger = _handler_logger(pl.Path(directory) / "log_file.txt")
+        configured = dict(log_util._CONFIGURED_LOGGERS)
+        # the Validators and Containers log through the handlers of the benchmark logger
+        log_util._CONFIGURED_LOGGERS.update({None: logger, Person.__name__: logger})
+        try:
+            legacy_call = _best_of(legacy_log_call)
+            legacy_invalid = _best_of(legacy_construct_invalid)
+            legacy_valid = _best_of(lambda: (_legacy_logger_setup(), Person(**kwargs)))
+            log_util.LoggingConfig.set_enabled(False)
+            call = _best_of(log_call)
+            invalid_person = _best_of(construct_invalid)
+            valid = _best_of(lambda: Person(**kwargs))
+        finally:
+            log_util.LoggingConfig.set_enabled(True)
+            log_util._CONFIGURED_LOGGERS.clear()
+            log_util._CONFIGURED_LOGGERS.update(configured)
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
+
+    _report(
+        "logger setup per Person", _best_of(_legacy_logger_setup), _best_of(log_util.get_logger)
+    )
+    _report("log call, disabled", legacy_call, call)
+    _report("invalid Person, disabled", legacy_invalid, invalid_person)
+    _report("valid Person, disabled", legacy_valid, valid)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""compares patching a field of a long-lived instance with cross-field validation by assignment,
+which only validates the fields referring to it again, with rebuilding the whole instance
+
+run with: python -m benchmarks.bench_revalidation
+"""
+import timeit
+from dataclasses import dataclass
+
+from data_validation.data_parsing import Container
+from data_validation.init_loggers import LoggingConfig
+from data_validation.validation import Validator
+from sample.example_custom_validations import Precise_Email_Validation
+from sample.example_dataclasses import Gender, Occupations
+
+NUMBER = 5_000
+REPEAT = 5
+
+
+@dataclass
+class Config(Container):
+    email: str = Validator(validator_func=Precise_Email_Validation)
+    first_name: str = Validator()
+    last_name: str = Validator()
+    occupation: Occupations = Validator()
+    gender: Gender = Validator()
+    person_id: int = Validator()
+    weight: float = Validator(default=80.0)
+
+
+KWARGS = dict(
+    email="john.doe@gmail.com",
+    first_name="John",
+    last_name="Doe",
+    occupation="Teacher",
+    gender="male",
+    person_id=23,
+)
+
+
+def _best_of(stmt) -> float:
+    return min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main() -> None:
+    LoggingConfig.set_enabled(False)
+    config = Config(**KWARGS)
+
+    def patch():
+        config.last_name = "Doe"
+
+    def rebuild():
+        Config(**{**config.as_dict(), "last_name": "Doe"})
+
+    patched, rebuilt = _best_of(patch), _best_of(rebuild)
+    print(
+        f"assignment {patched * 1e6:>8.2f}us rebuild {rebuilt * 1e6:>8.2f}us "
+        + f"speedup {rebuilt / patched:>5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
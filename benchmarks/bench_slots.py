@@ -0,0 +1,42 @@
+"""measures the memory per instance of regular and slotted Containers
+
+run with: python -m benchmarks.bench_slots [--count 1000000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from sample.example_dataclasses import Person, Slotted_Person
+from tests import TEST_FILE_PATH
+
+
+def _bytes_per_instance(cls, kwargs: dict, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(**kwargs) for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    with TEST_FILE_PATH.open() as file:
+        kwargs = json.load(file)["single_person"]
+
+    for cls in (Person, Slotted_Person):
+        # compile the field plan and fill the casting caches beforehand
+        cls(**kwargs)
+        start = time.perf_counter()
+        memory = _bytes_per_instance(cls, kwargs, args.count)
+        seconds = time.perf_counter() - start
+        print(f"{cls.__name__:<16} {memory:>8.0f} bytes per instance ({seconds:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""cases measured by the benchmark runner, covering the construction of flat and nested
+Containers, the tabular csv path, each default cast, the ITEM and COLLECTION validation scope
+and the export into dicts
+
+run with: python -m data_validation.bench
+"""
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+import pandas as pd
+
+from data_validation.bench import Case
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.init_loggers import LoggingConfig
+from data_validation.streaming import iter_validate
+from data_validation.validation import Scope, Validator
+from data_validation.validation_func import has_length, is_between
+from sample.example_dataclasses import Job_Position, Person, Team
+from tests import TEST_CSV_PATH, TEST_FILE_PATH
+
+FRAME_ROWS = 1_000
+READINGS = 1_000
+
+
+@dataclass
+class CastTarget(Container):
+    flag: bool = Validator(default=False)
+    count: int = Validator(default=0)
+    ratio: float = Validator(default=0.0)
+    timestamp: datetime = Validator(default=None, allow_none=True)
+
+
+@dataclass
+class ItemScoped(Container):
+    readings: List[int] = Validator(
+        validator_func=ArgFunctionWrapper(is_between, value_range=(0, READINGS))
+    )
+
+
+@dataclass
+class CollectionScoped(Container):
+    readings: List[int] = Validator(
+        validator_func=ArgFunctionWrapper(has_length, lower_bound=0, upper_bound=READINGS),
+        validation_scope=Scope.COLLECTION,
+    )
+
+
+def _cast_cases() -> List[Case]:
+    """one case per entry of DEFAULT_TYPE_MAPPING, each assigning a value of the source type to
+    a field of the destination type"""
+    target = CastTarget()
+    inputs = (
+        ("int->bool", "flag", 1),
+        ("float->int", "count", 42.0),
+        ("int->datetime", "timestamp", 1_600_000_000),
+        ("str->bool", "flag", "true"),
+        ("int->float", "ratio", 3),
+        ("str->datetime", "timestamp", "2021-03-04"),
+    )
+    return [
+        Case(f"cast {name}", lambda field=field, value=value: setattr(target, field, value))
+        for name, field, value in inputs
+    ]
+
+
+def _csv_cases() -> List[Case]:
+    """the rows of the sample csv file, half of which are invalid, repeated to FRAME_ROWS rows"""
+    rows = pd.read_csv(TEST_CSV_PATH)
+    frame = pd.concat([rows] * (FRAME_ROWS // len(rows)), ignore_index=True)
+    text = frame.to_csv(index=False)
+    return [
+        Case(
+            "csv iter_validate",
+            lambda: list(iter_validate(io.StringIO(text), Person, format="csv")),
+            items=len(frame),
+        ),
+        Case("csv validate_frame", lambda: Person.validate_frame(frame), items=len(frame)),
+    ]
+
+
+def cases() -> List[Case]:
+    LoggingConfig.set_enabled(False)
+    with TEST_FILE_PATH.open() as file:
+        test_dict = json.load(file)
+    person_dict = test_dict["single_person"]
+    job_dict = test_dict["job_position"]
+    team_dicts = test_dict["team"]
+    person = Person(**person_dict)
+    job_position = Job_Position(**job_dict)
+    readings = list(range(READINGS))
+
+    return [
+        Case("construct Person", lambda: Person(**person_dict)),
+        Case("construct Job_Position", lambda: Job_Position(**job_dict)),
+        Case(
+            "construct Team",
+            lambda: Team(individuals=[Person(**kwargs) for kwargs in team_dicts]),
+            items=len(team_dicts),
+        ),
+        *_csv_cases(),
+        *_cast_cases(),
+        Case("scope ITEM", lambda: ItemScoped(readings=readings), items=READINGS),
+        Case("scope COLLECTION", lambda: CollectionScoped(readings=readings), items=READINGS),
+        Case("as_dict Person", person.as_dict),
+        Case("as_flattened_dict Person", person.as_flattened_dict),
+        Case("as_dict Job_Position", job_position.as_dict),
+        Case("as_flattened_dict Job_Position", job_position.as_flattened_dict),
+    ]
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any, Iterable, List, Optional, Set, Tuple, Union
+
+from data_validation.batch import VALIDATION_ERRORS, RecordError
+from data_validation.validation import DEFERRED_FIELDS
+
+DeferredField = Tuple[Any, Any, Any, Any]
+"""validator, instance, field plan and raw value of a field set by acreate"""
+
+
+def _key(entry: DeferredField) -> Tuple[int, str]:
+    _, instance, field, _ = entry
+    return id(instance), field.name
+
+
+def _dependencies(entry: DeferredField) -> Set[Tuple[int, str]]:
+    """keys of the fields the functions of the entry refer to"""
+    _, instance, field, _ = entry
+    return {(id(instance), name) for name in field.referenced_fields()}
+
+
+async def _set_field(entry: DeferredField, semaphore: Optional[asyncio.Semaphore]) -> None:
+    validator, instance, field, value = entry
+    if semaphore is None:
+        await validator._aset(instance, field, value)
+    else:
+        async with semaphore:
+            await validator._aset(instance, field, value)
+
+
+async def _set_deferred(
+    deferred: List[DeferredField], semaphore: Optional[asyncio.Semaphore]
+) -> None:
+    """sets the deferred fields concurrently, fields referring to other deferred fields of
+    the same instance are only set once those are
+
+    Raises:
+        the first exception in assignment order
+    """
+    pending = deferred
+    while pending:
+        pending_keys = {_key(entry) for entry in pending}
+        ready = [entry for entry in pending if not _dependencies(entry) & pending_keys]
+        # circular references are set at once
+        ready = ready or pending
+        results = await asyncio.gather(
+            *(_set_field(entry, semaphore) for entry in ready), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        ready_keys = {_key(entry) for entry in ready}
+        pending = [entry for entry in pending if _key(entry) not in ready_keys]
+
+
+async def _acreate(
+    cls: type, args: tuple, kwargs: dict, semaphore: Optional[asyncio.Semaphore]
+) -> Any:
+    deferred: List[DeferredField] = []
+    token = DEFERRED_FIELDS.set(deferred)
+    try:
+        instance = cls(*args, **kwargs)
+    finally:
+        DEFERRED_FIELDS.reset(token)
+    await _set_deferred(deferred, semaphore)
+    return instance
+
+
+def _semaphore(max_concurrency: Optional[int]) -> Optional[asyncio.Semaphore]:
+    return None if max_concurrency is None else asyncio.Semaphore(max_concurrency)
+
+
+async def acreate(cls: type, *args, max_concurrency: int = None, **kwargs) -> Any:
+    """instantiates cls, fields whose cleaning, validation or casting functions are coroutine
+    functions are awaited after the synchronous fields are set, independent ones concurrently
+
+    Args:
+        cls (type): class using Validator descriptors e.g. a Container
+        *args, **kwargs: arguments of the class
+        max_concurrency (int, optional): maximum number of fields awaited at the same time.
+            Defaults to None, no limit.
+
+    Raises:
+        ValueError: if the Validation fails
+
+    Returns:
+        the instance
+    """
+    return await _acreate(cls, args, kwargs, _semaphore(max_concurrency))
+
+
+async def acreate_many(
+    cls: type, records: Iterable[dict], max_concurrency: int = None
+) -> List[Union[Any, RecordError]]:
+    """instantiates cls for each record concurrently, see acreate
+
+    Args:
+        cls (type): class using Validator descriptors e.g. a Container
+        records (Iterable[dict]): keyword arguments of each instance
+        max_concurrency (int, optional): maximum number of fields awaited at the same time
+            across all records. Defaults to None, no limit.
+
+    Returns:
+        List[Union[Any, RecordError]]: one entry per record in input order, either the
+            instance or a RecordError
+    """
+    semaphore = _semaphore(max_concurrency)
+
+    async def create(index: int, record: dict):
+        try:
+            return await _acreate(cls, (), record, semaphore)
+        except VALIDATION_ERRORS as e:
+            return RecordError.from_exception(index, record, e)
+
+    return list(
+        await asyncio.gather(*(create(index, record) for index, record in enumerate(records)))
+    )
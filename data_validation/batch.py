@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Iterable, List, Optional, Union
+
+from data_validation.exceptions import CastException, UnexpectedCastException
+
+VALIDATION_ERRORS = (
+    ValueError,
+    TypeError,
+    NotImplementedError,
+    CastException,
+    UnexpectedCastException,
+)
+"""exceptions which mark a single record as invalid instead of aborting the whole batch"""
+
+
+@dataclass
+class RecordError:
+    """describes why a single record of a batch could not be validated
+
+    Attributes:
+        index (int): position of the record in the input
+        record (Any): the record itself
+        error_type (str): name of the raised exception
+        message (str): message of the raised exception
+    """
+
+    index: int
+    record: Any
+    error_type: str
+    message: str
+
+    @classmethod
+    def from_exception(cls, index: int, record: Any, e: Exception) -> "RecordError":
+        return cls(index=index, record=record, error_type=type(e).__name__, message=str(e))
+
+
+def validate_record(cls: type, index: int, record: dict, build: bool = True):
+    """instantiates cls with the record as keyword arguments
+
+    Args:
+        cls (type): validated class
+        index (int): position of the record, is passed on to the RecordError
+        record (dict): keyword arguments of the instance
+        build (bool, optional): if False the instance is discarded. Defaults to True.
+
+    Returns:
+        the instance or None if build is False and a RecordError if the validation failed
+    """
+    try:
+        instance = cls(**record)
+    except VALIDATION_ERRORS as e:
+        return RecordError.from_exception(index, record, e)
+    return instance if build else None
+
+
+def _validate_chunk(cls: type, build: bool, indexed_records: List[tuple]) -> list:
+    return [validate_record(cls, index, record, build) for index, record in indexed_records]
+
+
+def _chunks(records: Iterable[dict], chunksize: int):
+    chunk = []
+    for index, record in enumerate(records):
+        chunk.append((index, record))
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_many(
+    cls: type,
+    records: Iterable[dict],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    build: bool = True,
+) -> List[Union[Any, RecordError]]:
+    """validates a batch of records, distributed onto a pool of worker processes
+
+    Note:
+        cls has to be importable by the worker processes, i.e. be defined on module level,
+        and the instances have to be picklable to be sent back
+
+    Args:
+        cls (type): validated class, each record is passed as keyword arguments
+        records (Iterable[dict]): records to validate
+        workers (int, optional): number of processes, 1 validates in the current process.
+            Defaults to os.cpu_count().
+        chunksize (int, optional): number of records sent to a process at once.
+            Defaults to an even split of about four chunks per worker.
+        build (bool, optional): if False only the validation result is returned, which
+            avoids sending the instances back. Defaults to True.
+
+    Returns:
+        List[Union[Any, RecordError]]: one entry per record in input order, either the
+            instance (None if build is False) or a RecordError
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return [
+            validate_record(cls, index, record, build)
+            for index, record in enumerate(records)
+        ]
+
+    records = list(records)
+    if chunksize is None:
+        chunksize = max(1, len(records) // (workers * 4))
+    worker_fct = partial(_validate_chunk, cls, build)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = []
+        for chunk_result in executor.map(worker_fct, _chunks(records, chunksize)):
+            results.extend(chunk_result)
+    return results
@@ -0,0 +1,277 @@
+"""runs a benchmark suite and compares it against a stored baseline
+
+run with: python -m data_validation.bench [--output results.json] [--baseline baseline.json]
+
+A suite is a module with a function cases() returning the Cases to measure, the default one is
+benchmarks.suite of the repository, so the runner has to be started from its root.
+"""
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_SUITE = "benchmarks.suite"
+DEFAULT_THRESHOLD = 0.1
+COMPARED_METRICS = ("p50", "peak_memory")
+"""metrics of a case compared against the baseline, a case regressed if one of them grew by
+more than the threshold"""
+
+
+@dataclass
+class Case:
+    """
+    a single benchmark of a suite
+
+    Attributes:
+        name (str): unique name, used to match the case with the one of the baseline
+        func (Callable[[], Any]): measured operation, everything it needs has to be prepared
+            in advance
+        items (int): number of items func processes per call, e.g. rows of a csv file, the
+            throughput is reported in items per second
+    """
+
+    name: str
+    func: Callable[[], Any]
+    items: int = 1
+
+
+@dataclass
+class CaseResult:
+    """
+    measurements of a Case, times are given in seconds per call
+
+    Attributes:
+        name (str): name of the case
+        items (int): items processed per call
+        calls (int): number of timed calls
+        throughput (float): items per second
+        mean (float): mean latency
+        p50 (float): median latency
+        p90 (float): 90th percentile of the latency
+        p99 (float): 99th percentile of the latency
+        peak_memory (int): peak of the memory allocated by a single call in bytes
+    """
+
+    name: str
+    items: int
+    calls: int
+    throughput: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    peak_memory: int
+
+
+def _calls_per_sample(func: Callable[[], Any], sample_time: float) -> int:
+    """number of calls whose duration exceeds sample_time, so the timer resolution doesn't
+    distort fast operations"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= sample_time or number >= 1_000_000:
+            return number
+        number *= 10
+
+
+def _percentile(latencies: List[float], percent: float) -> float:
+    """percentile of sorted latencies by linear interpolation"""
+    position = (len(latencies) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(latencies) - 1)
+    return latencies[lower] + (latencies[upper] - latencies[lower]) * (position - lower)
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+def measure(
+    case: Case, min_time: float = 1.0, sample_time: float = 1e-3, max_samples: int = 10_000
+) -> CaseResult:
+    """times a case for at least min_time seconds and traces the memory of one more call
+
+    Args:
+        case (Case): measured case
+        min_time (float, optional): seconds the case is timed for. Defaults to 1.0.
+        sample_time (float, optional): minimum duration of a single sample, samples of fast
+            operations consist of several calls. Defaults to 1e-3.
+        max_samples (int, optional): maximum number of samples. Defaults to 10_000.
+
+    Returns:
+        CaseResult: latencies, throughput and peak memory of the case
+    """
+    # warm up caches, e.g. the field plans of the classes
+    case.func()
+    number = _calls_per_sample(case.func, sample_time)
+    latencies = []
+    deadline = time.perf_counter() + min_time
+    while len(latencies) < max_samples and (len(latencies) < 5 or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        for _ in range(number):
+            case.func()
+        latencies.append((time.perf_counter() - start) / number)
+    latencies.sort()
+    mean = statistics.fmean(latencies)
+    return CaseResult(
+        name=case.name,
+        items=case.items,
+        calls=len(latencies) * number,
+        throughput=case.items / mean,
+        mean=mean,
+        p50=_percentile(latencies, 50),
+        p90=_percentile(latencies, 90),
+        p99=_percentile(latencies, 99),
+        peak_memory=_peak_memory(case.func),
+    )
+
+
+def compare(
+    results: List[CaseResult], baseline: Dict[str, dict], threshold: float = DEFAULT_THRESHOLD
+) -> Dict[str, Dict[str, float]]:
+    """ratio of the current to the baseline value of each compared metric
+
+    Args:
+        results (List[CaseResult]): current results
+        baseline (Dict[str, dict]): results of the baseline per case name, see save_results
+        threshold (float, optional): relative growth of a metric tolerated before it counts
+            as a regression. Defaults to 0.1, i.e. 10%.
+
+    Returns:
+        Dict[str, Dict[str, float]]: ratios of the regressed metrics per case name, cases
+            missing from the baseline are skipped
+    """
+    regressions = {}
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = reference.get(metric), getattr(result, metric)
+            if before and after / before > 1 + threshold:
+                regressions.setdefault(result.name, {})[metric] = after / before
+    return regressions
+
+
+def save_results(path: str, results: List[CaseResult]) -> None:
+    """writes the results together with the environment they were measured in as JSON"""
+    document = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    """results per case name of a file written by save_results"""
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def _print_result(result: CaseResult, ratios: Optional[Dict[str, float]]) -> None:
+    line = (
+        f"{result.name:<32} {result.throughput:>12,.0f} items/s "
+        + f"p50 {_format_time(result.p50):>9} p90 {_format_time(result.p90):>9} "
+        + f"p99 {_format_time(result.p99):>9} peak {result.peak_memory / 1024:>9.1f}KiB"
+    )
+    if ratios:
+        line += "  REGRESSION " + ", ".join(f"{m} x{r:.2f}" for m, r in ratios.items())
+    print(line)
+
+
+def run(
+    suite: str = DEFAULT_SUITE,
+    pattern: str = None,
+    min_time: float = 1.0,
+    output: str = None,
+    baseline: str = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> bool:
+    """measures all cases of a suite whose name contains the pattern
+
+    Args:
+        suite (str, optional): module providing cases(). Defaults to "benchmarks.suite".
+        pattern (str, optional): only cases whose name contains it are run. Defaults to None.
+        min_time (float, optional): seconds each case is timed for. Defaults to 1.0.
+        output (str, optional): JSON file the results are saved to. Defaults to None.
+        baseline (str, optional): JSON file of a previous run to compare against.
+            Defaults to None.
+        threshold (float, optional): tolerated relative growth of the median latency and the
+            peak memory. Defaults to 0.1.
+
+    Returns:
+        bool: if no case regressed compared to the baseline
+    """
+    cases = importlib.import_module(suite).cases()
+    if pattern is not None:
+        cases = [case for case in cases if pattern in case.name]
+    reference = load_results(baseline) if baseline is not None else {}
+    results = []
+    regressions = {}
+    for case in cases:
+        result = measure(case, min_time=min_time)
+        results.append(result)
+        ratios = compare([result], reference, threshold)
+        regressions.update(ratios)
+        _print_result(result, ratios.get(case.name))
+    if output is not None:
+        save_results(output, results)
+    if regressions:
+        print(f"{len(regressions)} of {len(results)} cases regressed by more than {threshold:.0%}")
+    return not regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--suite", default=DEFAULT_SUITE, help="module providing cases()")
+    parser.add_argument("-k", "--pattern", help="only run cases whose name contains it")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per case")
+    parser.add_argument("--output", help="JSON file the results are saved to")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="tolerated relative growth of the median latency and the peak memory",
+    )
+    args = parser.parse_args(argv)
+    passed = run(
+        suite=args.suite,
+        pattern=args.pattern,
+        min_time=args.min_time,
+        output=args.output,
+        baseline=args.baseline,
+        threshold=args.threshold,
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
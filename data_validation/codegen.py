@@ -0,0 +1,239 @@
+import dataclasses
+from collections.abc import Sequence
+from numbers import Integral, Real
+from typing import Any, Dict, List
+
+import numpy as np
+
+from data_validation.exceptions import CastException
+from data_validation.report import ACTIVE_REPORT
+from data_validation.validation import (
+    CastStep,
+    FieldPlan,
+    State,
+    Validator,
+    _is_missing,
+    get_field_plan,
+    init_in_order,
+)
+
+
+def _fast_path_condition(name: str, field: FieldPlan, namespace: Dict[str, Any], i: int) -> str:
+    """condition under which the value is kept as it is, i.e. its type is exactly the annotated
+    type and casting it is a CastStep.IDENTITY, None if there is no such type"""
+    annotated_type = field.annotated_type
+    if not isinstance(annotated_type, type) or field.origin is not None:
+        return None
+    if field.resolve_cast(annotated_type, False)[0] is not CastStep.IDENTITY:
+        return None
+    namespace[f"_t{i}"] = annotated_type
+    condition = f"type({name}) is _t{i}"
+    if issubclass(annotated_type, Real) and not issubclass(annotated_type, Integral):
+        # NaN marks a missing value
+        condition += f" and {name} == {name}"
+    return condition
+
+
+def _validates_scalar(field: FieldPlan) -> bool:
+    """if a value of exactly the annotated type is validated as a whole, so the validation
+    function can be called directly instead of by Validator._perform_validation"""
+    annotated_type = field.annotated_type
+    return (
+        field.cleaning_func is None
+        and not field.validator_func.references
+        and isinstance(annotated_type, type)
+        and (
+            issubclass(annotated_type, str)
+            or not issubclass(annotated_type, (Sequence, np.ndarray))
+        )
+    )
+
+
+def _store_lines(
+    name: str, field: FieldPlan, namespace: Dict[str, Any], i: int, exact_type: bool
+) -> List[str]:
+    """cleans, validates and stores the casted value held by the argument name, exact_type
+    is set if the value is known to be of exactly the annotated type"""
+    lines = []
+    cleaning_func = field.cleaning_func
+    if cleaning_func is not None:
+        if cleaning_func.references:
+            lines.append(f"{name} = _p{i}.cleaning_func.resolve(self)({name})")
+        else:
+            namespace[f"_c{i}"] = cleaning_func.wrapper
+            lines.append(f"{name} = _c{i}({name})")
+    if field.validator_func is not None:
+        if exact_type and _validates_scalar(field):
+            namespace[f"_f{i}"] = field.validator_func.wrapper
+            lines.extend(
+                [
+                    "try:",
+                    f"    _msg = _f{i}({name})",
+                    "except ValueError as e:",
+                    "    raise ValueError(",
+                    f"        f\"Validation Test failed for field '{field.validator._name}': {{e}}\"",
+                    "    )",
+                    "if _msg:",
+                    f"    _v{i}._log_validation_msgs([_msg])",
+                ]
+            )
+        else:
+            lines.append(f"_v{i}._perform_validation(self, _p{i}, {name})")
+    if field.validator._slot is None:
+        lines.append(f"_instance_dict[{field.validator._name!r}] = {name}")
+    else:
+        namespace[f"_s{i}"] = field.validator._slot
+        lines.append(f"_s{i}.__set__(self, {name})")
+    return lines
+
+
+def _field_lines(name: str, field: FieldPlan, namespace: Dict[str, Any], i: int) -> List[str]:
+    """inlined Validator.__set__ of a single field"""
+    validator = field.validator
+    namespace[f"_v{i}"] = validator
+    namespace[f"_p{i}"] = field
+    store = _store_lines(name, field, namespace, i, exact_type=False)
+    if validator._default == State.NOT_SET:
+        default = [f"raise _v{i}._missing_argument_error(self.__class__.__name__)"]
+    else:
+        # like Validator.__set__ the default is resolved by __get__ and not stored
+        default = ["pass"]
+
+    lines = []
+    condition = _fast_path_condition(name, field, namespace, i)
+    if condition is not None:
+        lines.append(f"if {condition}:")
+        lines.extend(
+            "    " + line for line in _store_lines(name, field, namespace, i, exact_type=True)
+        )
+        lines.append(f"elif {name} is _v{i}:")
+    else:
+        lines.append(f"if {name} is _v{i}:")
+    lines.extend("    " + line for line in default)
+    lines.append(f"elif _is_missing({name}):")
+    lines.append(f"    _v{i}._handle_None()")
+    lines.append("else:")
+    if field.origin is None:
+        # never a Sequence of items, so the type specific casting step is called directly
+        lines.extend(
+            [
+                "    try:",
+                f"        {name} = _v{i}._handle_casting(self, _p{i}, type({name}), {name}, False)",
+                "    except _CastException as e:",
+                f"        raise _v{i}._cast_error(_p{i}, e, False)",
+            ]
+        )
+    else:
+        lines.append(f"    {name} = _v{i}._cast(self, _p{i}, {name})")
+    lines.extend("    " + line for line in store)
+    return lines
+
+
+def _body_order(cls: type) -> List[str]:
+    """fields in declaration order, with the ones managed by Validators in the construction
+    order of the class"""
+    plan = get_field_plan(cls)
+    names = [field.name for field in dataclasses.fields(cls)]
+    if set(plan.construction_order) != set(plan.fields) & set(names):
+        return names
+    order = iter(plan.construction_order)
+    return [next(order) if name in plan.fields else name for name in names]
+
+
+def _init_source(cls: type, namespace: Dict[str, Any]) -> str:
+    plan = get_field_plan(cls)
+    params, body = [], []
+    uses_dict = False
+    fields = {field.name: field for field in dataclasses.fields(cls)}
+    for i, field in enumerate(fields.values()):
+        if not field.init or getattr(field, "kw_only", False):
+            raise TypeError(
+                f"field '{field.name}' of '{cls.__name__}' is not a regular init argument, "
+                + "which compiled doesn't support"
+            )
+        if field.default_factory is not dataclasses.MISSING:
+            raise TypeError(
+                f"field '{field.name}' of '{cls.__name__}' uses a default_factory, which "
+                + "compiled doesn't support, use Validator(default=...) instead"
+            )
+        if field.default is dataclasses.MISSING:
+            params.append(field.name)
+        else:
+            namespace[f"_d{i}"] = field.default
+            params.append(f"{field.name}=_d{i}")
+
+    # referenced fields are set before the fields referring to them
+    for i, name in enumerate(_body_order(cls)):
+        field = fields[name]
+        field_plan = plan.fields.get(field.name)
+        if (
+            field_plan is None
+            or type(field_plan.validator) is not Validator
+            or field_plan.is_async
+        ):
+            # plain fields, subclasses of Validator and fields awaited by acreate are set
+            # regularly
+            body.append(f"self.{field.name} = {field.name}")
+            continue
+        uses_dict = uses_dict or field_plan.validator._slot is None
+        body.extend(_field_lines(field.name, field_plan, namespace, i))
+
+    names = [field.name for field in dataclasses.fields(cls)]
+    lines = [f"def __init__(self, {', '.join(params)}):"] if params else ["def __init__(self):"]
+    # errors are collected by the regular assignment of each field
+    lines.append("    if _ACTIVE_REPORT.get() is not None:")
+    lines.append(f"        return _fallback(self, {', '.join(names)})")
+    if uses_dict:
+        lines.append("    _instance_dict = self.__dict__")
+    lines.extend("    " + line for line in body)
+    if hasattr(cls, "__post_init__"):
+        lines.append("    self.__post_init__()")
+    return "\n".join(lines) + "\n"
+
+
+def compiled(cls: type) -> type:
+    """class decorator generating a specialized __init__ for a dataclass using Validators,
+    which inlines the default, cast, cleaning and validation step of each field instead of
+    dispatching every argument through Validator.__set__. The descriptors stay in place, so
+    later assignments are validated as before. Has to be applied on top of @dataclass:
+
+        @compiled
+        @dataclass
+        class Person(Container):
+            ...
+
+    Args:
+        cls (type): dataclass whose fields are regular init arguments
+
+    Raises:
+        TypeError: if cls is not a dataclass or uses fields compiled doesn't support, i.e.
+            default_factory, init=False or kw_only
+
+    Returns:
+        type: cls with the generated __init__
+    """
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"compiled has to be applied on top of @dataclass, got {cls}")
+    fallback = cls.__init__
+    if get_field_plan(cls).reorders:
+
+        def fallback(self, *args, _init=cls.__init__):
+            init_in_order(self, _init, args, {})
+
+    namespace = {
+        "_ACTIVE_REPORT": ACTIVE_REPORT,
+        "_CastException": CastException,
+        "_fallback": fallback,
+        "_is_missing": _is_missing,
+    }
+    source = _init_source(cls, namespace)
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__module__ = cls.__module__
+    init.__doc__ = cls.__init__.__doc__
+    init.__compiled_source__ = source
+    # the fields are already set in construction order, see ValidationMeta.__call__
+    init.__ordered__ = True
+    cls.__init__ = init
+    return cls
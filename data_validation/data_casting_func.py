@@ -1,8 +1,10 @@
 from datetime import datetime
 from math import log2
+from typing import List
 
+from data_validation.datetime_parsing import parse_datetime, parse_datetimes
 from data_validation.decorators import apply_casting
-from data_validation.defaults import DATEFORMAT
+
 
 @apply_casting
 def _cast_to_bool_from_int(inp: int) -> bool:
@@ -47,9 +49,13 @@ def _cast_int_to_float(inp: int) -> float:
 
 @apply_casting
 def _cast_str_to_datetime(inp: str, dateformat: str = None) -> datetime:
-    if dateformat is None:
-        dateformat = DATEFORMAT
-    return datetime.strptime(inp, dateformat)
+    return parse_datetime(inp, dateformat)
+
+
+@apply_casting
+def _cast_str_list_to_datetime(inp: List[str], dateformat: str = None) -> List[datetime]:
+    """batch counterpart of _cast_str_to_datetime for Sequences of strings"""
+    return parse_datetimes(inp, dateformat)
 
 
 @apply_casting
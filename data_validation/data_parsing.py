@@ -1,15 +1,287 @@
 import dataclasses
+from array import array
 from enum import Enum
 import logging
+from operator import attrgetter, methodcaller
 import pathlib as pl
-from typing import Sequence
+from typing import AbstractSet, Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
 from data_validation.exceptions import CastException
-from data_validation.init_loggers import init_console_logger
-from collections import ChainMap
+from data_validation.init_loggers import LoggingConfig, get_logger
 
 from data_validation.meta import ValidationMeta
 
 
+ARRAY_TYPES = (np.ndarray, array)
+MAX_CACHED_SHAPES = 256
+"""number of key indexes an ExportPlan keeps, one per combination of stored fields and keys of
+expanded dicts and nested Containers"""
+"""containers of fields with Storage.ARRAY or Storage.PYARRAY, exported as lists"""
+
+
+def _export_array_factory(items: list) -> dict:
+    """dict_factory of dataclasses.asdict converting arrays into lists of Python numbers"""
+    return {
+        key: value.tolist() if isinstance(value, ARRAY_TYPES) else value
+        for key, value in items
+    }
+
+
+FlatExport = Callable[["ExportPlan", "Container", str, Any, dict], None]
+"""adds a value of a field to the output of Container.as_flattened_dict"""
+
+
+def _flat_str(plan, instance, key, value, output_dict) -> None:
+    output_dict[key] = str(value)
+
+
+def _flat_dict(plan, instance, key, value, output_dict) -> None:
+    for sub_key, sub_value in value.items():
+        output_dict[f"{key}_{sub_key}"] = sub_value
+
+
+def _flat_container(plan, instance, key, value, output_dict) -> None:
+    # stored values of nested Containers are kept as they are
+    nested_plan = get_export_plan(type(value))
+    for sub_key, sub_value in value._stored_items():
+        output_dict[nested_plan.prefixed_key(sub_key)] = sub_value
+
+
+def _flat_skip(plan, instance, key, value, output_dict) -> None:
+    pass
+
+
+def _flat_array(plan, instance, key, value, output_dict) -> None:
+    output_dict[key] = ",".join([str(v) for v in value.tolist()])
+
+
+def _flat_sequence(plan, instance, key, value, output_dict) -> None:
+    output_dict[key] = ",".join([str(v) for v in value])
+
+
+def _flat_unsupported(plan, instance, key, value, output_dict) -> None:
+    output_dict[key] = str(value)
+    if LoggingConfig._ENABLED:
+        instance.logger.warning("Unsupported datastructure, for dict unpacking: %s", value)
+
+
+def _flat_export(value_type: type) -> Optional[FlatExport]:
+    """how values of the type are exported by Container.as_flattened_dict, None if they
+    are kept"""
+    if value_type in (int, float, str, bool, type(None)):
+        return None
+    if issubclass(value_type, pl.Path):
+        return _flat_str
+    if issubclass(value_type, dict):
+        return _flat_dict
+    if issubclass(value_type, Container):
+        return _flat_container
+    if issubclass(value_type, logging.Logger):
+        return _flat_skip
+    if issubclass(value_type, ARRAY_TYPES):
+        return _flat_array
+    if issubclass(value_type, Sequence):
+        return _flat_sequence
+    return _flat_unsupported
+
+
+def _nested_converter(value_type: type) -> Optional[Callable[[Any], Any]]:
+    """how values of the type are exported by Container.as_dict, None if they are kept"""
+    if value_type in (int, float, str, list, type(None)) or issubclass(value_type, dict):
+        return None
+    if issubclass(value_type, ARRAY_TYPES):
+        return methodcaller("tolist")
+    if issubclass(value_type, Container):
+        return methodcaller("as_dict")
+    if issubclass(value_type, Enum):
+        return attrgetter("value")
+    if issubclass(value_type, (Sequence, AbstractSet)) and not issubclass(
+        value_type, (str, bytes, bytearray)
+    ):
+        # tuples, sets etc. of Sequence fields are exported like lists
+        return list
+    return str
+
+
+class ExportPlan:
+    """
+    serializer plan of a Container class, the export of a value is looked up by its type,
+    which is resolved once per class and type instead of on every call, see get_export_plan
+
+    Attributes:
+        owner (type): class the plan was built for
+        meta_params (frozenset): fields left out by as_dict
+    """
+
+    __slots__ = (
+        "owner",
+        "meta_params",
+        "_flat_exports",
+        "_converters",
+        "_prefixed_keys",
+        "_key_indexes",
+    )
+
+    def __init__(self, owner: type) -> None:
+        from data_validation.validation import get_field_plan
+
+        self.owner = owner
+        self.meta_params = frozenset(owner.META_PARAMS)
+        self._flat_exports: Dict[type, Optional[FlatExport]] = {}
+        self._converters: Dict[type, Optional[Callable[[Any], Any]]] = {}
+        self._prefixed_keys: Dict[str, str] = {}
+        self._key_indexes: Dict[tuple, Dict[str, Tuple[str, Any, Any]]] = {}
+        # the annotated types are the most likely types of the stored values
+        for field in get_field_plan(owner).fields.values():
+            for value_type in (field.annotated_type, field.origin, type(None)):
+                if isinstance(value_type, type):
+                    self._flat_exports[value_type] = _flat_export(value_type)
+                    self._converters[value_type] = _nested_converter(value_type)
+
+    def prefixed_key(self, key: str) -> str:
+        """key of a field of the owner flattened into the dict of a parent"""
+        prefixed = self._prefixed_keys.get(key)
+        if prefixed is None:
+            prefixed = self._prefixed_keys[key] = f"{self.owner.__name__}_{key}"
+        return prefixed
+
+    def _export(self, value_type: type) -> Optional[FlatExport]:
+        try:
+            return self._flat_exports[value_type]
+        except KeyError:
+            export = self._flat_exports[value_type] = _flat_export(value_type)
+            return export
+
+    def _shape(self, instance: "Container") -> tuple:
+        """what the keys of the flattened dict of the instance depend on, i.e. the names of
+        the stored fields and the keys of dicts and nested Containers expanded into it"""
+        shape = []
+        exports = self._flat_exports
+        for name, value in instance._stored_items():
+            value_type = type(value)
+            try:
+                export = exports[value_type]
+            except KeyError:
+                export = exports[value_type] = _flat_export(value_type)
+            if export is None or export is _flat_sequence or export is _flat_str:
+                shape.append(name)
+            elif export is _flat_dict:
+                shape.append((name, _flat_dict, tuple(value)))
+            elif export is _flat_container:
+                shape.append((name, type(value), tuple(k for k, _ in value._stored_items())))
+            elif export is not _flat_skip:
+                shape.append(name)
+        return tuple(shape)
+
+    def _key_index(self, instance: "Container") -> Dict[str, Tuple[str, Any, Any]]:
+        """maps each key of the flattened dict of the instance to the field it is exported
+        from, walking the stored fields like flattened and cached per shape of the instance"""
+        shape = self._shape(instance)
+        key_index = self._key_indexes.get(shape)
+        if key_index is not None:
+            return key_index
+        key_index = {}
+        for item in shape:
+            if isinstance(item, str):
+                key_index[item] = (item, None, None)
+            elif item[1] is _flat_dict:
+                name, _, sub_keys = item
+                for sub_key in sub_keys:
+                    key_index[f"{name}_{sub_key}"] = (name, _flat_dict, sub_key)
+            else:
+                name, nested_type, sub_keys = item
+                nested_plan = get_export_plan(nested_type)
+                for sub_key in sub_keys:
+                    key_index[nested_plan.prefixed_key(sub_key)] = (
+                        name,
+                        _flat_container,
+                        sub_key,
+                    )
+        if len(self._key_indexes) >= MAX_CACHED_SHAPES:
+            self._key_indexes.clear()
+        self._key_indexes[shape] = key_index
+        return key_index
+
+    def keys(self, instance: "Container") -> Tuple[str, ...]:
+        """ordered keys of the flattened dict of the instance, without building it"""
+        return tuple(self._key_index(instance))
+
+    def value(self, instance: "Container", key: str) -> Any:
+        """value of a key of the flattened dict of the instance, without building it
+
+        Raises:
+            KeyError: if the key is not part of the flattened dict of the instance
+        """
+        name, export, sub_key = self._key_index(instance)[key]
+        # only stored fields are part of the index, so their attributes are the stored values
+        value = getattr(instance, name)
+        if export is _flat_dict:
+            return value[sub_key]
+        if export is _flat_container:
+            # like flattened the stored values of nested Containers are kept as they are
+            return getattr(value, sub_key)
+        export = self._export(type(value))
+        if export is None:
+            return value
+        exported = {}
+        export(self, instance, key, value, exported)
+        return exported[key]
+
+    def items(self, instance: "Container") -> Iterator[Tuple[str, Any]]:
+        """lazily yields each key of the flattened dict of the instance and its value"""
+        for key in self._key_index(instance):
+            yield key, self.value(instance, key)
+
+    def flattened(self, instance: "Container") -> dict:
+        """see Container.as_flattened_dict"""
+        output_dict = {}
+        exports = self._flat_exports
+        for key, value in instance._stored_items():
+            value_type = type(value)
+            try:
+                export = exports[value_type]
+            except KeyError:
+                export = exports[value_type] = _flat_export(value_type)
+            if export is None:
+                output_dict[key] = value
+            else:
+                export(self, instance, key, value, output_dict)
+        return output_dict
+
+    def nested(self, instance: "Container") -> dict:
+        """see Container.as_dict"""
+        output_dict = {}
+        converters = self._converters
+        meta_params = self.meta_params
+        for key, value in instance._stored_items():
+            if key in meta_params:
+                continue
+            value_type = type(value)
+            try:
+                converter = converters[value_type]
+            except KeyError:
+                converter = converters[value_type] = _nested_converter(value_type)
+            output_dict[key] = value if converter is None else converter(value)
+        return output_dict
+
+
+def get_export_plan(owner: type) -> ExportPlan:
+    """returns the ExportPlan of a Container class, builds it on first access
+
+    Args:
+        owner (type): subclass of Container
+
+    Returns:
+        ExportPlan: plan cached on the class itself
+    """
+    plan = owner.__dict__.get("__export_plan__")
+    if plan is None:
+        plan = ExportPlan(owner)
+        setattr(owner, "__export_plan__", plan)
+    return plan
+
+
 class DataParingError(Exception):
     def __init__(self, message: str = None) -> None:
         super().__init__(message)
@@ -25,95 +297,222 @@ class Container(metaclass=ValidationMeta):
 
     META_PARAMS = ["base_path", "log_level", "logger"]
 
-    def __new__(cls, *args, **kwargs):
-        cls.__annotations__ = ChainMap(
-            *(c.__annotations__ for c in cls.__mro__ if "__annotations__" in c.__dict__)
-        )
-        obj = super().__new__(cls)
-        return obj
+    # subclasses get a __dict__ unless they are created with slots=True, see ValidationMeta
+    __slots__ = ()
 
     @classmethod
-    def static_validation(cls, verbose=True, *args, **kwargs) -> str:
+    def static_validation(cls, verbose=True, *args, errors="raise", **kwargs):
         """tests if class can be initialized given the arguments without actually instantiating it
-        returns Error Text if it fails and 'Success' if no errors are raised"""
+        returns Error Text if it fails and 'Success' if no errors are raised
+
+        with errors="collect" all fields are validated and a ValidationReport listing the
+        error of each failed field is returned instead, see Container.build"""
+        if errors == "collect":
+            report = cls.build(*args, errors=errors, **kwargs)
+            report.instance = None
+            return report
         try:
             _ = cls(*args, **kwargs)
             return "Success"
         except (ValueError, TypeError, CastException) as e:
             return f"Failed with Error: {e}"
 
+    @classmethod
+    def build(cls, *args, errors="raise", **kwargs):
+        """instantiates the class
+
+        Args:
+            errors (str, optional): "raise" to raise the first error like calling the class,
+                "collect" to validate every field even if previous ones failed.
+                Defaults to "raise".
+
+        Raises:
+            ValueError: if errors is neither "raise" nor "collect"
+
+        Returns:
+            the instance for errors="raise", a ValidationReport holding the errors of all \
+                fields and the instance if there are none for errors="collect"
+        """
+        if errors == "raise":
+            return cls(*args, **kwargs)
+        if errors != "collect":
+            raise ValueError(f"errors has to be 'raise' or 'collect', received <{errors}>")
+        from data_validation.report import collect_errors
+
+        return collect_errors(cls, *args, **kwargs)
+
+    @classmethod
+    def check(cls, mapping) -> "ValidationReport":
+        """dry-run of the validation of the keyword arguments in mapping, neither an instance
+        nor its logger are created, see data_validation.dry_run.check
+
+        Returns:
+            ValidationReport: report.valid tells whether the class could be instantiated,
+                report.errors why not
+        """
+        from data_validation.dry_run import check
+
+        return check(cls, mapping)
+
+    @classmethod
+    def validate_frame(cls, df):
+        """validates each row of a DataFrame column-wise without instantiating the class,
+        see data_validation.frame_validation.validate_frame
+
+        Returns:
+            Tuple[pd.Series, pd.DataFrame]: boolean mask of the valid rows and a frame
+                holding the error message of each invalid cell or None
+        """
+        from data_validation.frame_validation import validate_frame
+
+        return validate_frame(cls, df)
+
+    @classmethod
+    def validate_many(cls, records, workers=None, chunksize=None, build=True) -> list:
+        """instantiates the class for each record across a pool of worker processes,
+        see data_validation.batch.validate_many
+
+        Returns:
+            list: one entry per record in input order, either the instance (None if build is
+                False) or a RecordError
+        """
+        from data_validation.batch import validate_many
+
+        return validate_many(
+            cls, records, workers=workers, chunksize=chunksize, build=build
+        )
+
+    @classmethod
+    async def acreate(cls, *args, max_concurrency=None, **kwargs):
+        """instantiates the class awaiting the fields with coroutine functions concurrently,
+        see data_validation.async_validation.acreate
+
+        Returns:
+            the instance
+        """
+        from data_validation.async_validation import acreate
+
+        return await acreate(cls, *args, max_concurrency=max_concurrency, **kwargs)
+
+    @classmethod
+    async def acreate_many(cls, records, max_concurrency=None) -> list:
+        """instantiates the class for each record concurrently,
+        see data_validation.async_validation.acreate_many
+
+        Returns:
+            list: one entry per record in input order, either the instance or a RecordError
+        """
+        from data_validation.async_validation import acreate_many
+
+        return await acreate_many(cls, records, max_concurrency=max_concurrency)
+
+    @classmethod
+    def to_records(cls, instances, flat=True) -> list:
+        """exports the instances as dicts, see data_validation.export.to_records
+
+        Returns:
+            list: as_flattened_dict, or as_dict if flat is False, of each instance
+        """
+        from data_validation.export import to_records
+
+        return to_records(instances, flat=flat)
+
+    @classmethod
+    def to_frame(cls, instances, columns=None):
+        """exports the instances into a DataFrame built column-wise,
+        see data_validation.export.to_frame
+
+        Returns:
+            pd.DataFrame: one row per instance holding its flattened dict
+        """
+        from data_validation.export import to_frame
+
+        return to_frame(instances, columns=columns)
+
+    @classmethod
+    def iter_rows(cls, instances, columns=None):
+        """lazily exports the instances as tuples, see data_validation.export.iter_rows
+
+        Returns:
+            Iterator[tuple]: values of the flattened dict of each instance
+        """
+        from data_validation.export import iter_rows
+
+        return iter_rows(instances, columns=columns)
+
+    def revalidate(self, dirty_only=False) -> None:
+        """runs the validation functions again against the current values of the fields they
+        refer to, see data_validation.validation.revalidate
+
+        Raises:
+            ValueError: if the Validation fails
+        """
+        from data_validation.validation import revalidate
+
+        revalidate(self, dirty_only=dirty_only)
+
+    def deferred_revalidation(self):
+        """context manager deferring the validation against other fields until the block is
+        left, see data_validation.validation.deferred_revalidation"""
+        from data_validation.validation import deferred_revalidation
+
+        return deferred_revalidation(self)
+
     # to ensure the compatibility with dataclasses as subclasses
     def __post_init__(self) -> None:
-        logger = logging.getLogger(self.__class__.__name__)
-        self.logger = init_console_logger(logger=logger)
+        pass
+
+    @property
+    def logger(self) -> logging.Logger:
+        """logger of the class, it is set up on first access and shared by all instances"""
+        return get_logger(self.__class__.__name__)
 
     def __init__(self) -> None:
         self.__post_init__()
         super().__init__()
 
     def __iter__(self):
-        return iter(self.as_flattened_dict())
+        """iterates the keys of as_flattened_dict without building it, see ExportPlan.keys"""
+        return iter(get_export_plan(type(self)).keys(self))
 
     def __getitem__(self, item):
-        return list(self)[item]
+        """key of as_flattened_dict at a position or the value of a key of it, both looked up
+        in the key index cached per combination of stored fields"""
+        plan = get_export_plan(type(self))
+        if isinstance(item, str):
+            return plan.value(self, item)
+        return plan.keys(self)[item]
+
+    def iter_flattened(self) -> Iterator[Tuple[str, Any]]:
+        """lazily yields the items of as_flattened_dict without building the dict"""
+        return get_export_plan(type(self)).items(self)
+
+    def _stored_items(self):
+        """name and value of each field set on the instance, like self.__dict__.items() but
+        for slotted classes as well"""
+        try:
+            return self.__dict__.items()
+        except AttributeError:
+            pass
+        items = []
+        for name, slot in type(self).__slot_fields__.items():
+            try:
+                items.append((name, getattr(self, slot)))
+            except AttributeError:
+                # unset fields, e.g. ones resolving to their default
+                pass
+        return items
 
     def as_flattened_dict(self) -> dict:
         """Converts the a composite class into a flattened dict where key values
         for Leaf classes are prefixed with it's name."""
-        output_dict = {}
-        for key, value in self.__dict__.items():
-            if type(value) in [int, float, str, bool] or value is None:
-                output_dict[key] = value
-            elif isinstance(value, pl.Path):
-                output_dict[key] = str(value)
-            elif isinstance(value, dict):
-                sub_dict = {
-                    f"{key}_{value}": sub_value for value, sub_value in value.items()
-                }
-                output_dict.update(sub_dict)
-            elif issubclass(type(value), Container):
-                append_dict = {
-                    f"{value.__class__.__name__}_{k}": v
-                    for k, v in value.__dict__.items()
-                }
-                append_dict.pop(f"{value.__class__.__name__}_logger")
-                output_dict.update(append_dict)
-            elif isinstance(value, logging.Logger):
-                pass
-            elif isinstance(value, Sequence):
-                output_dict[key] = ",".join([str(v) for v in value])
-            else:
-                output_dict[key] = str(value)
-                self.logger.warn(
-                    f"Unsupported datastructure, for dict unpacking: {value}"
-                )
-
-        return output_dict
+        return get_export_plan(type(self)).flattened(self)
 
     def as_dict(self) -> dict:
         """get nested dict representation of a composite class resolving Enum types to their
         respective Str representation"""
-        output_dict = {}
-        for key, value in self.__dict__.items():
-            if key in self.META_PARAMS:
-                continue
-            if type(value) in [int, float, str, list] or value is None:
-                output_dict[key] = value
-            elif isinstance(value, dict):
-                output_dict.update({key: value})
-            elif issubclass(type(value), Container):
-                output_dict.update({key: value.as_dict()})
-            elif isinstance(value, Enum):
-                output_dict[key] = value.value
-            else:
-                output_dict[key] = str(value)
-
-        return output_dict
+        return get_export_plan(type(self)).nested(self)
 
     def dataclass_dict_repr(self) -> dict:
-        # detach, and reattach logger to exclude it from the dict representation
-        temp_logger = self.logger
-        del self.logger
-        dict_repr = dataclasses.asdict(self)
-        self.logger = temp_logger
-        return dict_repr
+        # the logger is shared on class level, so it is not part of the dict representation
+        return dataclasses.asdict(self, dict_factory=_export_array_factory)
@@ -0,0 +1,159 @@
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List
+
+from data_validation.defaults import DATEFORMAT
+
+DateTimeParser = Callable[[str], datetime]
+
+# patterns of the numeric directives as used by datetime.strptime
+_DIRECTIVE_PATTERNS = {
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "y": r"(?P<y>\d\d)",
+    "Y": r"(?P<Y>\d\d\d\d)",
+}
+
+# formats which datetime.fromisoformat reads given the string has the zero-padded length
+_ISO_FORMATS = {
+    "%Y-%m-%d": 10,
+    "%Y-%m-%dT%H:%M": 16,
+    "%Y-%m-%d %H:%M": 16,
+    "%Y-%m-%dT%H:%M:%S": 19,
+    "%Y-%m-%d %H:%M:%S": 19,
+}
+
+
+def _format_error(inp: str, dateformat: str) -> ValueError:
+    return ValueError(f"time data {inp!r} does not match format {dateformat!r}")
+
+
+def _compile_regex(dateformat: str) -> re.Pattern:
+    """translates a format into a regex the same way datetime.strptime does, returns None if
+    the format contains directives which are locale dependent or otherwise not supported"""
+    pattern = []
+    seen = set()
+    # split into literals at even and directives at odd positions
+    for i, part in enumerate(re.split(r"%(.)", dateformat)):
+        if i % 2 == 0:
+            if "%" in part:
+                # stray % at the end of the format
+                return None
+            # like strptime any run of whitespace matches one or more whitespace characters
+            pattern.append(r"\s+".join(re.escape(literal) for literal in re.split(r"\s+", part)))
+        elif part == "%":
+            pattern.append("%")
+        elif part in _DIRECTIVE_PATTERNS and part not in seen:
+            seen.add(part)
+            pattern.append(_DIRECTIVE_PATTERNS[part])
+        else:
+            return None
+    return re.compile("".join(pattern), re.IGNORECASE)
+
+
+def _regex_parser(dateformat: str, regex: re.Pattern) -> DateTimeParser:
+    def parse(inp: str) -> datetime:
+        found = regex.match(inp)
+        if found is None:
+            raise _format_error(inp, dateformat)
+        if found.end() != len(inp):
+            raise ValueError(f"unconverted data remains: {inp[found.end():]}")
+        groups = found.groupdict()
+        if "Y" in groups:
+            year = int(groups["Y"])
+        elif "y" in groups:
+            year = int(groups["y"])
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+        return datetime(
+            year,
+            int(groups.get("m", 1)),
+            int(groups.get("d", 1)),
+            int(groups.get("H", 0)),
+            int(groups.get("M", 0)),
+            int(groups.get("S", 0)),
+            int(groups["f"].ljust(6, "0")) if "f" in groups else 0,
+        )
+
+    return parse
+
+
+def _iso_parser(dateformat: str, length: int, fallback: DateTimeParser) -> DateTimeParser:
+    # positions of the separators within the zero-padded string
+    separators = [(4, "-"), (7, "-")]
+    if length > 10:
+        separators += [(10, dateformat[8]), (13, ":")]
+    if length > 16:
+        separators.append((16, ":"))
+
+    def parse(inp: str) -> datetime:
+        # only fully zero-padded strings are unambiguous, the rest takes the regular path
+        if len(inp) == length and all(inp[i] == char for i, char in separators):
+            try:
+                return datetime.fromisoformat(inp)
+            except ValueError:
+                pass
+        return fallback(inp)
+
+    return parse
+
+
+@lru_cache(maxsize=64)
+def get_datetime_parser(dateformat: str = DATEFORMAT) -> DateTimeParser:
+    """returns a parser equivalent to datetime.strptime with the given format, the parser is
+    built once per format
+
+    ISO formats use datetime.fromisoformat, formats made of numeric directives (%Y, %y, %m,
+    %d, %H, %M, %S, %f) use a precompiled regex, all others fall back to datetime.strptime
+
+    Args:
+        dateformat (str, optional): format as accepted by datetime.strptime.
+            Defaults to DATEFORMAT.
+
+    Returns:
+        DateTimeParser: callable which raises a ValueError if the string doesn't match
+    """
+    regex = _compile_regex(dateformat)
+    if regex is None:
+        return lambda inp: datetime.strptime(inp, dateformat)
+    parser = _regex_parser(dateformat, regex)
+    if dateformat in _ISO_FORMATS:
+        parser = _iso_parser(dateformat, _ISO_FORMATS[dateformat], parser)
+    return parser
+
+
+def parse_datetime(inp: str, dateformat: str = None) -> datetime:
+    """parses a single string, see get_datetime_parser"""
+    return get_datetime_parser(DATEFORMAT if dateformat is None else dateformat)(inp)
+
+
+def parse_datetimes(values: Iterable[str], dateformat: str = None) -> List[datetime]:
+    """parses a batch of strings with the same format, repeated strings are only parsed once
+
+    Args:
+        values (Iterable[str]): strings to parse
+        dateformat (str, optional): format as accepted by datetime.strptime.
+            Defaults to DATEFORMAT.
+
+    Raises:
+        ValueError: for the first string which doesn't match the format
+
+    Returns:
+        List[datetime]: parsed values in input order
+    """
+    parser = get_datetime_parser(DATEFORMAT if dateformat is None else dateformat)
+    parsed: Dict[str, datetime] = {}
+    output = []
+    for value in values:
+        try:
+            output.append(parsed[value])
+        except KeyError:
+            parsed[value] = parser(value)
+            output.append(parsed[value])
+    return output
@@ -41,3 +41,48 @@ def apply_casting(func: Callable) -> Callable:
                                           output_type=output_type,
                                           message=e)
     return wrapper
+
+
+def prepare_arguments(**preparers: Callable) -> Callable:
+    """marks keyword arguments of a validation function which are converted once when a
+    FunctionWrapper of the function is created instead of on every call, e.g. compiling a
+    regex or turning an allow-list into a frozenset
+
+    The function has to accept the unprepared arguments as well, since positional arguments
+    and values of referenced fields are passed as they are
+
+    Args:
+        **preparers (Callable): conversion per keyword, called with the passed argument
+
+    Returns:
+        Callable: decorator which returns the function itself
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.argument_preparers = preparers
+        return func
+
+    return decorator
+
+
+def batch_implementation(batch_func: Callable) -> Callable:
+    """declares a vectorized implementation of a validation function, which Validators with
+    Scope.ITEM call with the whole Sequence at once instead of calling the function per item
+
+    The batch function receives the same arguments as the function with the Sequence in place
+    of the value, i.e. under the same parameter name as it may be passed by keyword, and returns
+    the indices of the failing items, the function itself is only called for the first failing
+    item to raise its error
+
+    Args:
+        batch_func (Callable): vectorized implementation
+
+    Returns:
+        Callable: decorator which returns the function itself
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.batch_func = batch_func
+        return func
+
+    return decorator
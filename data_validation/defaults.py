@@ -1 +1 @@
-DATEFORMAT = '%Y-%m-%d'
\ No newline at end of file
+DATEFORMAT = '%Y-%m-%d'
@@ -0,0 +1,82 @@
+from typing import Any, Mapping
+
+from data_validation.report import FieldError, Stage, ValidationReport
+from data_validation.validation import State, Validator, _is_missing, get_field_plan
+
+
+class _DryRunInstance:
+    """stands in for the instance while checking a mapping, field references resolve to
+    the values checked so far, fields which are not set resolve to their default like on a
+    fresh instance and fields which failed to State.NOT_SET, so the fields referring to
+    them are not validated"""
+
+    def __init__(self, owner: type) -> None:
+        self._owner = owner
+        self._failed = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._failed:
+            return State.NOT_SET
+        attr = getattr(self._owner, name)
+        if isinstance(attr, Validator):
+            return attr._default
+        return attr
+
+
+def check(cls: type, mapping: Mapping[str, Any]) -> ValidationReport:
+    """runs the cast, cleaning and validation step of every field against a mapping of
+    keyword arguments without instantiating the class, only fields annotated with a nested
+    class are casted by instantiating that one
+
+    Args:
+        cls (type): class using Validator descriptors e.g. a Container
+        mapping (Mapping[str, Any]): keyword arguments the class would be called with
+
+    Returns:
+        ValidationReport: errors of all fields, the instance is always None
+    """
+    plan = get_field_plan(cls)
+    report = ValidationReport()
+    for key in mapping:
+        if key not in plan.annotations:
+            report.errors.append(
+                FieldError.from_exception(
+                    None,
+                    mapping[key],
+                    Stage.INIT,
+                    TypeError(f"{cls.__name__}() got an unexpected keyword argument '{key}'"),
+                )
+            )
+
+    instance = _DryRunInstance(cls)
+    for name, value in mapping.items():
+        if name in plan.annotations and name not in plan.fields:
+            setattr(instance, name, value)
+
+    # referenced fields are checked before the fields referring to them
+    for name in plan.construction_order:
+        field = plan.fields[name]
+        validator = field.validator
+        if name not in mapping:
+            if validator._default == State.NOT_SET:
+                instance._failed.add(name)
+                report.errors.append(
+                    FieldError.from_exception(
+                        name, None, Stage.DEFAULT, validator._missing_argument_error(cls.__name__)
+                    )
+                )
+            continue
+        value = mapping[name]
+        if _is_missing(value):
+            try:
+                validator._handle_None()
+            except ValueError as e:
+                instance._failed.add(name)
+                report.errors.append(FieldError.from_exception(name, value, Stage.DEFAULT, e))
+            continue
+        value = validator._check(instance, field, value, report)
+        if value is State.NOT_SET:
+            instance._failed.add(name)
+        else:
+            setattr(instance, name, value)
+    return report
@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+import pandas as pd
+
+from data_validation.data_parsing import get_export_plan
+
+
+def _flattened_records(instances: Iterable) -> Iterator[dict]:
+    plans = {}
+    for instance in instances:
+        instance_type = type(instance)
+        plan = plans.get(instance_type)
+        if plan is None:
+            plan = plans[instance_type] = get_export_plan(instance_type)
+        yield plan.flattened(instance)
+
+
+def to_records(instances: Iterable, flat: bool = True) -> List[dict]:
+    """exports each instance as a dict
+
+    Args:
+        instances (Iterable): Containers of any class
+        flat (bool, optional): if True like Container.as_flattened_dict, else like
+            Container.as_dict. Defaults to True.
+
+    Returns:
+        List[dict]: one dict per instance in input order
+    """
+    if flat:
+        return list(_flattened_records(instances))
+    return [get_export_plan(type(instance)).nested(instance) for instance in instances]
+
+
+def iter_rows(instances: Iterable, columns: Sequence[str] = None) -> Iterator[tuple]:
+    """lazily exports each instance as a tuple of the values of its flattened dict
+
+    Args:
+        instances (Iterable): Containers of any class
+        columns (Sequence[str], optional): keys of the flattened dicts in order of the tuple
+            items, keys an instance doesn't have are None. Defaults to the keys of the first
+            instance.
+
+    Yields:
+        tuple: one row per instance in input order
+    """
+    for record in _flattened_records(instances):
+        if columns is None:
+            columns = tuple(record)
+        yield tuple(map(record.get, columns))
+
+
+def to_frame(instances: Iterable, columns: Sequence[str] = None) -> pd.DataFrame:
+    """exports the instances into a DataFrame with one row per instance, which is built
+    column-wise from their flattened dicts instead of from a list of records
+
+    Args:
+        instances (Iterable): Containers of any class
+        columns (Sequence[str], optional): columns to export. Defaults to all keys of the
+            flattened dicts in order of their first occurrence.
+
+    Returns:
+        pd.DataFrame: like pd.DataFrame([instance.as_flattened_dict() ...])
+    """
+    if columns is not None:
+        rows = list(iter_rows(instances, columns))
+        return pd.DataFrame.from_records(rows, columns=list(columns))
+
+    values: Dict[str, list] = {}
+    count = 0
+    for record in _flattened_records(instances):
+        for key, value in record.items():
+            column = values.get(key)
+            if column is None:
+                # keys missing from the previous records
+                column = values[key] = [None] * count
+            column.append(value)
+        count += 1
+        if len(record) != len(values):
+            for column in values.values():
+                if len(column) < count:
+                    column.append(None)
+    return pd.DataFrame(values)
@@ -0,0 +1,249 @@
+import os
+import pathlib as pl
+import re
+import stat
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, auto
+from fnmatch import translate
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+PathLike = Union[str, os.PathLike]
+
+
+class PathKind(Enum):
+    FILE = auto()
+    DIR = auto()
+    OTHER = auto()
+    """exists but is neither a regular file nor a directory, e.g. a socket"""
+    MISSING = auto()
+
+
+def _kind_of_mode(mode: int) -> PathKind:
+    if stat.S_ISREG(mode):
+        return PathKind.FILE
+    if stat.S_ISDIR(mode):
+        return PathKind.DIR
+    return PathKind.OTHER
+
+
+def _stat_kind(path: str) -> PathKind:
+    """kind of the path with a single stat call, symlinks are followed"""
+    try:
+        return _kind_of_mode(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return PathKind.MISSING
+    except (OSError, ValueError):
+        # e.g. too long names or null bytes, which pathlib reports as not existing
+        return PathKind.MISSING
+
+
+def _entry_kind(entry: os.DirEntry) -> PathKind:
+    # DirEntry caches the type from the directory listing, no extra syscall on most systems
+    try:
+        if entry.is_file():
+            return PathKind.FILE
+        if entry.is_dir():
+            return PathKind.DIR
+    except OSError:
+        return PathKind.MISSING
+    return PathKind.OTHER
+
+
+class DirectoryIndex:
+    """
+    recursive listing of a folder built by a single walk, answers the patterns of
+    pl.Path.rglob without touching the filesystem again
+
+    Attributes:
+        folder (pl.Path): indexed folder
+        entries (List[Tuple[Tuple[str, ...], PathKind]]): path parts relative to the folder and \
+            kind of every file and directory below it
+    """
+
+    def __init__(self, folder: PathLike) -> None:
+        self.folder = pl.Path(folder)
+        self.entries: List[Tuple[Tuple[str, ...], PathKind]] = []
+        self._matches: Dict[str, List[pl.Path]] = {}
+        self._walk(os.fspath(self.folder), ())
+        self._names = [os.path.normcase(parts[-1]) for parts, _ in self.entries]
+
+    def _walk(self, directory: str, parts: Tuple[str, ...]) -> None:
+        try:
+            with os.scandir(directory) as listing:
+                children = [(entry, _entry_kind(entry)) for entry in listing]
+        except OSError:
+            return
+        for entry, kind in children:
+            entry_parts = parts + (entry.name,)
+            self.entries.append((entry_parts, kind))
+            # symlinked directories are listed but not followed to avoid cycles
+            if kind is PathKind.DIR and not entry.is_symlink():
+                self._walk(entry.path, entry_parts)
+
+    def rglob(self, pattern: str) -> List[pl.Path]:
+        """paths below the folder whose trailing parts match the pattern, like
+        pl.Path(folder).rglob(pattern), the result is computed once per pattern"""
+        matches = self._matches.get(pattern)
+        if matches is None:
+            matches = self._matches[pattern] = self._match(pattern)
+        return list(matches)
+
+    def _match(self, pattern: str) -> List[pl.Path]:
+        pattern_parts = tuple(part for part in pl.PurePath(pattern).parts if part != ".")
+        if "**" in pattern_parts:
+            return list(self.folder.rglob(pattern))
+        size = len(pattern_parts)
+        # compiled once per pattern instead of once per entry, case handling like fnmatch
+        *parent_matchers, name_matcher = [
+            re.compile(translate(os.path.normcase(part))).match for part in pattern_parts
+        ]
+        matches = []
+        for name, (parts, _) in zip(self._names, self.entries):
+            if (
+                name_matcher(name)
+                and len(parts) >= size
+                and all(
+                    match(os.path.normcase(part))
+                    for match, part in zip(parent_matchers, parts[-size:-1])
+                )
+            ):
+                matches.append(self.folder.joinpath(*parts))
+        return matches
+
+
+class StatCache:
+    """
+    caches the kind of paths for the duration of a run, see stat_cache
+
+    The first lookup of a path in a directory costs one stat call, once a second path of the
+    same directory is looked up the whole directory is listed by a single os.scandir pass,
+    so Sequences of paths in the same folder only need one syscall per folder. Paths missing
+    from a listing are checked by stat nonetheless, so case insensitive file systems are
+    handled correctly.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, PathKind] = {}
+        self._misses_per_parent: Dict[str, int] = {}
+        self._scanned: set = set()
+        self._indexes: Dict[str, DirectoryIndex] = {}
+
+    def kind(self, path: PathLike) -> PathKind:
+        key = os.path.normpath(os.fspath(path))
+        with self._lock:
+            kind = self._kinds.get(key)
+            if kind is not None:
+                return kind
+            parent = os.path.dirname(key) or os.curdir
+            misses = self._misses_per_parent.get(parent, 0) + 1
+            self._misses_per_parent[parent] = misses
+            scan = misses > 1 and parent not in self._scanned
+            if scan:
+                self._scanned.add(parent)
+        if scan:
+            self._scan(parent)
+            with self._lock:
+                kind = self._kinds.get(key)
+            if kind is not None:
+                return kind
+        kind = _stat_kind(key)
+        with self._lock:
+            self._kinds[key] = kind
+        return kind
+
+    def _scan(self, directory: str) -> None:
+        try:
+            with os.scandir(directory) as listing:
+                kinds = {
+                    os.path.normpath(os.path.join(directory, entry.name)): _entry_kind(entry)
+                    for entry in listing
+                }
+        except OSError:
+            return
+        with self._lock:
+            for key, kind in kinds.items():
+                self._kinds.setdefault(key, kind)
+
+    def rglob(self, folder: PathLike, pattern: str) -> List[pl.Path]:
+        """pl.Path(folder).rglob(pattern) answered from an index of the folder which is built
+        on the first call per folder"""
+        key = os.path.normpath(os.fspath(folder))
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is None:
+            index = DirectoryIndex(folder)
+            with self._lock:
+                index = self._indexes.setdefault(key, index)
+        return index.rglob(pattern)
+
+    def invalidate(self, path: PathLike = None) -> None:
+        """drops the cached information about a path and the indexes of the folders
+        containing it, or everything if no path is given
+
+        Args:
+            path (PathLike, optional): changed path. Defaults to None.
+        """
+        with self._lock:
+            if path is None:
+                self._kinds.clear()
+                self._misses_per_parent.clear()
+                self._scanned.clear()
+                self._indexes.clear()
+                return
+            key = os.path.normpath(os.fspath(path))
+            parent = os.path.dirname(key) or os.curdir
+            self._kinds.pop(key, None)
+            self._scanned.discard(parent)
+            self._misses_per_parent.pop(parent, None)
+            for folder in list(self._indexes):
+                if key == folder or key.startswith(folder.rstrip(os.sep) + os.sep):
+                    del self._indexes[folder]
+
+
+_ACTIVE_CACHE: ContextVar[Optional[StatCache]] = ContextVar("_ACTIVE_CACHE", default=None)
+
+
+@contextmanager
+def stat_cache(cache: StatCache = None) -> Iterator[StatCache]:
+    """activates a StatCache for the path validators and glob casts within the block, outside
+    of it every check queries the filesystem
+
+    Args:
+        cache (StatCache, optional): cache to use, e.g. to share it between runs.
+            Defaults to a new one.
+
+    Yields:
+        StatCache: the active cache, which can be invalidated if files change within the run
+    """
+    cache = StatCache() if cache is None else cache
+    token = _ACTIVE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_CACHE.reset(token)
+
+
+def path_kind(path: PathLike) -> PathKind:
+    """kind of the path, answered by the active StatCache if there is one"""
+    cache = _ACTIVE_CACHE.get()
+    if cache is None:
+        return _stat_kind(os.fspath(path))
+    return cache.kind(path)
+
+
+def rglob(folder: PathLike, pattern: str) -> List[pl.Path]:
+    """like pl.Path(folder).rglob(pattern), answered by the active StatCache if there is one"""
+    cache = _ACTIVE_CACHE.get()
+    if cache is None:
+        return list(pl.Path(folder).rglob(pattern))
+    return cache.rglob(folder, pattern)
+
+
+def invalidate(path: PathLike = None) -> None:
+    """invalidates the path in the active StatCache, see StatCache.invalidate"""
+    cache = _ACTIVE_CACHE.get()
+    if cache is not None:
+        cache.invalidate(path)
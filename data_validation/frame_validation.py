@@ -0,0 +1,286 @@
+import inspect
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from dateutil.tz import tzlocal
+
+from data_validation.data_casting_func import (
+    _cast_to_bool_from_int,
+    _cast_int_to_datetime,
+    _cast_float_to_int,
+    _cast_to_bool_from_str,
+    _cast_int_to_float,
+    _cast_str_to_datetime,
+)
+from data_validation.defaults import DATEFORMAT
+from data_validation.exceptions import CastException
+from data_validation.function_wrappers import ArgFunctionWrapper, FunctionWrapper
+from data_validation.validation import (
+    CastStep,
+    FieldPlan,
+    State,
+    Validator,
+    get_field_plan,
+)
+
+ColumnCast = Callable[..., Tuple[pd.Series, pd.Series]]
+"""vectorized counterpart of a casting function, receives the column and the keyword \
+arguments of the ArgFunctionWrapper and returns the casted column and a mask of the cells \
+which could not be casted"""
+
+_BOOL_LITERALS = {"true": True, "false": False}
+
+
+def _cast_column_to_bool_from_int(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    failed = ~column.isin([0, 1])
+    return column.astype(bool), failed
+
+
+def _cast_column_to_bool_from_str(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    casted = column.astype(object).str.lower().map(_BOOL_LITERALS)
+    return casted, casted.isna()
+
+
+def _cast_column_float_to_int(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    column = column.astype("float64")
+    integral = np.isfinite(column) & (column == np.floor(column))
+    return column.where(integral, 0).astype("int64"), ~integral
+
+
+def _cast_column_int_to_float(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    return column.astype("float64"), pd.Series(False, index=column.index)
+
+
+def _cast_column_str_to_datetime(
+    column: pd.Series, dateformat: str = None
+) -> Tuple[pd.Series, pd.Series]:
+    if dateformat is None:
+        dateformat = DATEFORMAT
+    casted = pd.to_datetime(column, format=dateformat, errors="coerce")
+    return casted, casted.isna()
+
+
+def _cast_column_int_to_datetime(column: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    # datetime.fromtimestamp returns the naive local time
+    casted = pd.to_datetime(column, unit="s", utc=True, errors="coerce")
+    casted = casted.dt.tz_convert(tzlocal()).dt.tz_localize(None)
+    return casted, casted.isna()
+
+
+COLUMN_CAST_MAPPING: Dict[Callable, ColumnCast] = {
+    _cast_to_bool_from_int: _cast_column_to_bool_from_int,
+    _cast_float_to_int: _cast_column_float_to_int,
+    _cast_int_to_datetime: _cast_column_int_to_datetime,
+    _cast_to_bool_from_str: _cast_column_to_bool_from_str,
+    _cast_int_to_float: _cast_column_int_to_float,
+    _cast_str_to_datetime: _cast_column_str_to_datetime,
+}
+"""vectorized casts keyed by the scalar casting function they replace, casting functions \
+without an entry are applied element-wise"""
+
+
+def register_column_cast(casting_fct: Callable, column_cast: ColumnCast) -> None:
+    """registers a vectorized counterpart for a scalar casting function, which is used by
+    validate_frame whenever an ArgFunctionWrapper of casting_fct is part of a type mapping
+
+    Args:
+        casting_fct (Callable): scalar casting function, as wrapped by ArgFunctionWrapper
+        column_cast (ColumnCast): vectorized casting function
+    """
+    COLUMN_CAST_MAPPING[casting_fct] = column_cast
+
+
+@lru_cache(maxsize=None)
+def _cast_parameters(column_cast: ColumnCast) -> frozenset:
+    """names of the arguments a column cast accepts besides the column"""
+    parameters = list(inspect.signature(column_cast).parameters)
+    return frozenset(parameters[1:])
+
+
+def _column_cast_kwargs(wrapper: ArgFunctionWrapper, column_cast: ColumnCast) -> Optional[dict]:
+    """the cast arguments of the wrapper passed on to the column cast, options of the wrapper
+    itself like the maxsize of a MemoizedArgFunctionWrapper are not part of its kwargs. None
+    if the column cast can't receive the arguments, i.e. positional ones, arguments resolved
+    at invocation or ones it doesn't declare, so the column is casted element-wise"""
+    if wrapper.init_args:
+        return None
+    accepted = _cast_parameters(column_cast)
+    for key, val in wrapper.kwargs.items():
+        if key not in accepted or isinstance(val, FunctionWrapper):
+            return None
+    return dict(wrapper.kwargs)
+
+
+def _source_type_groups(column: pd.Series):
+    """yields the python type of the cells with the corresponding sub-column, columns with a
+    numpy dtype form a single group"""
+    if pd.api.types.is_bool_dtype(column.dtype):
+        yield bool, column
+    elif pd.api.types.is_integer_dtype(column.dtype):
+        yield int, column
+    elif pd.api.types.is_float_dtype(column.dtype):
+        yield float, column
+    elif pd.api.types.is_datetime64_any_dtype(column.dtype):
+        yield datetime, column
+    else:
+        types = column.map(type)
+        for source_type in types.unique():
+            yield source_type, column[types == source_type]
+
+
+def _format_error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+_EMPTY_PROXY = SimpleNamespace()
+
+
+class _ColumnValidation:
+    """validates a single column of a DataFrame against the FieldPlan of its field, the frame
+    is expected to have a RangeIndex so labels and positions coincide"""
+
+    def __init__(self, field: FieldPlan, frame: pd.DataFrame, defaults: dict) -> None:
+        self.field = field
+        self.validator: Validator = field.validator
+        self.frame = frame
+        self.defaults = defaults
+        self.references_fields = any(
+            func is not None and func.references
+            for func in (field.cleaning_func, field.validator_func)
+        )
+        self.values = np.full(len(frame), None, dtype=object)
+        self.errors = np.full(len(frame), None, dtype=object)
+
+    def _proxy(self, position: int) -> SimpleNamespace:
+        """object to resolve field references of the functionWrappers against"""
+        if not self.references_fields:
+            return _EMPTY_PROXY
+        return SimpleNamespace(**{**self.defaults, **self.frame.iloc[position].to_dict()})
+
+    def _cast_element_wise(self, column: pd.Series) -> None:
+        for position, value in zip(column.index, column.to_numpy(dtype=object)):
+            try:
+                self.values[position] = self.validator._cast(
+                    self._proxy(position), self.field, value
+                )
+            except (ValueError, TypeError, NotImplementedError, CastException) as e:
+                self.errors[position] = _format_error(e)
+
+    def _cast_group(self, source_type: type, column: pd.Series) -> None:
+        step, payload = self.field.resolve_cast(source_type, False)
+        if step is CastStep.IDENTITY:
+            self.values[column.index] = column.to_numpy(dtype=object)
+            return
+        column_cast = kwargs = None
+        if (
+            step is CastStep.MAPPED
+            and payload.wrapper.func in COLUMN_CAST_MAPPING
+            and not payload.references
+        ):
+            column_cast = COLUMN_CAST_MAPPING[payload.wrapper.func]
+            kwargs = _column_cast_kwargs(payload.wrapper, column_cast)
+        if kwargs is not None:
+            casted, failed = column_cast(column, **kwargs)
+        elif (
+            step is CastStep.CONSTRUCT
+            and isinstance(payload[1], type)
+            and issubclass(payload[1], Enum)
+        ):
+            casted, failed = _lookup_enum_column(column, payload[1])
+        else:
+            self._cast_element_wise(column)
+            return
+        failed = failed.to_numpy(dtype=bool)
+        self.values[column.index[~failed]] = casted[~failed].to_numpy(dtype=object)
+        # rerun the failed cells through the scalar path to get the same errors
+        self._cast_element_wise(column[failed])
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        name = self.field.name
+        if name not in self.frame.columns:
+            if self.validator._default == State.NOT_SET:
+                self.errors[:] = _format_error(
+                    self.validator._missing_argument_error(self.field.owner.__name__)
+                )
+            else:
+                for position in range(len(self.values)):
+                    self.values[position] = self.validator._default
+            return self.values, self.errors
+
+        column = self.frame[name]
+        missing = column.isna().to_numpy()
+        if missing.any() and not self.validator._allow_none:
+            try:
+                self.validator._handle_None()
+            except ValueError as e:
+                self.errors[missing] = _format_error(e)
+        present = column[~missing]
+
+        if self.field.origin is not None:
+            self._cast_element_wise(present)
+        else:
+            for source_type, group in _source_type_groups(present):
+                self._cast_group(source_type, group)
+
+        if self.field.cleaning_func or self.field.validator_func:
+            for position, value in enumerate(self.values):
+                if value is None or self.errors[position] is not None:
+                    continue
+                try:
+                    self.values[position] = self.validator._clean_and_validate(
+                        self._proxy(position), self.field, value
+                    )
+                except (ValueError, TypeError, CastException) as e:
+                    self.errors[position] = _format_error(e)
+        return self.values, self.errors
+
+
+def _lookup_enum_column(
+    column: pd.Series, enum_type: type
+) -> Tuple[pd.Series, pd.Series]:
+    members = list(enum_type)
+    codes = pd.Index([m.value for m in members]).get_indexer(column)
+    lookup = np.empty(len(members) + 1, dtype=object)
+    lookup[: len(members)] = members
+    # code -1 marks values which are not an option of the Enum
+    casted = pd.Series(lookup[codes], index=column.index, dtype=object)
+    return casted, pd.Series(codes == -1, index=column.index)
+
+
+def validate_frame(cls: type, df: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+    """validates every row of a DataFrame against the fields of a validated class column by
+    column, without instantiating the class
+
+    Casts registered in COLUMN_CAST_MAPPING and Enum lookups are applied to the whole column
+    at once, all other casts as well as cleaning and validation functions are applied to each
+    cell. Columns without a corresponding field are ignored.
+
+    Args:
+        cls (type): class using Validator descriptors e.g. a Container
+        df (pd.DataFrame): one row per instance, one column per field
+
+    Returns:
+        Tuple[pd.Series, pd.DataFrame]: boolean mask of the valid rows and a frame with one
+            column per field holding the error message of each invalid cell or None
+    """
+    plan = get_field_plan(cls)
+    frame = df.reset_index(drop=True)
+    defaults = {
+        name: field.validator._default
+        for name, field in plan.fields.items()
+        if name not in frame.columns
+    }
+    errors = {}
+    for name in plan.construction_order:
+        values, errors[name] = _ColumnValidation(plan.fields[name], frame, defaults).run()
+        if name in frame.columns:
+            # fields referring to this one are validated against the casted values
+            frame[name] = pd.Series(values, index=frame.index, dtype=object)
+    error_frame = pd.DataFrame(errors, columns=list(plan.fields), dtype=object)
+    error_frame.index = df.index
+    return error_frame.isna().all(axis=1), error_frame
@@ -1,4 +1,44 @@
-from typing import Any, Callable
+import asyncio
+import threading
+from collections import OrderedDict
+from copy import copy, deepcopy
+from inspect import isawaitable, iscoroutinefunction
+from time import monotonic
+from typing import Any, Callable, NamedTuple, Sequence
+
+
+COLLECTION_ARGUMENT_TYPES = (list, tuple, set, frozenset)
+"""types of arguments whose items are checked for field references"""
+
+
+class FieldRef:
+    """
+    marks an argument of a FunctionWrapper as reference to a field of the instance the \
+        wrapper is applied to, the argument is replaced by the current value of the field \
+        at invocation
+
+       Args:
+        name (str): name of the referenced field or attribute of the class
+
+       Note:
+        for backwards compatibility plain strings which equal the name of an annotated field \
+        of the class are detected as references as well, other attributes, e.g. properties, \
+        are only referenced by a FieldRef
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"FieldRef({self.name!r})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FieldRef) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash((FieldRef, self.name))
 
 
 class FunctionWrapper:
@@ -15,43 +55,137 @@ class FunctionWrapper:
 
        Note:
         Any Arguments Stored can be of type Function_Mapper as well and will be invoked at \
-        Invocation of Master Function Mapper
+        Invocation of Master Function Mapper. Coroutine functions are supported by acall, \
+        calling such a wrapper directly returns the coroutine
 
        Returns:
         any value passed from the wrapped function
     """
 
     value_kw: str
-    args: list
+    init_args: tuple
     kwargs: dict
 
     def __init__(self, func: Callable, *args, **kwargs) -> None:
         self.func = func
         self.init_args = args
-        self.args = ()
-        self.kwargs = kwargs
+        self.kwargs = self._prepare_arguments(func, kwargs)
+
+    @staticmethod
+    def _prepare_arguments(func: Callable, kwargs: dict) -> dict:
+        """applies the preparers of the function to the keyword arguments once, arguments
+        which are only known at invocation, i.e. wrappers and FieldRefs, are left as they are,
+        see data_validation.decorators.prepare_arguments"""
+        preparers = getattr(func, "argument_preparers", None)
+        if not preparers:
+            return kwargs
+        return {
+            key: val
+            if key not in preparers or isinstance(val, (FunctionWrapper, FieldRef))
+            else preparers[key](val)
+            for key, val in kwargs.items()
+        }
 
     def __call__(self) -> Any:
         """
         invokes the enclosed functions with *args and **kwargs, \n
         resolves any Callables of each kind of Argument
         """
-        self.kwargs = {
-            k: self._resolve_ref_by_function(v) for k, v in self.kwargs.items()
-        }
-        self.args = [self._resolve_ref_by_function(item) for item in self.args]
-        return_value = self.func(*self.args, **self.kwargs)
-        self.args = ()
-        return return_value
+        return self._invoke(self.init_args, self.kwargs)
+
+    def _invoke(self, args: tuple, kwargs: dict, func: Callable = None) -> Any:
+        """calls the enclosed function or func instead, the arguments are resolved into new
+        containers so the wrapper itself is never altered and can be shared between threads"""
+        return (self.func if func is None else func)(
+            *[self._resolve_ref_by_function(item) for item in args],
+            **{k: self._resolve_ref_by_function(v) for k, v in kwargs.items()},
+        )
+
+    async def acall(self) -> Any:
+        """invokes the enclosed function like __call__ but awaits coroutine functions,
+        including the ones of wrappers passed as arguments which are resolved concurrently"""
+        return await self._ainvoke(self.init_args, self.kwargs)
+
+    async def _ainvoke(self, args: tuple, kwargs: dict) -> Any:
+        resolved = await asyncio.gather(
+            *(self._aresolve_ref_by_function(item) for item in (*args, *kwargs.values()))
+        )
+        result = self.func(
+            *resolved[: len(args)], **dict(zip(kwargs, resolved[len(args) :]))
+        )
+        if isawaitable(result):
+            result = await result
+        return result
+
+    @property
+    def is_async(self) -> bool:
+        """if the enclosed function or one of the wrappers passed as argument is a coroutine
+        function, i.e. if the wrapper has to be invoked by acall"""
+        return iscoroutinefunction(self.func) or any(
+            self._is_resolved_by_function(item) and item.is_async
+            for item in (*self.init_args, *self.kwargs.values())
+        )
+
+    def bind(self, **kwargs) -> "FunctionWrapper":
+        """returns a copy of the wrapper with the keyword arguments updated, the wrapper
+        itself is not altered
+
+        Returns:
+            FunctionWrapper: new wrapper of the same class
+        """
+        bound = copy(self)
+        bound.kwargs = {**self.kwargs, **kwargs}
+        return bound
+
+    def field_references(self, is_field: Callable[[str], bool]) -> dict:
+        """collects the keyword arguments which refer to fields, either by a FieldRef marker or
+        by a string for which is_field returns True, including references inside Sequences and
+        sets
+
+        Args:
+            is_field (Callable[[str], bool]): decides whether a plain string names a field
+
+        Returns:
+            dict: FieldRef per referencing keyword, for Sequences and sets a copy with the \
+                referencing items replaced by FieldRefs
+        """
+
+        def as_ref(item):
+            if isinstance(item, FieldRef):
+                return item
+            if isinstance(item, str) and is_field(item):
+                return FieldRef(item)
+            return None
+
+        references = {}
+        for key, val in self.kwargs.items():
+            if isinstance(val, COLLECTION_ARGUMENT_TYPES):
+                refs = [as_ref(v) for v in val]
+                if any(refs):
+                    references[key] = type(val)(
+                        v if ref is None else ref for v, ref in zip(val, refs)
+                    )
+            elif as_ref(val) is not None:
+                references[key] = as_ref(val)
+        return references
+
+    @staticmethod
+    def _is_resolved_by_function(item) -> bool:
+        return isinstance(item, FunctionWrapper) and not isinstance(item, ArgFunctionWrapper)
 
     def _resolve_ref_by_function(self, item):
         """
         checks if passed item is of self class and if so calls it's invoke Method
         """
-        if not isinstance(item, self.__class__.__base__):
+        if not self._is_resolved_by_function(item):
             return item
         return item()
 
+    async def _aresolve_ref_by_function(self, item):
+        if not self._is_resolved_by_function(item):
+            return item
+        return await item.acall()
+
 
 class ArgFunctionWrapper(FunctionWrapper):
     """
@@ -82,9 +216,272 @@ class ArgFunctionWrapper(FunctionWrapper):
     def __call__(self, value) -> Any:
         """invokes the enclosing function with the value provided at runtime, \n
         the value is incorporated into *arg or **kwargs before the\n
-        super-implementation is called"""
+        enclosed function is invoked"""
+        if self.value_kw is None:
+            return self._invoke((value,) + self.init_args, self.kwargs)
+        return self._invoke(self.init_args, {**self.kwargs, self.value_kw: value})
+
+    async def acall(self, value) -> Any:
+        """invokes the enclosing function with the value like __call__ but awaits coroutine
+        functions, see FunctionWrapper.acall"""
+        if self.value_kw is None:
+            return await self._ainvoke((value,) + self.init_args, self.kwargs)
+        return await self._ainvoke(self.init_args, {**self.kwargs, self.value_kw: value})
+
+    @property
+    def supports_batch(self) -> bool:
+        """if the enclosed function declares a batch implementation, see
+        data_validation.decorators.batch_implementation"""
+        return getattr(self.func, "batch_func", None) is not None
+
+    def failing_indices(self, values: Sequence) -> Sequence[int]:
+        """invokes the batch implementation of the enclosed function with all values at once
+
+        Args:
+            values (Sequence): items to validate
+
+        Returns:
+            Sequence[int]: indices of the items which fail
+        """
+        batch_func = self.func.batch_func
         if self.value_kw is None:
-            self.args = (value,) + tuple(self.init_args)
-        else:
-            self.kwargs[self.value_kw] = value
-        return super().__call__()
+            return self._invoke((values,) + self.init_args, self.kwargs, batch_func)
+        return self._invoke(
+            self.init_args, {**self.kwargs, self.value_kw: values}, batch_func
+        )
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """bounded, thread-safe least recently used cache, shared by a wrapper and its bound copies"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key) -> Any:
+        with self.lock:
+            try:
+                result = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result) -> None:
+        with self.lock:
+            self.entries[key] = result
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+_MISSING = object()
+MUTABLE_TYPES = (list, dict, set, bytearray)
+
+
+class MemoizedArgFunctionWrapper(ArgFunctionWrapper):
+    """
+    ArgFunctionWrapper which memoizes the results of a pure function in a bounded least \
+        recently used cache, meant for casting functions which see the same values repeatedly \
+        e.g. date strings or Enum labels
+
+       Args:
+        func (function): pure function, the result may only depend on the arguments
+        value_kw (str): Optional keyword of the value in the enclosing function
+        *args: any additional positional arguments
+        maxsize (int): maximum number of cached results, the least recently used is evicted
+        **kwargs: any additional keyword arguments
+
+       Note:
+        results of mutable types (list, dict, set) are never cached, neither are exceptions \
+        or unhashable values. If the return annotation of func is a mutable type,
+        e.g. List[str], the cache is disabled entirely
+
+       Returns:
+        any value passed from the wrapped function
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        value_kw: str = None,
+        *args,
+        maxsize: int = 1024,
+        **kwargs,
+    ) -> None:
+        super().__init__(func, value_kw, *args, **kwargs)
+        self._init_kwargs = self.kwargs
+        return_type = getattr(func, "__annotations__", {}).get("return")
+        return_type = getattr(return_type, "__origin__", return_type)
+        self.cache_enabled = not (
+            isinstance(return_type, type) and issubclass(return_type, MUTABLE_TYPES)
+        )
+        self._cache = _LRUCache(maxsize)
+
+    def __call__(self, value) -> Any:
+        if not self.cache_enabled:
+            return super().__call__(value)
+        key = (type(value), value)
+        if self.kwargs is not self._init_kwargs:
+            # bound copy with resolved field references
+            key += tuple(self.kwargs.items())
+        try:
+            result = self._cache.get(key)
+        except TypeError:
+            # unhashable value
+            return super().__call__(value)
+        if result is not _MISSING:
+            return result
+        result = super().__call__(value)
+        if not isinstance(result, MUTABLE_TYPES):
+            self._cache.put(key, result)
+        return result
+
+    def __deepcopy__(self, memo: dict) -> "MemoizedArgFunctionWrapper":
+        duplicate = copy(self)
+        duplicate.init_args = deepcopy(self.init_args, memo)
+        duplicate.kwargs = duplicate._init_kwargs = deepcopy(self.kwargs, memo)
+        duplicate._cache = _LRUCache(self._cache.maxsize)
+        return duplicate
+
+    def cache_info(self) -> CacheInfo:
+        """returns the hit, miss and eviction counts as well as the size of the cache"""
+        cache = self._cache
+        with cache.lock:
+            return CacheInfo(
+                cache.hits, cache.misses, cache.evictions, cache.maxsize, len(cache.entries)
+            )
+
+    def cache_clear(self) -> None:
+        """empties the cache and resets the statistics"""
+        self._cache.clear()
+
+
+class _TTLCache:
+    """single result of a CachedFunctionWrapper with its expiry, shared by the wrapper and its
+    copies"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # serializes the calls of the function so concurrent misses only call it once
+        self.load_lock = threading.Lock()
+        self.result = _MISSING
+        self.expires_at = 0.0
+        self.refreshing = False
+
+
+class CachedFunctionWrapper(FunctionWrapper):
+    """
+    FunctionWrapper which keeps the result of the enclosed function for ttl seconds, meant \
+        for arguments which are fetched from a database or service e.g. lookup tables, which \
+        would otherwise be fetched again for every validated value
+
+       Args:
+        func (function): function to call, coroutine functions are supported by acall
+        *args: any additional positional arguments
+        ttl (float): seconds after which the result expires
+        background_refresh (bool): if set, an expired result is still returned while the \
+            function is called again in a background thread, only the very first call waits \
+            for the function. Applies to __call__ only, acall always awaits an expired result
+        **kwargs: any additional keyword arguments
+
+       Note:
+        exceptions are never cached, a failed background refresh keeps the expired result \
+        until the next call
+
+       Returns:
+        any value passed from the wrapped function
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        *args,
+        ttl: float = 60.0,
+        background_refresh: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(func, *args, **kwargs)
+        self.ttl = ttl
+        self.background_refresh = background_refresh
+        self._cache = _TTLCache()
+
+    def __call__(self) -> Any:
+        cache = self._cache
+        with cache.lock:
+            result = cache.result
+            expired = monotonic() >= cache.expires_at
+            refresh = (
+                result is not _MISSING
+                and expired
+                and self.background_refresh
+                and not cache.refreshing
+            )
+            if refresh:
+                cache.refreshing = True
+        if refresh:
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        if result is not _MISSING and (not expired or self.background_refresh):
+            return result
+
+        with cache.load_lock:
+            # another thread may have loaded it in the meantime
+            with cache.lock:
+                if cache.result is not _MISSING and monotonic() < cache.expires_at:
+                    return cache.result
+            return self._store(super().__call__())
+
+    async def acall(self) -> Any:
+        cache = self._cache
+        with cache.lock:
+            if cache.result is not _MISSING and monotonic() < cache.expires_at:
+                return cache.result
+        return self._store(await super().acall())
+
+    def _refresh_in_background(self) -> None:
+        try:
+            with self._cache.load_lock:
+                self._store(super().__call__())
+        except Exception:
+            pass
+        finally:
+            with self._cache.lock:
+                self._cache.refreshing = False
+
+    def _store(self, result) -> Any:
+        with self._cache.lock:
+            self._cache.result = result
+            self._cache.expires_at = monotonic() + self.ttl
+        return result
+
+    def __deepcopy__(self, memo: dict) -> "CachedFunctionWrapper":
+        duplicate = copy(self)
+        duplicate.init_args = deepcopy(self.init_args, memo)
+        duplicate.kwargs = deepcopy(self.kwargs, memo)
+        duplicate._cache = _TTLCache()
+        return duplicate
+
+    def invalidate(self) -> None:
+        """drops the cached result, the next call invokes the function again"""
+        with self._cache.lock:
+            self._cache.result = _MISSING
+            self._cache.expires_at = 0.0
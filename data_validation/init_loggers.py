@@ -1,6 +1,7 @@
 import logging
 import pathlib as pl
-from typing import Union
+import threading
+from typing import Dict, Optional, Union
 
 
 class LoggingConfig():
@@ -9,6 +10,7 @@ class LoggingConfig():
     _LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s : %(message)s'
     _FILE_NAME = "log_file"
     _FILE_SUFFIX = ".txt"
+    _ENABLED = True
 
     def __init__(self) -> None:
         raise RuntimeError("This Class is not meant to be instantiated use rather it is to be "
@@ -19,6 +21,14 @@ class LoggingConfig():
         path = pl.Path(path)
         path.mkdir(parents=True, exist_ok=True)
         cls._LOG_DIRECTORY = path
+        # loggers set up before get the file handler on their next access
+        _CONFIGURED_LOGGERS.clear()
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """global switch for the logging of the Validators and Containers, if disabled the
+        messages are neither formatted nor passed to the logging module"""
+        cls._ENABLED = enabled
 
     @classmethod
     def set_dateformat(cls, format: str):
@@ -77,3 +87,30 @@ def init_console_logger(logger: logging.Logger, logLevel=logging.DEBUG) -> loggi
     log_console_handler.setFormatter(formatter)
     logger.addHandler(log_console_handler)
     return logger
+
+
+_CONFIGURED_LOGGERS: Dict[Optional[str], logging.Logger] = {}
+_LOGGER_LOCK = threading.Lock()
+
+
+def get_logger(name: str = None) -> logging.Logger:
+    """returns the logger of the given name, the handlers are only set up on the first access
+    per name, i.e. per class, instead of on every call
+
+    Args:
+        name (str, optional): name of the logger, the root logger additionally logs to the
+            file of LoggingConfig. Defaults to None, the root logger.
+
+    Returns:
+        logging.Logger: the configured logger
+    """
+    try:
+        return _CONFIGURED_LOGGERS[name]
+    except KeyError:
+        pass
+    with _LOGGER_LOCK:
+        logger = init_console_logger(logging.getLogger(name))
+        if name is None:
+            logger = init_file_logger(logger)
+        _CONFIGURED_LOGGERS[name] = logger
+    return logger
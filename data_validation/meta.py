@@ -1,14 +1,74 @@
 from abc import ABCMeta
+from typing import ClassVar, Dict
+
+
+def _is_class_var(annotation) -> bool:
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or getattr(annotation, "__origin__", None) is ClassVar
+
+
+def _slot_name(class_name: str, field: str, dct: dict) -> str:
+    """slot holding the value of a field, "_<field>" for fields managed by a descriptor e.g. a
+    Validator, the field name itself for fields without a class attribute"""
+    if field not in dct:
+        return field
+    if not hasattr(type(dct[field]), "__set__"):
+        raise TypeError(
+            f"field '{field}' of slotted class '{class_name}' has a plain default, "
+            + "use Validator(default=...) instead"
+        )
+    if field.startswith("_"):
+        raise TypeError(
+            f"field '{field}' of slotted class '{class_name}' starts with an underscore, "
+            + "which is not supported for slotted classes"
+        )
+    return f"_{field}"
 
 
 class ValidationMeta(ABCMeta):
-    def __new__(cls: type, name: str, bases: tuple, dct: dict):
-        # if "__annotations__" in dct:
-        #     parent_annotations = [b.__annotations__ for b in bases if '__annotations__' in b.__dict__]
-        #     dct["__annotations__"] = parent_annotations
+    """
+    metaclass of Container, classes created with the keyword slots=True keep their fields in
+    __slots__ instead of a per-instance __dict__, their subclasses are slotted as well.
+    Instances of classes with fields referring to fields declared after them are constructed
+    in the order of the references, see data_validation.validation.construct
+
+    Attributes of the created classes:
+        __slotted__ (bool): if the fields of the class are kept in slots
+        __slot_fields__ (Dict[str, str]): slot per field of slotted classes, including the \
+            fields of their parents
+    """
+
+    def __new__(mcls, name: str, bases: tuple, dct: dict, slots: bool = None, **kwargs):
+        if slots is None:
+            slots = any(getattr(base, "__slotted__", False) for base in bases)
+        dct["__slotted__"] = slots
+        if slots and "__slots__" not in dct:
+            slot_fields: Dict[str, str] = {}
+            for base in reversed(bases):
+                slot_fields.update(getattr(base, "__slot_fields__", {}))
+            own_slots = {
+                field: _slot_name(name, field, dct)
+                for field, annotation in dct.get("__annotations__", {}).items()
+                if field not in slot_fields and not _is_class_var(annotation)
+            }
+            dct["__slots__"] = tuple(own_slots.values())
+            dct["__slot_fields__"] = {**slot_fields, **own_slots}
+
+        return super().__new__(mcls, name, bases, dct, **kwargs)
+
+    def __init__(cls, name: str, bases: tuple, dct: dict, slots: bool = None, **kwargs):
+        super().__init__(name, bases, dct, **kwargs)
 
-        if "__slots__" not in dct and "__annotations__" in dct:
-            dct["__slots__"] = (f"_{name}" for name in dct["__annotations__"])
+    def __call__(cls, *args, **kwargs):
+        plan = cls.__dict__.get("__field_plan__")
+        if plan is None:
+            from data_validation.validation import get_field_plan
 
-        return super().__new__(cls, name, bases, dct)
+            plan = get_field_plan(cls)
+        # fields referring to fields declared after them are set once those are
+        if plan.reorders and not getattr(cls.__init__, "__ordered__", False):
+            from data_validation.validation import construct
 
+            return construct(cls, args, kwargs)
+        return super().__call__(*args, **kwargs)
@@ -0,0 +1,105 @@
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import Any, List, Optional
+
+from data_validation.batch import VALIDATION_ERRORS
+
+
+class Stage(Enum):
+    INIT = auto()
+    """the class itself could not be called, e.g. due to an unexpected keyword argument"""
+    DEFAULT = auto()
+    """the value is missing and there is no default or None is not allowed"""
+    CAST = auto()
+    """the value could not be casted to the annotated type"""
+    CLEAN = auto()
+    """the cleaning function failed"""
+    VALIDATE = auto()
+    """the validation function failed"""
+
+
+@dataclass
+class FieldError:
+    """describes why a single field could not be set
+
+    Attributes:
+        field (str): name of the field, None for errors of Stage.INIT
+        error_type (str): name of the raised exception
+        message (str): message of the raised exception
+        raw_value (Any): value as passed to the class, None if it was missing
+        stage (Stage): step of the field which failed
+    """
+
+    field: Optional[str]
+    error_type: str
+    message: str
+    raw_value: Any
+    stage: Stage
+
+    @classmethod
+    def from_exception(
+        cls, name: Optional[str], raw_value: Any, stage: Stage, e: Exception
+    ) -> "FieldError":
+        return cls(
+            field=name,
+            error_type=type(e).__name__,
+            message=str(e),
+            raw_value=raw_value,
+            stage=stage,
+        )
+
+
+@dataclass
+class ValidationReport:
+    """errors of all fields of a single validation run
+
+    Attributes:
+        errors (List[FieldError]): one entry per failed field in assignment order
+        instance (Any): the validated instance if there are no errors, else None
+    """
+
+    errors: List[FieldError] = field(default_factory=list)
+    instance: Any = None
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def __str__(self) -> str:
+        if self.valid:
+            return "Success"
+        return "Failed with Errors:\n" + "\n".join(
+            f"  {error.field} ({error.stage.name.lower()}) {error.error_type}: {error.message}"
+            for error in self.errors
+        )
+
+
+ACTIVE_REPORT: ContextVar[Optional[ValidationReport]] = ContextVar(
+    "ACTIVE_REPORT", default=None
+)
+"""report the Validators of the current context add their errors to instead of raising"""
+
+
+def collect_errors(cls: type, *args, **kwargs) -> ValidationReport:
+    """instantiates cls with every field being validated even if previous ones failed
+
+    Args:
+        cls (type): class using Validator descriptors e.g. a Container
+        *args, **kwargs: arguments of the class
+
+    Returns:
+        ValidationReport: errors of all fields and the instance if there are none
+    """
+    report = ValidationReport()
+    token = ACTIVE_REPORT.set(report)
+    try:
+        instance = cls(*args, **kwargs)
+    except VALIDATION_ERRORS as e:
+        report.errors.append(FieldError.from_exception(None, None, Stage.INIT, e))
+    else:
+        if report.valid:
+            report.instance = instance
+    finally:
+        ACTIVE_REPORT.reset(token)
+    return report
@@ -0,0 +1,87 @@
+import json
+import pathlib as pl
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Union
+
+import pandas as pd
+
+from data_validation.batch import RecordError, validate_record
+
+FORMAT_BY_SUFFIX = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+@contextmanager
+def _open_source(source: Union[str, pl.Path, IO]):
+    if isinstance(source, (str, pl.Path)):
+        with pl.Path(source).open("r", newline="") as file:
+            yield file
+    else:
+        yield source
+
+
+def _iter_jsonl(file: IO) -> Iterator[Any]:
+    """yields the parsed record of each non blank line or the exception if it is no valid json"""
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield e
+
+
+def _iter_csv(file: IO, chunksize: int, **read_csv_kwargs) -> Iterator[dict]:
+    with pd.read_csv(file, chunksize=chunksize, **read_csv_kwargs) as reader:
+        for chunk in reader:
+            yield from chunk.to_dict(orient="records")
+
+
+def iter_validate(
+    source: Union[str, pl.Path, IO],
+    cls: type,
+    format: str = None,
+    build: bool = True,
+    chunksize: int = 10_000,
+    **read_csv_kwargs,
+) -> Iterator[Any]:
+    """lazily reads the records of a JSON Lines or csv file and validates them one at a time,
+    at most one chunk of the file is held in memory
+
+    Args:
+        source (Union[str, pl.Path, IO]): path or opened text file
+        cls (type): validated class, each record is passed as keyword arguments
+        format (str, optional): either "jsonl" or "csv". Defaults to the format implied by
+            the suffix of the path.
+        build (bool, optional): if False None is yielded for valid records. Defaults to True.
+        chunksize (int, optional): number of csv rows parsed at once. Defaults to 10_000.
+        **read_csv_kwargs: passed on to pd.read_csv
+
+    Raises:
+        ValueError: if the format is unknown or can't be derived from the source
+
+    Yields:
+        the instance (None if build is False) or a RecordError for each record in file order
+    """
+    if format is None:
+        suffix = pl.Path(getattr(source, "name", str(source))).suffix.lower()
+        format = FORMAT_BY_SUFFIX.get(suffix)
+    if format not in ("jsonl", "csv"):
+        raise ValueError(
+            f"unsupported format <{format}>, expects 'jsonl' or 'csv' or a path ending on "
+            + f"one of {list(FORMAT_BY_SUFFIX)}"
+        )
+
+    with _open_source(source) as file:
+        if format == "jsonl":
+            records = _iter_jsonl(file)
+        else:
+            records = _iter_csv(file, chunksize, **read_csv_kwargs)
+        for index, record in enumerate(records):
+            if isinstance(record, Exception):
+                yield RecordError.from_exception(index, None, record)
+            elif not isinstance(record, dict):
+                yield RecordError.from_exception(
+                    index, record, TypeError(f"record <{record}> is not a json object")
+                )
+            else:
+                yield validate_record(cls, index, record, build)
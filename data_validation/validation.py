@@ -1,18 +1,37 @@
 from __future__ import annotations
+import asyncio
 import logging
+import threading
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from inspect import isawaitable
 from types import MappingProxyType
 
 
-from data_validation.data_parsing import Container
+from data_validation.data_parsing import ARRAY_TYPES, Container
 from data_validation.exceptions import CastException
-from data_validation.function_wrappers import ArgFunctionWrapper, FunctionWrapper
+from data_validation.function_wrappers import (
+    COLLECTION_ARGUMENT_TYPES,
+    ArgFunctionWrapper,
+    CacheInfo,
+    FieldRef,
+    FunctionWrapper,
+    MemoizedArgFunctionWrapper,
+)
 import data_validation.init_loggers as log_util
+from data_validation.batch import VALIDATION_ERRORS
+from data_validation.report import ACTIVE_REPORT, FieldError, Stage, ValidationReport
 from datetime import datetime
 from copy import deepcopy
+from inspect import isabstract
 from collections.abc import Callable
-from typing import Any, Generic, Sequence
+from typing import Any, Generic, Sequence, Union
 from enum import Enum, auto
-from typing import Dict, Tuple, TypeVar
+from numbers import Integral, Real
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
 
 from data_validation.data_casting_func import (
     _cast_to_bool_from_int,
@@ -21,6 +40,7 @@ from data_validation.data_casting_func import (
     _cast_to_bool_from_str,
     _cast_int_to_float,
     _cast_str_to_datetime,
+    _cast_str_list_to_datetime,
 )
 
 
@@ -32,6 +52,23 @@ class Scope(Enum):
     """checks a certain property on the enclosing Iterable, i.e. length of the list > 5"""
 
 
+class Storage(Enum):
+    LIST = "list"
+    """the casted items are kept in the container of the annotation, e.g. a list"""
+    ARRAY = "array"
+    """the items of a List[int] or List[float] field are kept in a numpy.ndarray of int64
+    or float64, note that instances holding arrays can't be compared by =="""
+    PYARRAY = "pyarray"
+    """the items of a List[int] or List[float] field are kept in an array.array of the
+    typecode q or d"""
+
+
+# typecode, dtype, kinds of numpy arrays and item types which are stored without casting
+STORAGE_TYPES: Dict[type, Tuple[str, type, str, Tuple[type, ...]]] = {
+    int: ("q", np.int64, "iu", (int,)),
+    float: ("d", np.float64, "iuf", (float, int)),
+}
+
 DEFAULT_TYPE_MAPPING: MappingProxyType[Tuple[type], ArgFunctionWrapper] = {
     (int, bool): ArgFunctionWrapper(_cast_to_bool_from_int),
     (float, int): ArgFunctionWrapper(_cast_float_to_int),
@@ -42,11 +79,80 @@ DEFAULT_TYPE_MAPPING: MappingProxyType[Tuple[type], ArgFunctionWrapper] = {
 }
 
 
+BATCH_CAST_MAPPING: Dict[Callable, Callable] = {
+    _cast_str_to_datetime: _cast_str_list_to_datetime,
+}
+"""casting functions which cast a whole Sequence at once, keyed by the casting function for a
+single item they replace"""
+
+
+def register_batch_cast(casting_fct: Callable, batch_fct: Callable) -> None:
+    """registers a counterpart for a casting function which is used whenever the items of a
+    Sequence are casted with casting_fct, the counterpart receives the Sequence together with
+    the arguments of the ArgFunctionWrapper and returns a list
+
+    Args:
+        casting_fct (Callable): casting function of a single item
+        batch_fct (Callable): casting function of a Sequence
+    """
+    BATCH_CAST_MAPPING[casting_fct] = batch_fct
+
+
 class State(Enum):
     SET = auto()
     NOT_SET = auto()
 
 
+PRIMITIVE_TYPES = (str, int, float, bool)
+
+NUMERIC_ABCS = ((Integral, int), (Real, float))
+"""numbers ABCs with the builtin type their virtual subclasses are treated as, e.g. \
+numpy.int64 as int and numpy.float32 as float"""
+
+COERCED_TYPES = (Real, np.bool_)
+"""source types which are converted to the exact destination type they are treated as, \
+numpy.bool_ is no number but treated as bool"""
+
+
+def _is_missing(value) -> bool:
+    """None and NaN, i.e. empty cells of a DataFrame, mark a missing value"""
+    return value is None or (isinstance(value, Real) and value != value)
+
+
+def _source_bases(source_type: type) -> List[type]:
+    """types a value of source_type can be casted as if there is no entry for source_type
+    itself, in order of precedence: the MRO followed by the builtin counterpart of the
+    numbers ABCs"""
+    if source_type is None or source_type is bool:
+        # bool is an int only by implementation, casting it as such hides type errors
+        return []
+    if issubclass(source_type, np.bool_):
+        return [bool]
+    bases = [base for base in source_type.__mro__[1:] if base is not object]
+    for abc, builtin_type in NUMERIC_ABCS:
+        if issubclass(source_type, abc):
+            if builtin_type not in bases:
+                bases.append(builtin_type)
+            break
+    return bases
+
+
+class CastStep(Enum):
+    IDENTITY = auto()
+    """source and destination type match, the value is passed through unchanged"""
+    MAPPED = auto()
+    """a casting function is registered in the TYPE_MAPPING of the type handler"""
+    COERCE = auto()
+    """the source type is a numeric subclass of the destination type, e.g. numpy.int64 of \
+    int, the value is converted to the exact destination type"""
+    CONSTRUCT = auto()
+    """the destination type is called with the value, i.e. Enums or nested Containers"""
+    MISMATCH = auto()
+    """primitive types don't match, which is treated as a "real" TypeError"""
+    MISSING = auto()
+    """no casting function is registered and the destination type is not callable"""
+
+
 class DefaultTypeHandler:
     """
     provides a standardized way to handle type casting the default \n
@@ -102,28 +208,457 @@ class DefaultTypeHandler:
                 source_type is None and dest_type is None and casting_fct is None
             ), "either no args or all args need be passed"
 
+    def cache_info(self) -> Dict[Tuple[type], CacheInfo]:
+        """collects the cache statistics of all memoized casting functions
+
+        Returns:
+            Dict[Tuple[type], CacheInfo]: CacheInfo per type tuple whose casting function is a
+                MemoizedArgFunctionWrapper
+        """
+        return {
+            type_tuple: casting_fct.cache_info()
+            for type_tuple, casting_fct in self.TYPE_MAPPING.items()
+            if isinstance(casting_fct, MemoizedArgFunctionWrapper)
+        }
+
 
 ValidatedClass = TypeVar("ValidatedClass")
 
 
-class Validator(Generic[ValidatedClass]):
+class FieldFunction:
     """
-    This Descriptor class manages the general UseCase of Type Checking and Data validation
-    
+    FunctionWrapper bound to a field of a class, the arguments referring to other fields are
+    detected once at binding, so invoking it only needs to read the referenced attributes
+
     Attributes:
-        annotated_type (type): type hint from assigned field\n
-        value_type (type): type of the passed value
-        sub_value_type (type): type of the items of a Sequence type (e.g. list, tuple, set)
-        sub_annotated_type (type): type of the type hints of the items of a Sequence e.g. List[str]
+        wrapper (FunctionWrapper): the bound wrapper
+        references (dict): FieldRef per referencing keyword, see FunctionWrapper.field_references
+        is_async (bool): if the wrapper has to be invoked by acall, see FunctionWrapper.is_async
+    """
+
+    __slots__ = ("wrapper", "references", "is_async")
+
+    def __init__(
+        self,
+        wrapper: FunctionWrapper,
+        is_field: Callable[[str], bool],
+        is_attribute: Callable[[str], bool],
+    ) -> None:
+        self.wrapper = wrapper
+        self.references = wrapper.field_references(is_field)
+        self.is_async = wrapper.is_async
+        for ref in self.references.values():
+            for item in ref if isinstance(ref, COLLECTION_ARGUMENT_TYPES) else [ref]:
+                if isinstance(item, FieldRef) and not is_attribute(item.name):
+                    raise AttributeError(
+                        f"{item} of {wrapper.func.__name__} does not refer to a field"
+                    )
+
+    def referenced_fields(self) -> List[str]:
+        """names of the fields the wrapper refers to"""
+        names = []
+        for ref in self.references.values():
+            for item in ref if isinstance(ref, COLLECTION_ARGUMENT_TYPES) else [ref]:
+                if isinstance(item, FieldRef):
+                    names.append(item.name)
+        return names
+
+    def resolve(self, instance) -> FunctionWrapper:
+        """returns the wrapper with the references replaced by the values of the instance
+
+        Args:
+            instance: instance or proxy object to read the referenced fields from
+
+        Returns:
+            FunctionWrapper: the wrapper itself if there are no references, else a bound copy
+        """
+        if not self.references:
+            return self.wrapper
+        kwargs = {}
+        for key, ref in self.references.items():
+            if isinstance(ref, FieldRef):
+                kwargs[key] = getattr(instance, ref.name)
+            else:
+                kwargs[key] = type(ref)(
+                    getattr(instance, item.name) if isinstance(item, FieldRef) else item
+                    for item in ref
+                )
+        return self.wrapper.bind(**kwargs)
+
+
+class FieldPlan:
+    """
+    compiled representation of a single validated field, everything which only depends on
+    the class definition is resolved once per class instead of on every assignment
+
+    Attributes:
+        owner (type): class the field plan was compiled for
+        name (str): name of the field
+        validator (Validator): descriptor managing the field
+        annotated_type (type): type hint of the field
+        origin (type): generic origin of the type hint e.g. list for List[str], else None
+        sub_annotated_type (type): type hint of the items of a generic e.g. str for List[str]
+        sequence_type (type): container the casted items of a Sequence are returned in, the
+            origin if it can be instantiated e.g. list for List[str], else list
+        is_container (bool): if the annotated type is a subclass of Container
+        type_mapping (MappingProxyType): TYPE_MAPPING of the type handler of the validator
+        cleaning_func (FieldFunction): bound cleaning function of the validator or None
+        validator_func (FieldFunction): bound validation function of the validator or None
+        is_async (bool): if any function of the field is a coroutine function, such fields
+            can only be set by Container.acreate
+        storage (Storage): how the items of a Sequence are kept, see Validator
+        dependencies (Tuple[str, ...]): fields the validation function refers to
+        dependents (Tuple[str, ...]): fields whose validation function refers to this one,
+            they are validated again once it is assigned
+        waits_for (Tuple[str, ...]): referenced fields declared after this one, during the
+            construction this one is only set once they are
+        releases (Tuple[str, ...]): fields waiting for this one during the construction
+    """
+
+    __slots__ = (
+        "owner",
+        "name",
+        "validator",
+        "annotated_type",
+        "origin",
+        "sub_annotated_type",
+        "sequence_type",
+        "is_container",
+        "type_mapping",
+        "cleaning_func",
+        "validator_func",
+        "is_async",
+        "storage",
+        "dependencies",
+        "dependents",
+        "waits_for",
+        "releases",
+        "_is_field",
+        "_is_attribute",
+        "_cast_steps",
+    )
+
+    def __init__(
+        self,
+        owner: type,
+        name: str,
+        validator: Validator,
+        annotated_type: type,
+        annotations: Dict[str, type],
+    ) -> None:
+        self.owner = owner
+        self.name = name
+        self.validator = validator
+        self.annotated_type = annotated_type
+        self.origin = getattr(annotated_type, "__origin__", None)
+        args = getattr(annotated_type, "__args__", None)
+        self.sub_annotated_type = args[0] if self.origin is not None and args else None
+        self.sequence_type = list
+        if (
+            isinstance(self.origin, type)
+            and issubclass(self.origin, (Sequence, AbstractSet))
+            and not isabstract(self.origin)
+        ):
+            self.sequence_type = self.origin
+        self.is_container = isinstance(annotated_type, type) and issubclass(
+            annotated_type, Container
+        )
+        self.type_mapping = validator._type_handler.TYPE_MAPPING
+        # plain strings are references if they name a field of the class, other attributes
+        # have to be referred to by FieldRef, as data strings may match e.g. a method name
+        self._is_field = lambda item: item in annotations
+        self._is_attribute = lambda item: item in annotations or hasattr(owner, item)
+        self.cleaning_func = self._bind(validator._cleaning_func)
+        self.validator_func = self._bind(validator._validator_func)
+        self.is_async = any(
+            func is not None and func.is_async
+            for func in (self.cleaning_func, self.validator_func)
+        ) or any(
+            isinstance(casting_fct, FunctionWrapper) and casting_fct.is_async
+            for casting_fct in self.type_mapping.values()
+        )
+        self._cast_steps: Dict[Tuple[type, bool], Tuple[CastStep, Any]] = {}
+        self.storage = validator._storage
+        self.dependencies = self._references(self.validator_func)
+        # set by the ClassPlan once all fields are known
+        self.dependents: Tuple[str, ...] = ()
+        self.waits_for: Tuple[str, ...] = ()
+        self.releases: Tuple[str, ...] = ()
+        if self.storage is not Storage.LIST and (
+            self.sequence_type is not list or self.sub_annotated_type not in STORAGE_TYPES
+        ):
+            raise TypeError(
+                f"storage '{self.storage.value}' of field '{name}' requires a List[int] or "
+                + f"List[float] annotation, received {annotated_type}"
+            )
+
+    def stores_directly(self, value) -> bool:
+        """if the value can be stored without casting its items, i.e. a numpy.ndarray of a
+        compatible dtype or a list or tuple of ints, or ints and floats for List[float]"""
+        _, _, kinds, item_types = STORAGE_TYPES[self.sub_annotated_type]
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in kinds
+        return type(value) in (list, tuple) and all(type(item) in item_types for item in value)
+
+    def store(self, items):
+        """converts casted items into the storage of the field at once
+
+        Raises:
+            CastException: if the items don't fit the dtype, e.g. ints exceeding 64 bit
+
+        Returns:
+            Union[np.ndarray, array]: the items in the storage container
+        """
+        typecode, dtype, _, _ = STORAGE_TYPES[self.sub_annotated_type]
+        try:
+            if self.storage is Storage.ARRAY:
+                return np.asarray(items, dtype=dtype)
+            if isinstance(items, np.ndarray):
+                items = items.astype(dtype, copy=False)
+            return array(typecode, items)
+        except (OverflowError, TypeError, ValueError) as e:
+            raise CastException(e, input_type=type(items), output_type=self.storage.value)
+
+    def _bind(self, function_wrapper: FunctionWrapper) -> FieldFunction:
+        if function_wrapper is None:
+            return None
+        return FieldFunction(function_wrapper, self._is_field, self._is_attribute)
+
+    def _references(self, *funcs: FieldFunction) -> Tuple[str, ...]:
+        names = []
+        for func in funcs:
+            if func is not None:
+                names.extend(func.referenced_fields())
+        return tuple(name for name in dict.fromkeys(names) if name != self.name)
+
+    def referenced_fields(self) -> Tuple[str, ...]:
+        """fields the cleaning or validation function refers to, which have to be set before
+        this one"""
+        return self._references(self.cleaning_func, self.validator_func)
+
+    def resolve_cast(self, source_type: type, multiple: bool) -> Tuple[CastStep, Any]:
+        """returns the casting step for values of source_type, the step is only derived
+        once per source type and memoized afterwards, source types without an entry of their
+        own resolve through their MRO and the numbers ABCs, see _source_bases
+
+        Args:
+            source_type (type): type of the value or of the items if multiple is set
+            multiple (bool): if the value is a Sequence whose items are casted individually
+
+        Returns:
+            Tuple[CastStep, Any]: kind of step and its payload, i.e. the bound casting
+                function for CastStep.MAPPED or the type tuple for CastStep.CONSTRUCT
+        """
+        try:
+            return self._cast_steps[(source_type, multiple)]
+        except KeyError:
+            step = self._compile_cast(source_type, multiple)
+            self._cast_steps[(source_type, multiple)] = step
+            return step
+
+    def _compile_cast(self, source_type: type, multiple: bool) -> Tuple[CastStep, Any]:
+        if multiple:
+            dest_type, outer_type = self.sub_annotated_type, self.origin
+        else:
+            dest_type, outer_type = self.annotated_type, self.annotated_type
+        type_tuple = (source_type, dest_type)
+        if source_type == dest_type:
+            return CastStep.IDENTITY, None
+        if type_tuple in self.type_mapping:
+            return CastStep.MAPPED, self._bind(self.type_mapping[type_tuple])
+        # values of subclasses, e.g. numpy scalars, are casted like the first base with a match
+        for base in _source_bases(source_type):
+            if base == dest_type:
+                if issubclass(source_type, COERCED_TYPES):
+                    return CastStep.COERCE, dest_type
+                return CastStep.IDENTITY, None
+            if (base, dest_type) in self.type_mapping:
+                return CastStep.MAPPED, self._bind(self.type_mapping[(base, dest_type)])
+        if outer_type in PRIMITIVE_TYPES:
+            return CastStep.MISMATCH, type_tuple
+        if isinstance(dest_type, Callable):
+            return CastStep.CONSTRUCT, type_tuple
+        return CastStep.MISSING, type_tuple
+
+
+class ClassPlan:
+    """
+    compiled field plan of a class using Validator descriptors, is built once per class and
+    cached on it, see get_field_plan
+
+    Attributes:
+        owner (type): class the plan was compiled for
+        annotations (MappingProxyType): flattened annotations of the whole MRO, fields of \
+            child classes take precedence over the ones of their parents
+        fields (MappingProxyType): FieldPlan for each field managed by a Validator
+        construction_order (Tuple[str, ...]): fields managed by a Validator ordered such that \
+            referenced fields come before the ones referring to them, otherwise in \
+            declaration order
+        reorders (bool): if a field refers to one declared after it, instances are then \
+            constructed in construction_order, see construct
+    """
+
+    __slots__ = ("owner", "annotations", "fields", "construction_order", "reorders")
+
+    def __init__(self, owner: type) -> None:
+        self.owner = owner
+        annotations = {}
+        for cls in reversed(owner.__mro__):
+            annotations.update(cls.__dict__.get("__annotations__", {}))
+        self.annotations = MappingProxyType(annotations)
+
+        fields = {}
+        for name, annotated_type in annotations.items():
+            descriptor = next(
+                (cls.__dict__[name] for cls in owner.__mro__ if name in cls.__dict__),
+                None,
+            )
+            if isinstance(descriptor, Validator):
+                fields[name] = FieldPlan(
+                    owner, name, descriptor, annotated_type, annotations
+                )
+        self.fields = MappingProxyType(fields)
+        self.construction_order = self._topological_order()
+        self._link_fields()
+
+    def _topological_order(self) -> Tuple[str, ...]:
+        """declaration order with referenced fields moved in front of the first field
+        referring to them, fields referring to each other stay in declaration order"""
+        references = {
+            name: [ref for ref in field.referenced_fields() if ref in self.fields]
+            for name, field in self.fields.items()
+        }
+        order: List[str] = []
+        placed = set()
+        visiting = set()
+
+        def place(name: str) -> None:
+            if name in placed or name in visiting:
+                return
+            visiting.add(name)
+            for ref in references[name]:
+                place(ref)
+            visiting.discard(name)
+            placed.add(name)
+            order.append(name)
+
+        for name in self.fields:
+            place(name)
+        return tuple(order)
+
+    def _link_fields(self) -> None:
+        position = {name: index for index, name in enumerate(self.fields)}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.fields}
+        releases: Dict[str, List[str]] = {name: [] for name in self.fields}
+        for name, field in self.fields.items():
+            for ref in field.dependencies:
+                if ref in dependents:
+                    dependents[ref].append(name)
+            field.waits_for = tuple(
+                ref
+                for ref in field.referenced_fields()
+                if ref in position and position[ref] > position[name]
+            )
+            for ref in field.waits_for:
+                releases[ref].append(name)
+        for name, field in self.fields.items():
+            field.dependents = tuple(dependents[name])
+            field.releases = tuple(releases[name])
+        self.reorders = any(field.waits_for for field in self.fields.values())
+
+
+_PLAN_LOCK = threading.Lock()
+
+DEFERRED_FIELDS: ContextVar[Optional[list]] = ContextVar("DEFERRED_FIELDS", default=None)
+"""collects the assignments of fields with coroutine functions during Container.acreate, \
+see data_validation.async_validation"""
+
+
+class _Construction:
+    """fields of an instance under construction which wait for fields declared after them,
+    see ClassPlan.reorders"""
+
+    __slots__ = ("instance", "assigned", "waiting")
+
+    def __init__(self, instance) -> None:
+        self.instance = instance
+        self.assigned = set()
+        self.waiting: Dict[str, Tuple[Validator, FieldPlan, Any]] = {}
+
+    def assign(self, validator: Validator, field: FieldPlan, value) -> None:
+        if any(name not in self.assigned for name in field.waits_for):
+            self.waiting[field.name] = (validator, field, value)
+            return
+        validator._set(self.instance, field, value)
+        self.assigned.add(field.name)
+        if field.releases:
+            self._release()
+
+    def _release(self) -> None:
+        released = True
+        while released:
+            released = False
+            for name, (validator, field, value) in list(self.waiting.items()):
+                if all(ref in self.assigned for ref in field.waits_for):
+                    del self.waiting[name]
+                    validator._set(self.instance, field, value)
+                    self.assigned.add(name)
+                    released = True
+
+    def finish(self) -> None:
+        """sets the fields still waiting, e.g. for fields a custom __init__ didn't set"""
+        for validator, field, value in list(self.waiting.values()):
+            validator._set(self.instance, field, value)
+        self.waiting.clear()
+
+
+class _Revalidation:
+    """fields of an instance assigned within deferred_revalidation"""
+
+    __slots__ = ("instance", "dirty")
+
+    def __init__(self, instance) -> None:
+        self.instance = instance
+        self.dirty = set()
+
+
+CONSTRUCTION: ContextVar[Optional[_Construction]] = ContextVar("CONSTRUCTION", default=None)
+"""instance being constructed by construct and its fields waiting for others"""
+
+REVALIDATION: ContextVar[Optional[_Revalidation]] = ContextVar("REVALIDATION", default=None)
+"""instance whose cross-field validation is deferred, see deferred_revalidation"""
+
+
+def get_field_plan(owner: type) -> ClassPlan:
+    """returns the compiled ClassPlan of a class, compiles it on first access
+
+    Args:
+        owner (type): class using Validator descriptors
+
+    Returns:
+        ClassPlan: plan cached on the class itself
+    """
+    plan = owner.__dict__.get("__field_plan__")
+    if plan is None:
+        with _PLAN_LOCK:
+            plan = owner.__dict__.get("__field_plan__")
+            if plan is None:
+                plan = ClassPlan(owner)
+                setattr(owner, "__field_plan__", plan)
+    return plan
+
+
+class Validator(Generic[ValidatedClass]):
+    """
+    This Descriptor class manages the general UseCase of Type Checking and Data validation,
+    all information derived from the type hint of the field is compiled once per owner class
+    into a FieldPlan. The descriptor holds no per-call state, so instances of the owner class
+    can be validated concurrently from multiple threads
+
     Raises:
         ValueError: if the Validation fails
     """
 
-    _annotated_type: type
-    _value_type: type
-    _sub_value_type: type
-    _sub_annotated_type: type = type(None)
-
     def __init__(
         self,
         cleaning_func: ArgFunctionWrapper = None,
@@ -134,6 +669,7 @@ class Validator(Generic[ValidatedClass]):
         validation_scope: Scope = Scope.ITEM,
         logger: logging.Logger = None,
         omit_logging: bool = False,
+        storage: Union[str, Storage] = Storage.LIST,
     ):
         """
         Args:
@@ -153,6 +689,9 @@ class Validator(Generic[ValidatedClass]):
                 elements or the collection itself. Defaults to Scope.ITEM.
             omit_logging (bool, optional):\n
                 option to suppress all logging caused by the field. Defaults to False.
+            storage (Union[str, Storage], optional): container the items of a List[int] or \
+                List[float] field are kept in, "array" for a numpy.ndarray and "pyarray" for \
+                an array.array, which are casted at once. Defaults to Storage.LIST.
         """
         self._cleaning_func = cleaning_func
         self._type_handler = type_handler
@@ -161,15 +700,21 @@ class Validator(Generic[ValidatedClass]):
         self._default = default
         self._validation_scope = validation_scope
         self._omit_logging = omit_logging
-        if logger:
-            self._logger = logger
-        else:
-            self.init_logger()
+        self._storage = Storage(storage)
+        self._slot = None
+        # the root logger is only fetched once something is logged, see _get_logger
+        self._logger = logger
 
     def init_logger(self):
-        self._logger = logging.getLogger()
-        self._logger = log_util.init_console_logger(self._logger)
-        self._logger = log_util.init_file_logger(self._logger)
+        self._logger = log_util.get_logger()
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is not None:
+            return self._logger
+        return log_util.get_logger()
+
+    def _logging_enabled(self) -> bool:
+        return log_util.LoggingConfig._ENABLED and not self._omit_logging
 
     def __call__(
         self,
@@ -180,6 +725,7 @@ class Validator(Generic[ValidatedClass]):
         allow_none: bool = None,
         validation_scope: Scope = None,
         omit_logging: bool = False,
+        storage: Union[str, Storage] = None,
     ) -> Validator:
         """ factory method, will invoke the instance with predefined settings, but enables \
             overwriting of specific values
@@ -200,6 +746,8 @@ class Validator(Generic[ValidatedClass]):
                 the elements or the collection itself. Defaults to Scope.ITEM.\n
             omit_logging (bool, optional):\n
                 option to suppress all logging caused by the field. Defaults to False.
+            storage (Union[str, Storage], optional): container the items of a List[int] or \
+                List[float] field are kept in. Defaults to the one of the instance.
         """
 
         type_handler = self._type_handler if type_handler is None else type_handler
@@ -213,6 +761,7 @@ class Validator(Generic[ValidatedClass]):
             self._validation_scope if validation_scope is None else validation_scope
         )
         omit_logging = self._omit_logging if omit_logging is None else omit_logging
+        storage = self._storage if storage is None else storage
 
         return Validator(
             cleaning_func=cleaning_func,
@@ -223,6 +772,7 @@ class Validator(Generic[ValidatedClass]):
             validation_scope=validation_scope,
             logger=self._logger,
             omit_logging=omit_logging,
+            storage=storage,
         )
 
     def __repr__(self) -> str:
@@ -233,17 +783,32 @@ class Validator(Generic[ValidatedClass]):
             self._name = name[1:]
         else:
             self._name = name
+        # classes created with slots=True keep the value in a slot, see ValidationMeta
+        slot = owner.__dict__.get("__slot_fields__", {}).get(name)
+        # the slot of a redefined field belongs to the parent
+        self._slot = None if slot is None else getattr(owner, slot)
 
     def __get__(self, instance: ValidatedClass, owner):
         if not instance:
             return self
-        return instance.__dict__.get(self._name, self._default)
+        if self._slot is None:
+            return instance.__dict__.get(self._name, self._default)
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            return self._default
 
     def __delete__(self, instance):
-        del instance.__dict__[self._name]
+        if self._slot is None:
+            del instance.__dict__[self._name]
+        else:
+            self._slot.__delete__(instance)
 
     def _set_attr(self, instance, value):
-        instance.__dict__[self._name] = value
+        if self._slot is None:
+            instance.__dict__[self._name] = value
+        else:
+            self._slot.__set__(instance, value)
 
     def _handle_None(self):
         if not self._allow_none:
@@ -254,17 +819,22 @@ class Validator(Generic[ValidatedClass]):
             )
         return None
 
+    def _missing_argument_error(self, owner_name: str) -> TypeError:
+        return TypeError(
+            f"{owner_name}() missing 1 required "
+            + f"positional argument: '{self._name}' with no default value defined"
+        )
+
     def _handle_default_case(self, instance, value):
         if self._default == State.NOT_SET:
-            raise TypeError(
-                f"{instance.__class__.__name__}() missing 1 required "
-                + f"positional argument: '{self._name}' with no default value defined"
-            )
+            raise self._missing_argument_error(instance.__class__.__name__)
 
-        if not self._omit_logging and value is None:
-            self._logger.warn(
-                f"field '{self._name}' in Parent-field "
-                + f"'{instance.__class__.__name__}' was not passed defaulting to {self._default}"
+        if value is None and self._logging_enabled():
+            self._get_logger().warning(
+                "field '%s' in Parent-field '%s' was not passed defaulting to %s",
+                self._name,
+                instance.__class__.__name__,
+                self._default,
             )
         # handle case where a field is equal to another field,
         # e.g. output_dir = input_dir
@@ -274,16 +844,7 @@ class Validator(Generic[ValidatedClass]):
             value = self._default
         return value
 
-    def _handle_Sequences(self, instance, value):
-        self._sub_annotated_type = self._annotated_type.__args__[0]
-        self._annotated_type = getattr(self._annotated_type, "__origin__")
-        # return if list is empty
-        if not value:
-            self._sub_value_type = None
-            return
-        self._sub_value_type = type(value[0])
-
-    def _handle_callables(self, value, type_tuple):
+    def _handle_callables(self, value, type_tuple, value_type: type):
         if type_tuple[0] == dict:
             return type_tuple[1](**value)
         if isinstance(type_tuple[0], Sequence) and not type_tuple[1] == str:
@@ -291,222 +852,545 @@ class Validator(Generic[ValidatedClass]):
         try:
             return type_tuple[1](value)
         except ValueError:
-            self._logger.error(
-                f"value {value} is not a valid option of {type_tuple[1]}"
-            )
+            if self._logging_enabled():
+                self._get_logger().error(
+                    "value %s is not a valid option of %s", value, type_tuple[1]
+                )
             if not self._allow_none:
                 raise CastException(
-                    input_type=self._value_type,
+                    input_type=value_type,
                     output_type=type_tuple[1],
                     message=f"value '{value}' is not a valid option",
                 )
             return None
 
-    def _handle_casting(self, instance, type_tuple: Tuple[type], value, multiple: bool):
-        if type_tuple[0] == type_tuple[1]:
+    def _handle_casting(
+        self, instance, field: FieldPlan, source_type: type, value, multiple: bool
+    ):
+        step, payload = field.resolve_cast(source_type, multiple)
+        if step is CastStep.IDENTITY:
             return value
 
-        if type_tuple not in self._type_handler.TYPE_MAPPING.keys():
-            # treat primitive type mismatch as "real" typeError
-            if self._annotated_type in [str, int, float, bool]:
-                raise TypeError(
-                    f"invalid type provided for attribute: {self._name} \n"
-                    + f"  expected type {self._annotated_type}, received <value> \n"
-                    + f"  {value} of type {self._value_type}"
-                )
-            if isinstance(type_tuple[1], Callable):
-                try:
-                    if multiple:
-                        tempWrapper = ArgFunctionWrapper(
-                            self._handle_callables, type_tuple=type_tuple
-                        )
-                        return list(map(tempWrapper, value))
-                    else:
-                        return self._handle_callables(value, type_tuple)
-                # assume a type_mapping to a complex type is missing
-                except CastException as e:
-                    raise e
-                except Exception as e:
-                    raise NotImplementedError(
-                        f"value of type {self._value_type} could not be automatically casted to {self._annotated_type}, "
-                        + f"trying yielded Error: {e}"
-                    )
-        cast_fct = self._type_handler.TYPE_MAPPING[type_tuple]
-        self._resolve_instance_attr_ref(instance, cast_fct)
-        if multiple:
-            return map(cast_fct, value)
-        else:
+        if step is CastStep.MAPPED:
+            cast_fct = payload.resolve(instance)
+            if multiple:
+                batch_fct = BATCH_CAST_MAPPING.get(cast_fct.func)
+                if batch_fct is not None:
+                    return batch_fct(value, *cast_fct.init_args, **cast_fct.kwargs)
+                return [cast_fct(item) for item in value]
             return cast_fct(value)
 
+        if step is CastStep.COERCE:
+            if multiple:
+                return [payload(item) for item in value]
+            return payload(value)
+
+        value_type = type(value)
+
+        expected_type = field.origin if multiple else field.annotated_type
+        # treat primitive type mismatch as "real" typeError
+        if step is CastStep.MISMATCH:
+            raise TypeError(
+                f"invalid type provided for attribute: {self._name} \n"
+                + f"  expected type {expected_type}, received <value> \n"
+                + f"  {value} of type {value_type}"
+            )
+        if step is CastStep.MISSING:
+            raise NotImplementedError(
+                f"value of type {value_type} could not be automatically casted to "
+                + f"{expected_type}, no casting function is defined for {payload}"
+            )
+        try:
+            if multiple:
+                return [
+                    self._handle_callables(item, payload, value_type) for item in value
+                ]
+            return self._handle_callables(value, payload, value_type)
+        # assume a type_mapping to a complex type is missing
+        except CastException as e:
+            raise e
+        except Exception as e:
+            raise NotImplementedError(
+                f"value of type {value_type} could not be automatically casted to {expected_type}, "
+                + f"trying yielded Error: {e}"
+            )
+
+    def _handle_sequence(self, instance, field: FieldPlan, value: Sequence):
+        """casts the items of a Sequence to the item type of the field, lists of a single item
+        type are casted at once, mixed lists per item type
+
+        Returns:
+            the casted items in a container of field.sequence_type
+        """
+        if not value:
+            return field.sequence_type(value)
+        first_type = type(value[0])
+        if all(type(item) is first_type for item in value):
+            items = self._handle_casting(instance, field, first_type, value, True)
+        else:
+            positions: Dict[type, List[int]] = {}
+            for position, item in enumerate(value):
+                positions.setdefault(type(item), []).append(position)
+            items = [None] * len(value)
+            for source_type, group in positions.items():
+                casted = self._handle_casting(
+                    instance, field, source_type, [value[i] for i in group], True
+                )
+                for position, item in zip(group, casted):
+                    items[position] = item
+        if type(items) is field.sequence_type:
+            return items
+        return field.sequence_type(items)
+
     def __set__(self, instance: ValidatedClass, value):
-        if self._name.startswith("_"):
-            self._name = self._name[1:]
+        field = get_field_plan(type(instance)).fields[self._name]
+        if field.waits_for or field.releases:
+            construction = CONSTRUCTION.get()
+            if construction is not None and construction.instance is instance:
+                construction.assign(self, field, value)
+                return
+        if field.dependencies or field.dependents:
+            self._set_revalidating(instance, field, value)
+            return
+        self._set(instance, field, value)
 
-        self._annotated_type = instance.__annotations__[self._name]
-        self._value_type = type(value)
+    def _set(self, instance, field: FieldPlan, value, validate: bool = True):
+        """casts, cleans and validates the value and stores it, the validation is skipped if
+        validate is False"""
+        report = ACTIVE_REPORT.get()
+        if report is not None:
+            self._set_collecting(instance, value, report)
+            return
 
         if value is self:
             value = self._handle_default_case(instance, value)
             return
 
-        if (
-            hasattr(self._annotated_type, "__origin__")
-            and isinstance(value, Sequence)
-            and not isinstance(value, str)
-        ):
-            self._handle_Sequences(instance, value)
-            multiple = True
-            type_tuple = (self._sub_value_type, self._sub_annotated_type)
-        else:
-            multiple = False
-            type_tuple = (self._value_type, self._annotated_type)
-
-        if value is None:
+        if _is_missing(value):
             self._handle_None()
             return
+
+        if field.is_async:
+            self._defer(instance, field, value)
+            return
+
+        value = self._cast(instance, field, value)
+        if validate:
+            value = self._clean_and_validate(instance, field, value)
+        elif field.cleaning_func is not None:
+            value = field.cleaning_func.resolve(instance)(value)
+        self._set_attr(instance, value)
+
+    def _set_revalidating(self, instance, field: FieldPlan, value):
+        """sets a field involved in cross-field validation, the fields validated against it
+        are validated again and the assignment is undone if one of them fails"""
+        block = REVALIDATION.get()
+        if block is not None and block.instance is instance:
+            # fields validated against others are validated once the block is left
+            self._set(instance, field, value, validate=not field.dependencies)
+            block.dirty.add(field.name)
+            return
+        if not field.dependents:
+            self._set(instance, field, value)
+            return
+        previous = self._stored(instance)
+        self._set(instance, field, value)
         try:
-            value = self._handle_casting(
-                instance=instance, type_tuple=type_tuple, value=value, multiple=multiple
-            )
-        except CastException as e:
-            if issubclass(self._annotated_type, Container):
-                raise CastException(
-                    f"Subclass {instance.__class__.__name__} with field name {self._name} failed to initialize due to:\n {e}"
-                )
+            _validate_stored(instance, field.dependents)
+        except VALIDATION_ERRORS:
+            if previous is State.NOT_SET:
+                if self._stored(instance) is not State.NOT_SET:
+                    self.__delete__(instance)
             else:
-                raise CastException(
-                    f"attribute '{self._name}' in Class '{instance.__class__.__name__}' could not be set due to:\n {e}"
-                )
+                self._set_attr(instance, previous)
+            raise
 
-        # apply function to clean the possible values
-        if self._cleaning_func:
-            self._resolve_instance_attr_ref(instance, self._cleaning_func)
-            value = self._cleaning_func(value)
+    def _stored(self, instance):
+        """the value stored on the instance, State.NOT_SET for unset fields and fields
+        resolving to their default"""
+        if self._slot is None:
+            return instance.__dict__.get(self._name, State.NOT_SET)
+        try:
+            return self._slot.__get__(instance, type(instance))
+        except AttributeError:
+            return State.NOT_SET
+
+    def _async_field_error(self, field: FieldPlan) -> TypeError:
+        return TypeError(
+            f"field '{self._name}' of '{field.owner.__name__}' uses coroutine functions, "
+            + "instantiate the class by awaiting acreate instead"
+        )
+
+    def _defer(self, instance, field: FieldPlan, value):
+        """postpones setting a field with coroutine functions until acreate awaits it"""
+        deferred = DEFERRED_FIELDS.get()
+        if deferred is None:
+            raise self._async_field_error(field)
+        deferred.append((self, instance, field, value))
 
-        # handle trivial case where types match
+    async def _aset(self, instance, field: FieldPlan, value):
+        """casts, cleans and validates a value like __set__, but awaits coroutine functions
+
+        Raises:
+            ValueError: if the Validation fails
+        """
+        value = self._cast(instance, field, value)
+        if isawaitable(value):
+            value = await value
+        elif isinstance(value, (list, tuple)) and any(isawaitable(item) for item in value):
+            value = field.sequence_type(await asyncio.gather(*value))
+        if field.cleaning_func is not None:
+            value = await field.cleaning_func.resolve(instance).acall(value)
+        if field.validator_func is not None:
+            validator_func = field.validator_func.resolve(instance)
+            try:
+                if self._validates_items(value):
+                    msg_list = await asyncio.gather(
+                        *(validator_func.acall(item) for item in value)
+                    )
+                else:
+                    msg_list = [await validator_func.acall(value)]
+                self._log_validation_msgs(msg_list)
+            except ValueError as e:
+                raise ValueError(f"Validation Test failed for field '{self._name}': {e}")
+        self._set_attr(instance, value)
+
+    def _set_collecting(self, instance, value, report: ValidationReport):
+        """sets the value like __set__ but adds a failure to the report instead of raising,
+        nested classes are validated regularly so their errors end up in the one of the
+        field"""
+        token = ACTIVE_REPORT.set(None)
         try:
-            if isinstance(value, self._annotated_type) and self._validator_func is None:
-                self._set_attr(instance, value)
+            field = get_field_plan(type(instance)).fields[self._name]
+            if value is self or _is_missing(value):
+                try:
+                    self._set(instance, field, value)
+                except VALIDATION_ERRORS as e:
+                    raw_value = None if value is self else value
+                    report.errors.append(
+                        FieldError.from_exception(self._name, raw_value, Stage.DEFAULT, e)
+                    )
                 return
-        except TypeError:
-            pass
-        if self._validator_func is None:
-            self._set_attr(instance, value)
-            return
+            value = self._check(instance, field, value, report)
+            if value is not State.NOT_SET:
+                self._set_attr(instance, value)
+        finally:
+            ACTIVE_REPORT.reset(token)
 
-        self._perform_validation(instance, value)
-        return
+    def _check(self, instance, field: FieldPlan, value, report: ValidationReport):
+        """casts, cleans and validates a value which is neither missing nor the default, a
+        failure is added to the report instead of raising
 
-    def _resolve_instance_attr_ref(
-        self, instance: ValidatedClass, functionWrapper: FunctionWrapper
-    ):
-        """for getting proxy reference e.g. output_path = "input_path" with "input_path" being a
-        reference to the field input_path of the class itself same with the reference nested
-        inside a list
+        Args:
+            instance: instance or proxy object to resolve field references against
+            field (FieldPlan): compiled plan of the field
+            value: raw value
+            report (ValidationReport): report to add the failure to
+
+        Returns:
+            the cleaned value or State.NOT_SET if a stage failed
+        """
+        stage = Stage.CAST
+        try:
+            if field.is_async:
+                raise self._async_field_error(field)
+            casted = self._cast(instance, field, value)
+            if field.cleaning_func is not None:
+                stage = Stage.CLEAN
+                self._check_references(instance, field.cleaning_func, report)
+                casted = field.cleaning_func.resolve(instance)(casted)
+            if field.validator_func is not None:
+                stage = Stage.VALIDATE
+                self._check_references(instance, field.validator_func, report)
+                self._perform_validation(instance, field, casted)
+        except VALIDATION_ERRORS as e:
+            report.errors.append(FieldError.from_exception(self._name, value, stage, e))
+            return State.NOT_SET
+        return casted
+
+    def _check_references(self, instance, func: FieldFunction, report: ValidationReport):
+        """makes sure the fields func refers to hold a valid value, as the function can't be
+        called with the values of fields which failed or are neither set nor defaulted
+
+        Raises:
+            ValueError: naming the referenced fields which failed or are not set
+        """
+        failed = {error.field for error in report.errors}
+        unavailable = [
+            name
+            for name in dict.fromkeys(func.referenced_fields())
+            if name != self._name
+            and (name in failed or getattr(instance, name, State.NOT_SET) is State.NOT_SET)
+        ]
+        if unavailable:
+            raise ValueError(
+                f"field '{self._name}' is not validated, as the referenced fields "
+                + f"{unavailable} failed or are missing"
+            )
+
+    def _cast(self, instance, field: FieldPlan, value):
+        """casts a value, which is not None, to the annotated type of the field
 
         Args:
-            instance (_type_): _description_
-            functionWrapper (FunctionWrapper): _description_
+            instance: instance or proxy object to resolve field references against
+            field (FieldPlan): compiled plan of the field
+            value: value to cast
+
+        Raises:
+            CastException: if the casting function failed
+            TypeError: if primitive types don't match
+
+        Returns:
+            casted value
         """
-        temp_dict = deepcopy(functionWrapper.kwargs)
-        for key, val in temp_dict.items():
-            if isinstance(val, Sequence) and not isinstance(val, str):
-                for i, v in enumerate(val):
-                    if not isinstance(v, str):
-                        continue
-                    elif hasattr(instance, v):
-                        val[i] = getattr(instance, v)
-            else:
-                if hasattr(instance, str(val)):
-                    temp_dict[key] = getattr(instance, val)
-        functionWrapper.kwargs = temp_dict
+        if field.storage is not Storage.LIST:
+            if field.stores_directly(value):
+                return self._store(field, value)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+        multiple = (
+            field.origin is not None
+            and isinstance(value, Sequence)
+            and not isinstance(value, str)
+        )
+        try:
+            if multiple:
+                items = self._handle_sequence(instance, field, value)
+                if field.storage is Storage.LIST:
+                    return items
+                return field.store(items)
+            return self._handle_casting(
+                instance=instance,
+                field=field,
+                source_type=type(value),
+                value=value,
+                multiple=False,
+            )
+        except CastException as e:
+            raise self._cast_error(field, e, multiple)
 
-    def _perform_validation(self, instance, value):
+    def _cast_error(self, field: FieldPlan, e: CastException, multiple: bool) -> CastException:
+        """CastException naming the field which could not be set"""
+        if field.is_container and not multiple:
+            return CastException(
+                f"Subclass {field.owner.__name__} with field name {self._name} failed to initialize due to:\n {e}"
+            )
+        return CastException(
+            f"attribute '{self._name}' in Class '{field.owner.__name__}' could not be set due to:\n {e}"
+        )
 
-        self._resolve_instance_attr_ref(instance, self._validator_func)
+    def _store(self, field: FieldPlan, value):
         try:
-            if (
-                not isinstance(value, Sequence) or isinstance(value, str)
-            ) or self._validation_scope == Scope.COLLECTION:
-                msg = self._validator_func(value)
-            else:
-                if not self._validation_scope == Scope.ITEM:
-                    raise ValueError("Improper usage of Validator class")
-                msg_list = [self._validator_func(item) for item in value]
-                msg_list = [m for m in msg_list if m]
-                msg = ",\n".join(msg_list)
-
-            if msg is not None:
-                self._logger.error(msg)
-        except ValueError as e:
-            raise ValueError(f"Validation Test failed for field '{self._name}': {e}")
-        self._set_attr(instance, value)
+            return field.store(value)
+        except CastException as e:
+            raise CastException(
+                f"attribute '{self._name}' in Class '{field.owner.__name__}' could not be set due to:\n {e}"
+            )
 
+    def _clean_and_validate(self, instance, field: FieldPlan, value):
+        """applies the cleaning and validation function to an already casted value
 
-class Validator_Slotted(Validator):
-    """class for validation of arguments Dataclass Args:\n
-       Args:
-        func (function): callback function which will either run successfully \
-            or raise a Value Error
-        value_list (list): reference list for checking for inclusion of the \
-            value
-        value_range (list): list of form [minValue, maxValue] for checking \
-            if value is in between, if None is set for maxValue or minValue, \
-            performs one sided check
-        default (any): default value which is dependent on the type annotation\
-             the class is instantiated with
-        allow_none (bool): accept None as set Value, if False and default is None\
-            raises TypeError when no argument is passed
-        **kwargs: additional arguments for the callback function for special\
-             cases
-       Raises:
-        ValueError: if the Validation fails
-        TypeError: if the type in value_list or value_range don't match
+        Args:
+            instance: instance or proxy object to resolve field references against
+            field (FieldPlan): compiled plan of the field
+            value: casted value
 
-       Returns:
-        either the default value or the value passed by the owner class \
-        defaults itself to none
-    """
+        Raises:
+            ValueError: if the Validation fails
 
-    # annotated_type: type
-    # value_type: type
-    # sub_value_type: type
-    # sub_annotated_type: type = type(None)
-    __slots__ = (
-        "_name",
-        "_annotated_type",
-        "_value_type",
-        "_sub_value_type",
-        "_sub_annotated_type",
-        "_cleaning_func",
-        "_validator_func",
-        "_default",
-        "_allow_none",
-        "_omit_logging",
-        "_logger",
-    )
+        Returns:
+            cleaned value
+        """
+        # apply function to clean the possible values
+        if field.cleaning_func is not None:
+            value = field.cleaning_func.resolve(instance)(value)
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        if field.validator_func is not None:
+            self._perform_validation(instance, field, value)
+        return value
 
-    def init_logger(self):
-        self.logger = logging.getLogger()
-        self.logger = log_util.init_console_logger(self.logger)
-        self.logger = log_util.init_file_logger(self.logger)
+    def _validates_items(self, value) -> bool:
+        """if the validation function is applied to each item of value instead of value"""
+        if (
+            not isinstance(value, (Sequence, np.ndarray)) or isinstance(value, str)
+        ) or self._validation_scope == Scope.COLLECTION:
+            return False
+        if not self._validation_scope == Scope.ITEM:
+            raise ValueError("Improper usage of Validator class")
+        return True
+
+    def _log_validation_msgs(self, msg_list: list):
+        if not self._logging_enabled():
+            return
+        # items which all passed result in an empty message
+        msg = ",\n".join(str(m) for m in msg_list if m)
+        if msg:
+            self._get_logger().error(msg)
+
+    def _validate_batch(self, validator_func: ArgFunctionWrapper, value: Sequence) -> bool:
+        """validates all items at once by the batch implementation of the validation function,
+        the function itself is only called for the first failing item to raise its error
+
+        Raises:
+            ValueError: if an item fails
+
+        Returns:
+            bool: False if the batch implementation failed on the items, so they have to be
+                validated one by one
+        """
+        try:
+            failing = validator_func.failing_indices(value)
+        except (TypeError, ValueError):
+            # e.g. items numpy can't compare, the item-wise path raises the regular errors
+            return False
+        if not len(failing):
+            return True
+        index = int(failing[0])
+        try:
+            validator_func(value[index])
+        except ValueError as e:
+            msg = str(e)
+        else:
+            msg = f"Value <{value[index]}> is not valid"
+        raise ValueError(
+            f"{len(failing)} of {len(value)} items failed, first at index {index}: {msg}"
+        )
+
+    def _perform_validation(self, instance, field: FieldPlan, value):
+
+        validator_func = field.validator_func.resolve(instance)
+        try:
+            if self._validates_items(value):
+                if getattr(validator_func, "supports_batch", False) and self._validate_batch(
+                    validator_func, value
+                ):
+                    return
+                msg_list = [validator_func(item) for item in value]
+            else:
+                msg_list = [validator_func(value)]
+            self._log_validation_msgs(msg_list)
+        except ValueError as e:
+            raise ValueError(f"Validation Test failed for field '{self._name}': {e}")
 
-    def __repr__(self) -> str:
-        return str(self.default)
+
+class Validator_Slotted(Validator):
+    """Validator which keeps the value in the attribute "_<name>" of the instance instead of
+    its __dict__, meant for classes which define that slot themselves. Containers created with
+    slots=True keep all fields managed by a Validator in slots without it, see ValidationMeta
+    """
 
     def __set_name__(self, owner, name):
-        self._name = "_" + name
+        super().__set_name__(owner, name)
+        self._attr = "_" + name
 
     def __get__(self, instance, owner):
         if not instance:
             return self
-        return getattr(instance, "_" + self._name)
+        return getattr(instance, self._attr, self._default)
 
     def __delete__(self, instance):
-        delattr(instance, "_" + self._name)
+        delattr(instance, self._attr)
 
     def _set_attr(self, instance, value):
-        setattr(instance, "_" + self._name, value)
+        setattr(instance, self._attr, value)
+
+    def _stored(self, instance):
+        return getattr(instance, self._attr, State.NOT_SET)
+
+
+def _validate_stored(instance, names: Iterable[str]) -> None:
+    """runs the validation function of the fields against their stored value, fields which
+    are not set or resolve to their default are skipped
+
+    Raises:
+        ValueError: if the Validation fails
+    """
+    fields = get_field_plan(type(instance)).fields
+    for name in names:
+        field = fields[name]
+        # fields with coroutine functions are only validated by acreate
+        if field.validator_func is None or field.is_async:
+            continue
+        value = field.validator._stored(instance)
+        if value is not State.NOT_SET:
+            field.validator._perform_validation(instance, field, value)
+
+
+def construct(cls: type, args: tuple, kwargs: dict):
+    """instantiates cls setting the fields in the construction order of its ClassPlan, a
+    field referring to fields declared after it is set once they are
+
+    Returns:
+        the instance
+    """
+    instance = cls.__new__(cls, *args, **kwargs)
+    if not isinstance(instance, cls):
+        return instance
+    init_in_order(instance, type(instance).__init__, args, kwargs)
+    return instance
+
+
+def init_in_order(instance, init: Callable, args: tuple, kwargs: dict) -> None:
+    """calls init on the instance, fields referring to fields declared after them are set
+    once those are"""
+    construction = _Construction(instance)
+    token = CONSTRUCTION.set(construction)
+    try:
+        init(instance, *args, **kwargs)
+        construction.finish()
+    finally:
+        CONSTRUCTION.reset(token)
+
+
+def revalidate(instance, dirty_only: bool = False) -> None:
+    """runs the validation functions of an instance again against the current values of the
+    fields they refer to
+
+    Args:
+        instance: instance of a class using Validator descriptors
+        dirty_only (bool, optional): if only the fields affected by the assignments within the
+            active deferred_revalidation block of the instance are validated, i.e. the
+            assigned fields validated against other fields and the fields validated against
+            the assigned ones. Defaults to False, all set fields.
+
+    Raises:
+        ValueError: if the Validation fails
+    """
+    plan = get_field_plan(type(instance))
+    if not dirty_only:
+        _validate_stored(instance, plan.construction_order)
+        return
+    block = REVALIDATION.get()
+    if block is None or block.instance is not instance or not block.dirty:
+        return
+    affected = set()
+    for name in block.dirty:
+        field = plan.fields[name]
+        if field.dependencies:
+            affected.add(name)
+        affected.update(field.dependents)
+    _validate_stored(instance, [name for name in plan.construction_order if name in affected])
+    block.dirty.clear()
+
+
+@contextmanager
+def deferred_revalidation(instance) -> Iterator[None]:
+    """within the block fields of the instance validated against other fields are only
+    casted and cleaned when assigned, they and the fields validated against the assigned
+    ones are validated once the block is left, so related fields can be changed one after
+    another
+
+        with deferred_revalidation(contact):
+            contact.first_name = "Jane"
+            contact.email = "jane.doe@gmail.com"
+
+    Raises:
+        ValueError: if the Validation fails when the block is left
+    """
+    block = _Revalidation(instance)
+    token = REVALIDATION.set(block)
+    try:
+        yield
+        revalidate(instance, dirty_only=True)
+    finally:
+        REVALIDATION.reset(token)
@@ -1,6 +1,12 @@
 import pathlib as pl
 import re
-from typing import List, Union
+from itertools import islice
+from typing import Collection, Iterable, List, Pattern, Sequence, Tuple, Union
+
+import numpy as np
+
+from data_validation.decorators import batch_implementation, prepare_arguments
+from data_validation.filesystem import PathKind, invalidate, path_kind
 
 LOG_DIRECTORY: pl.Path = None
 
@@ -8,21 +14,134 @@ IS_FILE_MSG = "path to directory was expected but filepath was given:"
 IS_DIR_MSG = "filepath was expected, but path to directory was given:"
 FILE_MISSING_MSG = "file not found at location:"
 DIR_MISSING_MSG = "directory not found at location:"
+# number of allowed values listed in error messages
+MAX_LISTED_VALUES = 10
+
+DIGITS_PATTERN = re.compile(r"\d+")
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+")
+
+
+class _OrderedLookup(frozenset):
+    """frozenset which iterates in the order the values were passed, so error messages
+    listing them don't depend on the hash order of the values"""
+
+    __slots__ = ("_order",)
+
+    def __new__(cls, values: Iterable = ()):
+        order = tuple(dict.fromkeys(values))
+        lookup = super().__new__(cls, order)
+        lookup._order = order
+        return lookup
+
+    def __iter__(self):
+        return iter(self._order)
+
+
+def _as_lookup(values: Iterable) -> Collection:
+    """frozenset of the values for hash based membership tests keeping their order, strings,
+    frozensets and collections with unhashable items are returned as they are"""
+    if isinstance(values, (str, frozenset)):
+        return values
+    try:
+        return _OrderedLookup(values)
+    except TypeError:
+        return values
+
+
+def _as_prefixes(prefixes: Union[str, Iterable[str]]) -> Union[str, Tuple[str, ...]]:
+    """single prefix or tuple of prefixes as accepted by str.startswith"""
+    if isinstance(prefixes, (str, tuple)):
+        return prefixes
+    return tuple(prefixes)
+
+
+def _as_pattern(pattern: Union[str, Pattern]) -> Pattern:
+    if isinstance(pattern, str):
+        return re.compile(pattern)
+    return pattern
+
+
+def _listing(values: Collection, separator: str = ", ") -> str:
+    """the first MAX_LISTED_VALUES values for error messages, the rest is only counted"""
+    if isinstance(values, str):
+        return repr(values)
+    listing = separator.join(repr(val) for val in islice(values, MAX_LISTED_VALUES))
+    if len(values) > MAX_LISTED_VALUES:
+        listing += f"{separator}... ({len(values) - MAX_LISTED_VALUES} more)"
+    return listing
 
 
 def extract_digits_from_string(value: str):
-    candidates = re.findall(pattern=r'\d+', string=value)
-    if candidates:
-        return candidates[0]
+    candidate = DIGITS_PATTERN.search(value)
+    if candidate:
+        return candidate.group()
 
 
-def begins_with(value: str, start_val: str):
+@prepare_arguments(start_val=_as_prefixes)
+def begins_with(value: str, start_val: Union[str, Sequence[str]]):
+    """checks if the value begins with the prefix or one of the prefixes, which are checked
+    at once by str.startswith
+
+    Args:
+        value (str): value to check
+        start_val (Union[str, Sequence[str]]): prefix or prefixes
+
+    Raises:
+        ValueError: value does not begin with any of the prefixes
+    """
+    start_val = _as_prefixes(start_val)
     if value.startswith(start_val):
         return
-    else:
-        raise ValueError(f"Value <{value}> does not begin with '{start_val}'")
+    if isinstance(start_val, str):
+        start_val = (start_val,)
+    raise ValueError(
+        f"Value <{value}> does not begin with {_listing(start_val, separator=' or ')}"
+    )
+
+
+@prepare_arguments(pattern=_as_pattern)
+def matches(value: str, pattern: Union[str, Pattern]) -> None:
+    """checks if the whole value matches the regular expression, a pattern passed to an
+    ArgFunctionWrapper as keyword is compiled once when the wrapper is created
+
+    Args:
+        value (str): value to check
+        pattern (Union[str, Pattern]): regular expression
+
+    Raises:
+        ValueError: value does not match the pattern
+    """
+    pattern = _as_pattern(pattern)
+    if pattern.fullmatch(value) is None:
+        raise ValueError(f"Value <{value}> does not match the pattern '{pattern.pattern}'")
+
+
+@prepare_arguments(pattern=_as_pattern)
+def is_email(value: str, pattern: Union[str, Pattern] = EMAIL_PATTERN) -> None:
+    """checks if the value is an email address of the form local@domain.tld
+
+    Args:
+        value (str): value to check
+        pattern (Union[str, Pattern], optional): stricter pattern to use instead.
+            Defaults to EMAIL_PATTERN.
+
+    Raises:
+        ValueError: value is not an email address
+    """
+    if _as_pattern(pattern).fullmatch(value) is None:
+        raise ValueError(f"Value <{value}> is not a valid email address")
 
 
+def _failing(mask) -> np.ndarray:
+    """indices of the items for which the mask is set, object arrays included"""
+    return np.flatnonzero(np.asarray(mask, dtype=bool))
+
+
+def _is_positive_batch(value: Sequence[Union[int, float]]) -> np.ndarray:
+    return _failing(np.logical_not(np.asarray(value) >= 0))
+
+
+@batch_implementation(_is_positive_batch)
 def is_positive(value: Union[int, float]) -> None:
     if value >= 0:
         return
@@ -30,6 +149,21 @@ def is_positive(value: Union[int, float]) -> None:
         raise ValueError(f"Value <{value}> must be positive")
 
 
+def _is_between_batch(
+    value: Sequence[Union[int, float]], value_range: List[Union[int, float]]
+) -> np.ndarray:
+    min_val, max_val = value_range
+    items = np.asarray(value)
+    # like the scalar comparisons NaN is never out of range
+    mask = np.zeros(items.shape, dtype=bool)
+    if max_val is not None:
+        mask |= np.asarray(items > max_val, dtype=bool)
+    if min_val is not None:
+        mask |= np.asarray(items < min_val, dtype=bool)
+    return _failing(mask)
+
+
+@batch_implementation(_is_between_batch)
 def is_between(value: Union[int, float],
                value_range: List[Union[int, float]]) -> None:
 
@@ -46,6 +180,38 @@ def is_between(value: Union[int, float],
     return
 
 
+def _check_length_bounds(lower_bound: int, upper_bound: int) -> None:
+    if upper_bound is not None and not isinstance(upper_bound, int):
+        raise TypeError(
+            f"max_value must be of type Int received type {type(upper_bound)}!")
+    if lower_bound is not None:
+        if not isinstance(lower_bound, int):
+            raise TypeError(
+                f"min_value must be of type Int, received type {type(lower_bound)}!")
+        if lower_bound < 0:
+            raise ValueError(
+                f"minsize '{lower_bound}' is negative which is not allowed as a lower bound"
+            )
+
+
+def _has_length_batch(
+    value: Sequence, lower_bound: int = None, upper_bound: int = None
+) -> np.ndarray:
+    _check_length_bounds(lower_bound, upper_bound)
+    lengths = np.fromiter(
+        (len(str(item)) if isinstance(item, int) else len(item) for item in value),
+        dtype=np.intp,
+        count=len(value),
+    )
+    mask = np.zeros(lengths.shape, dtype=bool)
+    if upper_bound is not None:
+        mask |= lengths > upper_bound
+    if lower_bound is not None:
+        mask |= lengths < lower_bound
+    return _failing(mask)
+
+
+@batch_implementation(_has_length_batch)
 def has_length(value: list, lower_bound: int = None, upper_bound: int = None) -> None:
     """checks if the length of the list is within the interval specified
 
@@ -58,48 +224,60 @@ def has_length(value: list, lower_bound: int = None, upper_bound: int = None) ->
         ValueError: length of the list is not within the bounds
         TypeError: bounds are not of type int
     """
-    if upper_bound is not None:
-        if not isinstance(upper_bound, int):
-            raise ValueError(
-                f"List of Elements <'{value}'> is too long must be at most {upper_bound} \
-                    elements long")
-        if isinstance(value, int):
-            value = str(value)
-        if len(value) > upper_bound:
-            raise TypeError(
-                f"max_value must be of type Int received type {type(value)}!")
+    _check_length_bounds(lower_bound, upper_bound)
+    if isinstance(value, int):
+        value = str(value)
+    if upper_bound is not None and len(value) > upper_bound:
+        raise ValueError(
+            f"List of Elements <'{value}'> is too long must be at most {upper_bound} \
+                elements long")
 
-    if lower_bound is not None:
-        if not isinstance(lower_bound, int):
-            raise TypeError(
-                f"min_value must be of type Int, received type {type(value)}!")
-        if lower_bound < 0:
-            raise ValueError(
-                f"minsize '{lower_bound}' is negative which is not allowed as a lower bound"
-            )
-        if len(value) < lower_bound:
-            raise ValueError(
-                f"List of Elements '{value}' is too short must at least {lower_bound}\
-                      elements long")
+    if lower_bound is not None and len(value) < lower_bound:
+        raise ValueError(
+            f"List of Elements '{value}' is too short must at least {lower_bound}\
+                  elements long")
     return
 
 
-def is_in(value: str, value_list: list) -> None:
-    if value in value_list:
-        return
-    else:
-        raise ValueError(
-            f"Value <{value}> is not a included in {value_list}")
+@prepare_arguments(value_list=_as_lookup)
+def is_in(value: str, value_list: Collection) -> None:
+    """checks if the value is one of the allowed values, a value_list passed to an
+    ArgFunctionWrapper as keyword is turned into a frozenset once when the wrapper is created
+
+    Args:
+        value (str): value to check
+        value_list (Collection): allowed values
+
+    Raises:
+        ValueError: value is not allowed, only the first MAX_LISTED_VALUES allowed values are \
+            listed in the message
+    """
+    try:
+        if value in value_list:
+            return
+    except TypeError:
+        # unhashable value checked against a frozenset
+        pass
+    raise ValueError(f"Value <{value}> is not included in: {_listing(value_list)}")
 
 
 def is_optional_dir(value: pl.Path) -> str:
-    if value.is_dir() and value.exists():
+    kind = path_kind(value)
+    if kind is PathKind.DIR:
         return
-    elif value.is_file():
+    elif kind is PathKind.FILE:
         is_file_msg = f"{IS_FILE_MSG} {value}"
         raise NotADirectoryError(is_file_msg)
     missing_dir_msg = f"{DIR_MISSING_MSG} {value}"
+    # the missing ancestors are created as well and have to be looked up again
+    created = [value]
+    for parent in value.parents:
+        if path_kind(parent) is not PathKind.MISSING:
+            break
+        created.append(parent)
     value.mkdir(parents=True, exist_ok=True)
+    for path in created:
+        invalidate(path)
     return missing_dir_msg + "creating directory"
 
 
@@ -112,9 +290,10 @@ def is_dir(value: pl.Path) -> None:
     Raises:
         ValueError: path given is not a directory or  file does not exists
     """
-    if value.is_dir() and value.exists():
+    kind = path_kind(value)
+    if kind is PathKind.DIR:
         return
-    elif value.is_file():
+    elif kind is PathKind.FILE:
         is_file_msg = f"{IS_FILE_MSG} {value}"
         raise ValueError(is_file_msg)
 
@@ -123,9 +302,10 @@ def is_dir(value: pl.Path) -> None:
 
 
 def is_optional_file(value: pl.Path) -> str:
-    if value.is_file():
+    kind = path_kind(value)
+    if kind is PathKind.FILE:
         return
-    elif value.is_dir():
+    elif kind is PathKind.DIR:
         is_dir_msg = f"{IS_DIR_MSG} {value}"
         return is_dir_msg
     file_missing_msg = f"{FILE_MISSING_MSG} {value}"
@@ -143,15 +323,24 @@ def is_file(value: pl.Path) -> None:
         IsADirectoryError: expected file, but found a directory instead
         FileNotFoundError: file not found at given path
     """
-    if value.is_file():
+    kind = path_kind(value)
+    if kind is PathKind.FILE:
         return
-    elif value.is_dir():
+    elif kind is PathKind.DIR:
         is_dir_msg = f"{IS_DIR_MSG} {value}"
         raise IsADirectoryError(is_dir_msg)
     file_missing_msg = f"{FILE_MISSING_MSG} {value}"
     raise FileNotFoundError(file_missing_msg)
 
 
+def _is_divisible_batch(value: Sequence[int], divisor: int) -> np.ndarray:
+    if divisor == 0:
+        # the scalar function raises the ZeroDivisionError
+        return np.arange(min(len(value), 1))
+    return _failing(np.asarray(value) % divisor != 0)
+
+
+@batch_implementation(_is_divisible_batch)
 def is_divisible(value: int, divisor: int):
     if value % divisor == 0:
         return
@@ -1,6 +1,6 @@
 from typing import List
 
-from data_validation.function_wrappers import ArgFunctionWrapper, FunctionWrapper
+from data_validation.function_wrappers import ArgFunctionWrapper, CachedFunctionWrapper, FieldRef
 
 import sample.config as global_vars
 
@@ -40,9 +40,9 @@ def validate_email_precisely(value: str,
 Precise_Email_Validation = ArgFunctionWrapper(
     func=validate_email_precisely,
     value_kw="value",
-    # Pass attribute Name to refer to instance field
-    first_name="first_name",
-    last_name="last_name",
+    # Pass FieldRef to refer to instance field
+    first_name=FieldRef("first_name"),
+    last_name=FieldRef("last_name"),
     # Passing static arguments is also possible
     allowed_domains=allowed_domains)
 
@@ -52,6 +52,6 @@ Precise_Email_Validation_dynamic = ArgFunctionWrapper(
     # Pass attribute Name to refer to instance field
     first_name="first_name",
     last_name="last_name",
-    # Passing static arguments is also possible
-    allowed_domains=FunctionWrapper(dynamic_value_fct)
+    # Passing static arguments is also possible, the domains are fetched once per 5 minutes
+    allowed_domains=CachedFunctionWrapper(dynamic_value_fct, ttl=300)
 )
@@ -5,7 +5,7 @@ from typing import List, Tuple
 import pathlib as pl
 
 
-from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.function_wrappers import ArgFunctionWrapper, MemoizedArgFunctionWrapper
 import data_validation.init_loggers as log_util
 from data_validation.data_parsing import Container
 from data_validation.validation import (
@@ -17,6 +17,7 @@ from data_validation.validation import (
 from data_validation.validation_func import has_length, is_dir
 from sample.example_custom_validations import (
     email_Validation,
+    Precise_Email_Validation,
     Precise_Email_Validation_dynamic,
 )
 from sample.example_type_mapping import (
@@ -30,7 +31,9 @@ log_util.LoggingConfig.set_log_directory("./logs")
 default_date_handler = DefaultTypeHandler(
     source_type=str,
     dest_type=date,
-    casting_fct=ArgFunctionWrapper(_cast_from_str_to_date, dateformat="%Y/%m/%d"),
+    casting_fct=MemoizedArgFunctionWrapper(
+        _cast_from_str_to_date, dateformat="%Y/%m/%d", maxsize=4096
+    ),
 )
 
 special_date_handler = DefaultTypeHandler(
@@ -143,7 +146,14 @@ class PrecisePerson:
 
 
 @dataclass
-class Person_with_slots(Container):
+class Contact(Container):
+    first_name: str = Validator()
+    last_name: str = Validator()
+    email: str = Validator(validator_func=Precise_Email_Validation)
+
+
+@dataclass
+class Person_with_slots(Container, slots=True):
     first_name: str = Validator_Slotted()
 
     def __init__(self, first_name) -> None:
@@ -170,3 +180,27 @@ class Child(Person):
         validator_func=ArgFunctionWrapper(has_length, lower_bound=0, upper_bound=2),
         validation_scope=Scope.COLLECTION,
     )
+
+
+@dataclass
+class Slotted_Person(Container, slots=True):
+    first_name: str = validatorWithNone()
+    last_name: str = defaultValidator()
+    date_of_birth: date = date_Validator()
+    occupation: Occupations = defaultValidator()
+    gender: Gender = defaultValidator()
+    hobbies: List[str] = commaSeparatedValidator()
+    person_id: int = defaultValidator()
+    is_smoker: bool = defaultValidator()
+    email: str = emailValidator()
+    weight: float = Validator(default=80.0)
+
+
+@dataclass
+class Slotted_Child(Slotted_Person):
+    occupation: Occupations = Validator(allow_none=True)
+    school_attendance: bool = Validator()
+    parents: Tuple[UnPrecisePerson] = Validator(
+        validator_func=ArgFunctionWrapper(has_length, lower_bound=0, upper_bound=2),
+        validation_scope=Scope.COLLECTION,
+    )
@@ -1,13 +1,18 @@
 from datetime import date, datetime
-from typing import List
+from typing import List, Tuple
 import pathlib as pl
 
+import pandas as pd
+
+from data_validation.datetime_parsing import parse_datetime
 from data_validation.decorators import apply_casting
+from data_validation.filesystem import rglob
+from data_validation.frame_validation import register_column_cast
 
 
 @apply_casting
 def _cast_from_str_to_date(inp: str, dateformat: str) -> date:
-    return datetime.strptime(inp, dateformat).date()
+    return parse_datetime(inp, dateformat).date()
 
 
 @apply_casting
@@ -17,7 +22,7 @@ def _cast_to_datetime_from_int(inp: int) -> date:
 
 @apply_casting
 def _cast_from_path_pattern_to_list(inp: str, folder: pl.Path) -> List[pl.Path]:
-    resolved_paths = list(folder.rglob(inp))
+    resolved_paths = rglob(folder, inp)
     if not resolved_paths:
         raise ValueError(
             f"No files found match the pattern {inp} inside folder {folder}"
@@ -28,3 +33,13 @@ def _cast_from_path_pattern_to_list(inp: str, folder: pl.Path) -> List[pl.Path]:
 @apply_casting
 def split_str(inp: str, delimiter: str) -> List[str]:
     return inp.split(delimiter)
+
+
+def _cast_column_from_str_to_date(
+    column: pd.Series, dateformat: str
+) -> Tuple[pd.Series, pd.Series]:
+    casted = pd.to_datetime(column, format=dateformat, errors="coerce")
+    return casted.dt.date, casted.isna()
+
+
+register_column_cast(_cast_from_str_to_date, _cast_column_from_str_to_date)
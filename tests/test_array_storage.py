@@ -0,0 +1,72 @@
+import array
+from dataclasses import dataclass
+from typing import List, Tuple
+from unittest import TestCase
+import numpy as np
+from data_validation.data_parsing import Container
+from data_validation.exceptions import CastException
+from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.validation import Storage, Validator, get_field_plan
+from data_validation.validation_func import is_between
+
+
+@dataclass
+class Telemetry(Container):
+    device: str = Validator()
+    readings: List[float] = Validator(
+        validator_func=ArgFunctionWrapper(is_between, value_range=(-50.0, 50.0)),
+        storage="array",
+    )
+    counts: List[int] = Validator(storage=Storage.PYARRAY)
+
+
+class Test_Array_Storage(TestCase):
+    RECORD = {"device": "probe", "readings": [1.5, -2, 3.25], "counts": [1, 2, 3]}
+
+    def test_bulk_cast(self):
+        telemetry = Telemetry(**self.RECORD)
+        self.assertIsInstance(telemetry.readings, np.ndarray)
+        self.assertEqual(telemetry.readings.dtype, np.float64)
+        self.assertEqual(telemetry.readings.tolist(), [1.5, -2.0, 3.25])
+        self.assertIsInstance(telemetry.counts, array.array)
+        self.assertEqual(telemetry.counts.typecode, "q")
+        self.assertEqual(list(telemetry.counts), [1, 2, 3])
+
+    def test_arrays_as_input(self):
+        telemetry = Telemetry(
+            device="probe", readings=np.arange(5, dtype=np.int32), counts=np.array([4, 5])
+        )
+        self.assertEqual(telemetry.readings.dtype, np.float64)
+        self.assertEqual(list(telemetry.counts), [4, 5])
+
+    def test_items_casted_like_lists(self):
+        telemetry = Telemetry(device="probe", readings=["1.5", 2], counts=["7"])
+        self.assertEqual(telemetry.readings.tolist(), [1.5, 2.0])
+        self.assertEqual(list(telemetry.counts), [7])
+        with self.assertRaises(CastException):
+            Telemetry(device="probe", readings=[1.0], counts=[2**70])
+
+    def test_vectorized_validation(self):
+        readings = np.zeros(10_000)
+        readings[123] = 60.0
+        with self.assertRaisesRegex(ValueError, "first at index 123"):
+            Telemetry(device="probe", readings=readings, counts=[])
+
+    def test_export(self):
+        telemetry = Telemetry(**self.RECORD)
+        self.assertEqual(telemetry.as_dict()["readings"], [1.5, -2.0, 3.25])
+        self.assertEqual(telemetry.as_dict()["counts"], [1, 2, 3])
+        self.assertEqual(telemetry.as_flattened_dict()["readings"], "1.5,-2.0,3.25")
+        self.assertEqual(telemetry.as_flattened_dict()["counts"], "1,2,3")
+        self.assertEqual(
+            telemetry.dataclass_dict_repr(),
+            {"device": "probe", "readings": [1.5, -2.0, 3.25], "counts": [1, 2, 3]},
+        )
+
+    def test_unsupported_annotation(self):
+        @dataclass
+        class Broken(Container):
+            labels: Tuple[int] = Validator(storage="array")
+
+        with self.assertRaises(TypeError):
+            get_field_plan(Broken)
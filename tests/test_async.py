@@ -0,0 +1,92 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List
+from unittest import IsolatedAsyncioTestCase
+from data_validation.batch import RecordError
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper, FieldRef, FunctionWrapper
+from data_validation.validation import Validator
+
+_running = 0
+max_running = 0
+
+
+async def fetch_domains() -> List[str]:
+    # stub of a lookup against a database or service
+    await asyncio.sleep(0)
+    return ["gmail.com", "outlook.com"]
+
+
+async def validate_domain(value: str, allowed_domains: List[str]) -> None:
+    global _running, max_running
+    _running += 1
+    max_running = max(max_running, _running)
+    await asyncio.sleep(0.01)
+    _running -= 1
+    if value.split("@")[-1] not in allowed_domains:
+        raise ValueError(f"domain of <{value}> is not allowed")
+
+
+async def normalize(value: str) -> str:
+    await asyncio.sleep(0)
+    return value.lower()
+
+
+async def contains_name(value: str, name: str) -> None:
+    if name not in value:
+        raise ValueError(f"<{name}> missing from <{value}>")
+
+
+domain_validation = ArgFunctionWrapper(
+    validate_domain, allowed_domains=FunctionWrapper(fetch_domains)
+)
+
+
+@dataclass
+class Account(Container):
+    name: str = Validator(cleaning_func=ArgFunctionWrapper(normalize))
+    email: str = Validator(validator_func=domain_validation)
+    backup_email: str = Validator(
+        validator_func=domain_validation, default=None, allow_none=True
+    )
+    login: str = Validator(
+        validator_func=ArgFunctionWrapper(contains_name, name=FieldRef("name")),
+        default=None,
+        allow_none=True,
+    )
+
+
+class Test_Async(IsolatedAsyncioTestCase):
+    RECORD = {"name": "Doe", "email": "doe@gmail.com", "backup_email": "doe@outlook.com"}
+
+    def setUp(self) -> None:
+        global max_running
+        max_running = 0
+        return super().setUp()
+
+    async def test_acreate(self):
+        account = await Account.acreate(**self.RECORD, login="doe_94")
+        self.assertEqual(account.name, "doe")
+        self.assertEqual(account.email, "doe@gmail.com")
+        # independent fields are validated concurrently
+        self.assertEqual(max_running, 2)
+
+    async def test_invalid(self):
+        with self.assertRaises(ValueError):
+            await Account.acreate(**dict(self.RECORD, email="doe@spam.io"))
+        # the reference is resolved after the cleaning of name
+        with self.assertRaises(ValueError):
+            await Account.acreate(**self.RECORD, login="Doe_94")
+
+    async def test_acreate_many(self):
+        records = [self.RECORD, dict(self.RECORD, email="doe@spam.io"), self.RECORD]
+        results = await Account.acreate_many(records, max_concurrency=1)
+        self.assertIsInstance(results[0], Account)
+        self.assertIsInstance(results[1], RecordError)
+        self.assertEqual(results[1].index, 1)
+        self.assertIsInstance(results[2], Account)
+        self.assertEqual(max_running, 1)
+
+    def test_sync_construction_rejected(self):
+        with self.assertRaises(TypeError):
+            Account(**self.RECORD)
@@ -0,0 +1,38 @@
+import json
+from typing import List
+from unittest import TestCase
+from sample.example_dataclasses import Person
+from data_validation.batch import RecordError
+from tests import TEST_FILE_PATH
+
+
+class Test_Batch(TestCase):
+    PERSONS: List[dict]
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.PERSONS = json.load(file)["team"]
+        invalid = dict(self.PERSONS[0], is_smoker="maybe")
+        self.records = self.PERSONS * 4 + [invalid] + self.PERSONS
+        return super().setUp()
+
+    def _check_results(self, results):
+        self.assertEqual(len(results), len(self.records))
+        self.assertIsInstance(results[12], RecordError)
+        self.assertEqual(results[12].index, 12)
+        self.assertEqual(results[12].error_type, "CastException")
+        for result, record in zip(results[:12], self.records):
+            self.assertIsInstance(result, Person)
+            self.assertEqual(result.person_id, record["person_id"])
+
+    def test_serial(self):
+        self._check_results(Person.validate_many(self.records, workers=1))
+
+    def test_process_pool(self):
+        self._check_results(Person.validate_many(self.records, workers=2, chunksize=5))
+
+    def test_without_build(self):
+        results = Person.validate_many(self.records, workers=2, build=False)
+        self.assertEqual(
+            [i for i, r in enumerate(results) if r is not None], [12]
+        )
@@ -0,0 +1,110 @@
+import random
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper
+from data_validation.validation import Validator
+from data_validation.validation_func import has_length, is_between, is_divisible, is_positive
+
+
+@dataclass
+class Sensor(Container):
+    readings: List[float] = Validator(
+        validator_func=ArgFunctionWrapper(is_between, value_range=(-50.0, 50.0))
+    )
+    counts: List[int] = Validator(validator_func=ArgFunctionWrapper(is_divisible, divisor=2))
+    labels: List[str] = Validator(
+        validator_func=ArgFunctionWrapper(has_length, lower_bound=1, upper_bound=8)
+    )
+
+
+def _scalar_failures(func, values, **kwargs) -> List[int]:
+    failing = []
+    for index, value in enumerate(values):
+        try:
+            func(value, **kwargs)
+        except ValueError:
+            failing.append(index)
+    return failing
+
+
+class Test_Batch_Validation(TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.floats = [rng.uniform(-100, 100) for _ in range(1000)] + [float("nan")]
+        self.ints = [rng.randint(-1000, 1000) for _ in range(1000)] + [2**70]
+        self.labels = ["", "a" * 9, "sensor", 123456789]
+        return super().setUp()
+
+    def test_matches_scalar_functions(self):
+        cases = [
+            (is_between, self.floats, {"value_range": (-50.0, None)}),
+            (is_between, self.ints, {"value_range": (None, 10)}),
+            (is_between, self.floats, {"value_range": (-50.0, 50.0)}),
+            (is_positive, self.floats, {}),
+            (is_positive, self.ints, {}),
+            (is_divisible, self.ints, {"divisor": 3}),
+            (has_length, self.labels, {"lower_bound": 1, "upper_bound": 8}),
+        ]
+        for func, values, kwargs in cases:
+            with self.subTest(func=func.__name__, kwargs=kwargs):
+                wrapper = ArgFunctionWrapper(func, **kwargs)
+                self.assertTrue(wrapper.supports_batch)
+                self.assertEqual(
+                    list(wrapper.failing_indices(values)),
+                    _scalar_failures(func, values, **kwargs),
+                )
+
+    def test_valid_sequence(self):
+        sensor = Sensor(readings=[1.5] * 10_000, counts=[2, 4], labels=["a", "b"])
+        self.assertEqual(len(sensor.readings), 10_000)
+
+    def test_first_failing_index_reported(self):
+        readings = [0.0] * 100
+        readings[42] = readings[77] = 51.0
+        with self.assertRaisesRegex(ValueError, "2 of 100 items failed, first at index 42"):
+            Sensor(readings=readings, counts=[2], labels=["a"])
+        with self.assertRaisesRegex(ValueError, "too long"):
+            Sensor(readings=[0.0], counts=[2], labels=["a" * 9])
+
+    def test_scalar_function_only_called_for_failure(self):
+        wrapper = Sensor.__dataclass_fields__["readings"].default._validator_func
+        with patch.object(wrapper, "func", wraps=wrapper.func) as func:
+            func.batch_func = is_between.batch_func
+            Sensor(readings=[0.0] * 100, counts=[2], labels=["a"])
+            self.assertEqual(func.call_count, 0)
+            with self.assertRaises(ValueError):
+                Sensor(readings=[0.0] * 99 + [-51.0], counts=[2], labels=["a"])
+            self.assertEqual(func.call_count, 1)
+
+    def test_fallback_to_items(self):
+        # numpy can't compare the strings, the item-wise path raises the regular TypeError
+        wrapper = ArgFunctionWrapper(is_positive)
+        with self.assertRaises(TypeError):
+            wrapper.failing_indices(["a", 1])
+
+        @dataclass
+        class Labels(Container):
+            labels: List[str] = Validator(validator_func=wrapper)
+
+        with self.assertRaises(TypeError):
+            Labels(labels=["a", "b"])
+
+    def test_value_keyword(self):
+        wrapper = ArgFunctionWrapper(is_between, value_kw="value", value_range=(-50.0, 50.0))
+        self.assertEqual(
+            list(wrapper.failing_indices(self.floats)),
+            _scalar_failures(is_between, self.floats, value_range=(-50.0, 50.0)),
+        )
+
+        @dataclass
+        class Readings(Container):
+            readings: List[float] = Validator(validator_func=wrapper)
+
+        with patch.object(is_between, "batch_func", wraps=is_between.batch_func) as batch_func:
+            Readings(readings=[0.0] * 100)
+            with self.assertRaisesRegex(ValueError, "1 of 100 items failed, first at index 99"):
+                Readings(readings=[0.0] * 99 + [51.0])
+        self.assertEqual(batch_func.call_count, 2)
@@ -0,0 +1,54 @@
+import json
+import tempfile
+import pathlib as pl
+from contextlib import redirect_stdout
+from dataclasses import asdict
+from io import StringIO
+from unittest import TestCase
+
+from data_validation.bench import Case, compare, load_results, main, measure
+
+SUITE = "tests.test_bench"
+
+
+def cases():
+    return [Case("sum", lambda: sum(range(100)), items=100), Case("list", lambda: [0] * 1000)]
+
+
+class Test_Bench(TestCase):
+    def test_measure(self):
+        result = measure(Case("sum", lambda: sum(range(100)), items=100), min_time=0.01)
+        self.assertGreater(result.calls, 0)
+        self.assertLessEqual(result.p50, result.p90)
+        self.assertLessEqual(result.p90, result.p99)
+        self.assertAlmostEqual(result.throughput, 100 / result.mean)
+        list_result = measure(Case("list", lambda: [0] * 1000), min_time=0.01)
+        self.assertGreaterEqual(list_result.peak_memory, 8000)
+
+    def test_compare(self):
+        result = measure(Case("sum", lambda: sum(range(100))), min_time=0.01)
+        baseline = {"sum": asdict(result)}
+        self.assertEqual(compare([result], baseline, threshold=0.1), {})
+        baseline["sum"]["p50"] = result.p50 / 2
+        self.assertEqual(compare([result], baseline, threshold=0.1), {"sum": {"p50": 2.0}})
+        self.assertEqual(compare([result], baseline, threshold=1.5), {})
+        self.assertEqual(compare([result], {"other": baseline["sum"]}), {})
+
+    def test_save_and_compare_against_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pl.Path(directory) / "results.json"
+            with redirect_stdout(StringIO()):
+                exit_code = main(["--suite", SUITE, "--min-time", "0.01", "--output", str(path)])
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(set(load_results(path)), {"sum", "list"})
+
+            document = json.loads(path.read_text())
+            document["results"]["sum"]["p50"] /= 100
+            path.write_text(json.dumps(document))
+            with redirect_stdout(StringIO()) as output:
+                exit_code = main(
+                    ["--suite", SUITE, "-k", "sum", "--min-time", "0.01", "--baseline", str(path)]
+                )
+            self.assertEqual(exit_code, 1)
+            self.assertIn("REGRESSION", output.getvalue())
+            self.assertNotIn("list", output.getvalue())
@@ -0,0 +1,64 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+from data_validation.function_wrappers import ArgFunctionWrapper, CachedFunctionWrapper
+
+
+class Test_Cached_Function_Wrapper(TestCase):
+    def setUp(self) -> None:
+        self.calls = 0
+        self.now = 100.0
+        patcher = patch("data_validation.function_wrappers.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def fetch(self, suffix: str = "") -> list:
+        self.calls += 1
+        return [f"domain_{self.calls}{suffix}"]
+
+    def test_cached_until_expiry(self):
+        wrapper = CachedFunctionWrapper(self.fetch, ttl=10)
+        self.assertEqual(wrapper(), ["domain_1"])
+        self.now += 9
+        self.assertEqual(wrapper(), ["domain_1"])
+        self.now += 1
+        self.assertEqual(wrapper(), ["domain_2"])
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate(self):
+        wrapper = CachedFunctionWrapper(self.fetch, ".com", ttl=10)
+        self.assertEqual(wrapper(), ["domain_1.com"])
+        wrapper.invalidate()
+        self.assertEqual(wrapper(), ["domain_2.com"])
+
+    def test_resolved_once_as_argument(self):
+        outer = ArgFunctionWrapper(
+            lambda value, domains: value in domains,
+            domains=CachedFunctionWrapper(self.fetch, ttl=10),
+        )
+        for _ in range(5):
+            outer("domain_1")
+        self.assertEqual(self.calls, 1)
+
+    def test_background_refresh(self):
+        refreshed = threading.Event()
+
+        def fetch():
+            result = self.fetch()
+            if self.calls > 1:
+                refreshed.set()
+            return result
+
+        wrapper = CachedFunctionWrapper(fetch, ttl=10, background_refresh=True)
+        self.assertEqual(wrapper(), ["domain_1"])
+        self.now += 10
+        # the expired result is returned while the refresh runs in the background
+        self.assertEqual(wrapper(), ["domain_1"])
+        self.assertTrue(refreshed.wait(timeout=5))
+        for _ in range(100):
+            if wrapper() == ["domain_2"]:
+                break
+            time.sleep(0.01)
+        self.assertEqual(wrapper(), ["domain_2"])
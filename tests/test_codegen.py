@@ -0,0 +1,122 @@
+import json
+from dataclasses import dataclass, field
+from typing import List
+from unittest import TestCase
+
+from data_validation.codegen import compiled
+from data_validation.data_parsing import Container
+from data_validation.exceptions import CastException
+from data_validation.validation import Validator
+from sample.example_dataclasses import Child, Job_Position, Person, Slotted_Person
+from tests import TEST_FILE_PATH
+
+
+@compiled
+@dataclass
+class CompiledPerson(Person):
+    pass
+
+
+@compiled
+@dataclass
+class CompiledChild(Child):
+    pass
+
+
+@compiled
+@dataclass
+class CompiledJob_Position(Job_Position):
+    pass
+
+
+@compiled
+@dataclass
+class CompiledSlotted_Person(Slotted_Person):
+    pass
+
+
+class Test_Compiled(TestCase):
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            test_dict = json.load(file)
+        self.PERSON_DICT = test_dict["single_person"]
+        self.CHILD_DICT = test_dict["example_child"]
+        self.JOB_DICT = test_dict["job_position"]
+        return super().setUp()
+
+    def test_same_result_as_regular(self):
+        for regular_cls, compiled_cls, kwargs in (
+            (Person, CompiledPerson, self.PERSON_DICT),
+            (Child, CompiledChild, self.CHILD_DICT),
+            (Job_Position, CompiledJob_Position, self.JOB_DICT),
+            (Slotted_Person, CompiledSlotted_Person, self.PERSON_DICT),
+        ):
+            with self.subTest(cls=regular_cls.__name__):
+                self.assertTrue(hasattr(compiled_cls.__init__, "__compiled_source__"))
+                self.assertEqual(
+                    compiled_cls(**kwargs).as_dict(), regular_cls(**kwargs).as_dict()
+                )
+
+    def test_same_errors_as_regular(self):
+        for kwargs, exception in (
+            ({**self.PERSON_DICT, "email": "not an email"}, ValueError),
+            ({**self.PERSON_DICT, "person_id": "abc"}, TypeError),
+            ({**self.PERSON_DICT, "person_id": 4.5}, CastException),
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(exception) as regular:
+                    Person(**kwargs)
+                with self.assertRaises(exception) as fast:
+                    CompiledPerson(**kwargs)
+                self.assertEqual(
+                    str(fast.exception), str(regular.exception).replace("Person", "CompiledPerson")
+                )
+
+    def test_missing_argument(self):
+        kwargs = dict(self.PERSON_DICT)
+        del kwargs["first_name"]
+        with self.assertRaises(TypeError) as regular:
+            Person(**kwargs)
+        with self.assertRaises(TypeError) as fast:
+            CompiledPerson(**kwargs)
+        self.assertEqual(
+            str(fast.exception), str(regular.exception).replace("Person", "CompiledPerson")
+        )
+
+    def test_collect_errors_falls_back(self):
+        kwargs = {**self.PERSON_DICT, "email": "not an email", "person_id": "abc"}
+        regular = Person.build(errors="collect", **kwargs)
+        fast = CompiledPerson.build(errors="collect", **kwargs)
+        self.assertEqual(
+            [error.field for error in fast.errors], [error.field for error in regular.errors]
+        )
+        self.assertEqual(len(fast.errors), 2)
+
+    def test_assignment_is_validated(self):
+        person = CompiledPerson(**self.PERSON_DICT)
+        with self.assertRaises(ValueError):
+            person.email = "not an email"
+        with self.assertRaises(CastException):
+            person.person_id = 4.5
+        person.person_id = 42.0
+        self.assertEqual(person.person_id, 42)
+
+    def test_unsupported_classes(self):
+        with self.assertRaises(TypeError):
+            compiled(Person.__mro__[1])
+
+        with self.assertRaises(TypeError):
+
+            @compiled
+            @dataclass
+            class WithFactory(Container):
+                names: List[str] = field(default_factory=list)
+
+        @compiled
+        @dataclass
+        class WithPlainField(Container):
+            number: int = Validator()
+            note: str = "none"
+
+        self.assertEqual(WithPlainField(number=3.0).number, 3)
+        self.assertEqual(WithPlainField(number=3).note, "none")
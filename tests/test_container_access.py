@@ -0,0 +1,82 @@
+import json
+from dataclasses import dataclass
+from unittest import TestCase
+
+from data_validation.data_parsing import Container
+from data_validation.init_loggers import LoggingConfig
+from data_validation.validation import Validator
+from sample.example_dataclasses import Job_Position, Person, Slotted_Person
+from tests import TEST_FILE_PATH
+
+
+@dataclass
+class Settings(Container):
+    opts: dict = Validator()
+    retries: int = Validator(default=3)
+
+
+class Test_Container_Access(TestCase):
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            test_dict = json.load(file)
+        self.PERSON_DICT = test_dict["single_person"]
+        self.person = Person(**self.PERSON_DICT)
+        self.job = Job_Position(**test_dict["job_position"])
+        self.enabled = LoggingConfig._ENABLED
+        LoggingConfig.set_enabled(False)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        LoggingConfig.set_enabled(self.enabled)
+        return super().tearDown()
+
+    def test_matches_flattened_dict(self):
+        for instance in (self.person, self.job, Slotted_Person(**self.PERSON_DICT)):
+            with self.subTest(cls=type(instance).__name__):
+                flattened = instance.as_flattened_dict()
+                self.assertEqual(list(instance), list(flattened))
+                self.assertEqual(dict(instance.iter_flattened()), flattened)
+        # fields resolving to their default are left out like by as_flattened_dict
+        self.assertNotIn("weight", list(self.person))
+        self.assertEqual(len(list(self.person)), 9)
+
+    def test_positional_access(self):
+        keys = list(self.person)
+        for index, key in enumerate(keys):
+            self.assertEqual(self.person[index], key)
+        self.assertEqual(self.person[-1], keys[-1])
+        self.assertEqual(list(self.person[1:3]), keys[1:3])
+        with self.assertRaises(IndexError):
+            self.person[len(keys)]
+
+    def test_key_access(self):
+        flattened = self.person.as_flattened_dict()
+        for key, value in flattened.items():
+            self.assertEqual(self.person[key], value)
+        with self.assertRaises(KeyError):
+            self.person["unknown"]
+        with self.assertRaises(KeyError):
+            self.person["weight"]
+
+    def test_nested_container(self):
+        flattened = self.job.as_flattened_dict()
+        self.assertEqual(self.job[0], "Person_first_name")
+        self.assertEqual(self.job[7], "name")
+        for key, value in flattened.items():
+            self.assertEqual(self.job[key], value)
+        self.assertEqual(dict(self.job.iter_flattened())["name"], "manager")
+
+    def test_slotted(self):
+        person = Slotted_Person(**self.PERSON_DICT)
+        self.assertEqual(list(person), list(self.person))
+        self.assertEqual(dict(person.iter_flattened()), dict(self.person.iter_flattened()))
+
+    def test_dict_field(self):
+        settings = Settings(opts={"x": 1, "y": 2})
+        self.assertEqual(list(settings), list(settings.as_flattened_dict()))
+        self.assertEqual(settings["opts_x"], 1)
+        self.assertEqual(settings[1], "opts_y")
+        settings.retries = 5
+        settings.opts = {"z": 3}
+        self.assertEqual(list(settings), ["opts_z", "retries"])
+        self.assertEqual(settings["retries"], 5)
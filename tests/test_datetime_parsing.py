@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from data_validation.data_parsing import Container
+from data_validation.datetime_parsing import get_datetime_parser, parse_datetimes
+from data_validation.exceptions import CastException
+from data_validation.validation import Validator
+
+
+@dataclass
+class Schedule(Container):
+    appointments: List[datetime] = Validator()
+
+
+class Test_Datetime_Parsing(TestCase):
+    FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d.%m.%y", "%Y-%m-%d %H:%M:%S", "%d %b %Y")
+    SAMPLES = (
+        "2020-01-02",
+        "2020-1-2",
+        "2020-02-30",
+        "2020/01/02",
+        "01/02/2020",
+        "1/2/2020",
+        "02.01.69",
+        "2020-01-02 10:30:00",
+        "2020-01-02T10:30:00",
+        "2020-01-02 ",
+        "02 Jan 2020",
+        "invalid",
+    )
+
+    def test_equivalent_to_strptime(self):
+        for dateformat in self.FORMATS:
+            parser = get_datetime_parser(dateformat)
+            for sample in self.SAMPLES:
+                try:
+                    expected = datetime.strptime(sample, dateformat)
+                except ValueError:
+                    with self.assertRaises(ValueError, msg=(dateformat, sample)):
+                        parser(sample)
+                else:
+                    self.assertEqual(parser(sample), expected, msg=(dateformat, sample))
+
+    def test_parser_cached(self):
+        self.assertIs(get_datetime_parser("%m/%d/%Y"), get_datetime_parser("%m/%d/%Y"))
+
+    def test_batch(self):
+        values = ["2020/01/02", "2021/03/04", "2020/01/02"]
+        self.assertEqual(
+            parse_datetimes(values, "%Y/%m/%d"),
+            [datetime(2020, 1, 2), datetime(2021, 3, 4), datetime(2020, 1, 2)],
+        )
+
+    def test_list_field(self):
+        schedule = Schedule(appointments=["2020-01-02", "2021-03-04"])
+        self.assertEqual(schedule.appointments, [datetime(2020, 1, 2), datetime(2021, 3, 4)])
+        with self.assertRaises(CastException):
+            Schedule(appointments=["2020-01-02", "2021/03/04"])
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from data_validation.codegen import compiled
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper, FieldRef
+from data_validation.validation import Validator, get_field_plan
+from sample.example_custom_validations import Precise_Email_Validation
+
+CALLS = []
+
+
+def _is_below(value: int, upper: int) -> None:
+    CALLS.append(value)
+    if value >= upper:
+        raise ValueError(f"{value} is not below {upper}")
+
+
+@dataclass
+class EmailFirst(Container):
+    email: str = Validator(validator_func=Precise_Email_Validation)
+    first_name: str = Validator()
+    last_name: str = Validator()
+
+
+@dataclass
+class Limits(Container):
+    lower: int = Validator(
+        validator_func=ArgFunctionWrapper(_is_below, upper=FieldRef("upper"))
+    )
+    upper: int = Validator()
+    unrelated: int = Validator(default=0)
+
+
+@compiled
+@dataclass
+class CompiledEmailFirst(EmailFirst):
+    pass
+
+
+KWARGS = dict(email="john.doe@gmail.com", first_name="John", last_name="Doe")
+
+
+class Test_Dependencies(TestCase):
+    def setUp(self) -> None:
+        CALLS.clear()
+        return super().setUp()
+
+    def test_graph(self):
+        plan = get_field_plan(EmailFirst)
+        self.assertEqual(plan.construction_order, ("first_name", "last_name", "email"))
+        self.assertTrue(plan.reorders)
+        self.assertEqual(plan.fields["email"].waits_for, ("first_name", "last_name"))
+        self.assertEqual(plan.fields["first_name"].dependents, ("email",))
+        self.assertEqual(plan.fields["first_name"].releases, ("email",))
+        self.assertEqual(get_field_plan(Limits).fields["unrelated"].dependents, ())
+
+    def test_construction_order(self):
+        for cls in (EmailFirst, CompiledEmailFirst):
+            with self.subTest(cls=cls.__name__):
+                instance = cls(**KWARGS)
+                self.assertEqual(instance.email, KWARGS["email"])
+                with self.assertRaises(ValueError):
+                    cls(**{**KWARGS, "first_name": "Jane"})
+                report = cls.build(errors="collect", **{**KWARGS, "first_name": "Jane"})
+                self.assertEqual([error.field for error in report.errors], ["email"])
+        self.assertTrue(EmailFirst.check(KWARGS).valid)
+        self.assertFalse(EmailFirst.check({**KWARGS, "last_name": "Fox"}).valid)
+
+    def test_dependents_validated_on_assignment(self):
+        limits = Limits(lower=1, upper=5)
+        self.assertEqual(CALLS, [1])
+        limits.unrelated = 3
+        self.assertEqual(CALLS, [1])
+        limits.upper = 4
+        self.assertEqual(CALLS, [1, 1])
+        with self.assertRaises(ValueError):
+            limits.upper = 1
+        # the failed assignment is undone
+        self.assertEqual(limits.upper, 4)
+
+    def test_deferred_revalidation(self):
+        limits = Limits(lower=1, upper=5)
+        with limits.deferred_revalidation():
+            limits.lower = 7
+            limits.upper = 10
+            self.assertEqual(CALLS, [1])
+        self.assertEqual(CALLS, [1, 7])
+        with self.assertRaises(ValueError):
+            with limits.deferred_revalidation():
+                limits.upper = 2
+        self.assertEqual(limits.upper, 2)
+
+    def test_revalidate(self):
+        limits = Limits(lower=1, upper=5)
+        limits.revalidate()
+        self.assertEqual(CALLS, [1, 1])
+        with limits.deferred_revalidation():
+            limits.unrelated = 2
+            limits.revalidate(dirty_only=True)
+            self.assertEqual(CALLS, [1, 1])
+            limits.upper = 6
+            limits.revalidate(dirty_only=True)
+            self.assertEqual(CALLS, [1, 1, 1])
+        # nothing is left to validate once the block is left
+        self.assertEqual(CALLS, [1, 1, 1])
@@ -0,0 +1,52 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+import pandas as pd
+from sample.example_dataclasses import Contact, Person
+from data_validation.report import Stage, ValidationReport
+from tests import TEST_CSV_PATH, TEST_FILE_PATH
+
+
+class Test_Dry_Run(TestCase):
+    TEST_DICT: dict
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.TEST_DICT = json.load(file)["single_person"]
+        return super().setUp()
+
+    def test_matches_static_validation(self):
+        for row in pd.read_csv(TEST_CSV_PATH).to_dict(orient="records"):
+            self.assertEqual(
+                Person.check(row).valid, Person.static_validation(**row) == "Success"
+            )
+
+    def test_no_instance_created(self):
+        with patch.object(Person, "__post_init__") as post_init:
+            report = Person.check(self.TEST_DICT)
+        self.assertTrue(report.valid)
+        self.assertIsNone(report.instance)
+        post_init.assert_not_called()
+
+    def test_errors(self):
+        mapping = dict(self.TEST_DICT, person_id="x", unknown=1)
+        del mapping["last_name"]
+        report = Person.check(mapping)
+        self.assertEqual(
+            [(error.field, error.stage) for error in report.errors],
+            [(None, Stage.INIT), ("last_name", Stage.DEFAULT), ("person_id", Stage.CAST)],
+        )
+
+    def test_failed_referenced_fields(self):
+        for mapping, first_name_stage in (
+            ({"first_name": 123, "last_name": "Doe", "email": "x@y.de"}, Stage.CAST),
+            ({"first_name": None, "last_name": "Doe", "email": "x@y.de"}, Stage.DEFAULT),
+            ({"last_name": "Doe", "email": "x@y.de"}, Stage.DEFAULT),
+        ):
+            with self.subTest(mapping=mapping):
+                report = Contact.check(mapping)
+                self.assertIsInstance(report, ValidationReport)
+                self.assertEqual(
+                    [(error.field, error.stage) for error in report.errors],
+                    [("first_name", first_name_stage), ("email", Stage.VALIDATE)],
+                )
@@ -0,0 +1,75 @@
+import json
+from unittest import TestCase
+from sample.example_dataclasses import Contact, Person
+from data_validation.report import Stage, ValidationReport
+from tests import TEST_FILE_PATH
+
+
+class Test_Error_Report(TestCase):
+    TEST_DICT: dict
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.TEST_DICT = json.load(file)["single_person"]
+        return super().setUp()
+
+    def test_valid(self):
+        report = Person.build(errors="collect", **self.TEST_DICT)
+        self.assertTrue(report.valid)
+        self.assertIsInstance(report.instance, Person)
+        self.assertEqual(str(Person.static_validation(errors="collect", **self.TEST_DICT)), "Success")
+
+    def test_all_fields_reported(self):
+        kwargs = {
+            **self.TEST_DICT,
+            "last_name": None,
+            "date_of_birth": "1994-04-23",
+            "person_id": "x",
+            "email": "invalid",
+        }
+        report = Person.static_validation(errors="collect", **kwargs)
+        self.assertIsInstance(report, ValidationReport)
+        self.assertIsNone(report.instance)
+        self.assertEqual(
+            [(error.field, error.stage) for error in report.errors],
+            [
+                ("last_name", Stage.DEFAULT),
+                ("date_of_birth", Stage.CAST),
+                ("person_id", Stage.CAST),
+                ("email", Stage.VALIDATE),
+            ],
+        )
+        self.assertEqual(report.errors[2].error_type, "TypeError")
+        self.assertEqual(report.errors[2].raw_value, "x")
+
+    def test_init_error(self):
+        report = Person.build(errors="collect", unknown=1, **self.TEST_DICT)
+        self.assertEqual(report.errors[0].stage, Stage.INIT)
+        self.assertIsNone(report.errors[0].field)
+
+    def test_raise_mode_unchanged(self):
+        with self.assertRaises(TypeError):
+            Person.build(**{**self.TEST_DICT, "person_id": "x"})
+        with self.assertRaises(ValueError):
+            Person.build(errors="ignore", **self.TEST_DICT)
+
+    def test_invalid_referenced_field(self):
+        report = Contact.build(
+            errors="collect", first_name=123, last_name="Doe", email="john.doe@gmail.com"
+        )
+        self.assertEqual(
+            [(error.field, error.stage) for error in report.errors],
+            [("first_name", Stage.CAST), ("email", Stage.VALIDATE)],
+        )
+        self.assertIn("['first_name']", report.errors[1].message)
+
+    def test_missing_referenced_field(self):
+        report = Contact.build(errors="collect", last_name="Doe", email="x@y.de")
+        self.assertEqual(
+            [(error.field, error.stage) for error in report.errors],
+            [("first_name", Stage.DEFAULT), ("email", Stage.VALIDATE)],
+        )
+        valid = Contact.build(
+            errors="collect", first_name="John", last_name="Doe", email="john.doe@gmail.com"
+        )
+        self.assertTrue(valid.valid)
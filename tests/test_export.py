@@ -0,0 +1,78 @@
+import json
+from unittest import TestCase
+
+import pandas as pd
+
+from data_validation.data_parsing import Container, get_export_plan
+from data_validation.init_loggers import LoggingConfig
+from sample.example_dataclasses import Child, Job_Position, Person, Slotted_Person
+from tests import TEST_FILE_PATH
+
+
+class Test_Export(TestCase):
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            test_dict = json.load(file)
+        self.persons = [
+            Person(**{**test_dict["single_person"], "person_id": index}) for index in range(5)
+        ]
+        self.child = Child(**test_dict["example_child"])
+        self.job = Job_Position(**test_dict["job_position"])
+        self.enabled = LoggingConfig._ENABLED
+        # the Child holds a date which is logged as unsupported by as_flattened_dict
+        LoggingConfig.set_enabled(False)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        LoggingConfig.set_enabled(self.enabled)
+        return super().tearDown()
+
+    def test_plan_is_cached_per_class(self):
+        self.assertIs(get_export_plan(Person), get_export_plan(Person))
+        self.assertIsNot(get_export_plan(Child), get_export_plan(Person))
+        self.assertEqual(get_export_plan(Person).prefixed_key("name"), "Person_name")
+
+    def test_nested_container(self):
+        flattened = self.job.as_flattened_dict()
+        self.assertEqual(flattened["Person_first_name"], "John")
+        self.assertEqual(flattened["name"], "manager")
+        self.assertEqual(self.job.as_dict()["occupied_by"]["first_name"], "John")
+
+    def test_to_records(self):
+        instances = self.persons + [self.child, self.job]
+        self.assertEqual(
+            Container.to_records(instances),
+            [instance.as_flattened_dict() for instance in instances],
+        )
+        self.assertEqual(
+            Person.to_records(instances, flat=False),
+            [instance.as_dict() for instance in instances],
+        )
+
+    def test_to_frame(self):
+        for instances in (self.persons, self.persons + [self.child]):
+            with self.subTest(count=len(instances)):
+                expected = pd.DataFrame([instance.as_flattened_dict() for instance in instances])
+                frame = Person.to_frame(instances)
+                pd.testing.assert_frame_equal(frame.fillna(-1), expected.fillna(-1))
+        frame = Person.to_frame(self.persons, columns=["person_id", "first_name"])
+        self.assertEqual(list(frame.columns), ["person_id", "first_name"])
+        self.assertEqual(frame["person_id"].tolist(), list(range(5)))
+        self.assertTrue(Person.to_frame([]).empty)
+
+    def test_iter_rows(self):
+        rows = list(Person.iter_rows(self.persons + [self.child]))
+        columns = list(self.persons[0].as_flattened_dict())
+        self.assertEqual(rows[0], tuple(self.persons[0].as_flattened_dict().values()))
+        self.assertEqual(len(rows[-1]), len(columns))
+        self.assertEqual(rows[-1][columns.index("first_name")], "Jule")
+        rows = Person.iter_rows(self.persons, columns=["person_id", "unknown"])
+        self.assertEqual(next(rows), (0, None))
+
+    def test_slotted(self):
+        with TEST_FILE_PATH.open() as file:
+            person = Slotted_Person(**{**json.load(file)["single_person"], "person_id": 3})
+        self.assertEqual(
+            Slotted_Person.to_records([person]), [self.persons[3].as_flattened_dict()]
+        )
+        self.assertEqual(person.as_dict(), self.persons[3].as_dict())
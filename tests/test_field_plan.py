@@ -0,0 +1,82 @@
+import json
+import numpy as np
+from unittest import TestCase
+from sample.example_dataclasses import Child, Person, PrecisePerson
+from data_validation.validation import CastStep, get_field_plan
+from tests import TEST_FILE_PATH
+
+
+class Test_Field_Plan(TestCase):
+    TEST_DICT: dict
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.TEST_DICT = json.load(file)["single_person"]
+        return super().setUp()
+
+    def test_plan_is_cached(self):
+        Person(**self.TEST_DICT)
+        plan = get_field_plan(Person)
+        Person(**self.TEST_DICT)
+        self.assertIs(plan, get_field_plan(Person))
+
+    def test_annotations_not_mutated(self):
+        own_annotations = dict(Child.__dict__["__annotations__"])
+        with TEST_FILE_PATH.open() as file:
+            Child(**json.load(file)["example_child"])
+        self.assertEqual(own_annotations, Child.__dict__["__annotations__"])
+
+    def test_inherited_fields(self):
+        child_plan = get_field_plan(Child)
+        self.assertIn("first_name", child_plan.fields)
+        self.assertIn("school_attendance", child_plan.fields)
+        self.assertIsNot(
+            child_plan.fields["occupation"].validator,
+            get_field_plan(Person).fields["occupation"].validator,
+        )
+
+    def test_generic_field(self):
+        field = get_field_plan(Person).fields["hobbies"]
+        self.assertIs(field.origin, list)
+        self.assertIs(field.sub_annotated_type, str)
+
+    def test_cast_step_memoized(self):
+        field = get_field_plan(Person).fields["person_id"]
+        step = field.resolve_cast(float, False)
+        self.assertIs(step[0], CastStep.MAPPED)
+        self.assertIs(step, field.resolve_cast(float, False))
+        self.assertIs(field.resolve_cast(str, False)[0], CastStep.MISMATCH)
+
+    def test_cast_step_resolved_through_bases(self):
+        field = get_field_plan(Person).fields["person_id"]
+        self.assertEqual(field.resolve_cast(np.int64, False), (CastStep.COERCE, int))
+        self.assertIs(field.resolve_cast(np.float64, False)[0], CastStep.MAPPED)
+        self.assertIs(field.resolve_cast(bool, False)[0], CastStep.MISMATCH)
+        weight = get_field_plan(Person).fields["weight"]
+        self.assertIs(weight.resolve_cast(np.int32, False)[0], CastStep.MAPPED)
+        is_smoker = get_field_plan(Person).fields["is_smoker"]
+        self.assertEqual(is_smoker.resolve_cast(np.bool_, False), (CastStep.COERCE, bool))
+        self.assertIs(field.resolve_cast(np.bool_, False)[0], CastStep.MISMATCH)
+
+    def test_numpy_scalars(self):
+        kwargs = {
+            **self.TEST_DICT,
+            "person_id": np.int64(7),
+            "weight": np.float32(72.5),
+            "is_smoker": np.bool_(True),
+            "email": np.nan,
+        }
+        person = Person(**kwargs)
+        self.assertIs(type(person.person_id), int)
+        self.assertIs(person.is_smoker, True)
+        self.assertEqual(person.weight, 72.5)
+        self.assertIsNone(person.email)
+        with self.assertRaises(ValueError):
+            Person(**{**kwargs, "last_name": np.nan})
+
+    def test_plain_dataclass(self):
+        self.assertIn("email", get_field_plan(PrecisePerson).fields)
+
+    def test_many_instances(self):
+        for _ in range(2000):
+            Person(**self.TEST_DICT)
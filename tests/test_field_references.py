@@ -0,0 +1,96 @@
+import json
+from dataclasses import dataclass
+from unittest import TestCase
+from sample.example_custom_validations import Precise_Email_Validation
+from sample.example_dataclasses import PrecisePerson
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper, FieldRef
+from data_validation.validation import Validator, get_field_plan
+from data_validation.validation_func import is_between, is_in
+from tests import TEST_FILE_PATH
+
+
+@dataclass
+class Contact(Container):
+    first_name: str = Validator()
+    last_name: str = Validator()
+    email: str = Validator(validator_func=Precise_Email_Validation)
+
+
+@dataclass
+class Measurement(Container):
+    lower: int = Validator()
+    value: int = Validator(
+        validator_func=ArgFunctionWrapper(is_between, value_range=("lower", None))
+    )
+
+
+@dataclass
+class Pipeline(Container):
+    stage: str = Validator(
+        validator_func=ArgFunctionWrapper(is_in, value_list=["build", "test", "deploy", "check"])
+    )
+
+
+class Test_Field_References(TestCase):
+    TEST_DICT: dict
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.TEST_DICT = json.load(file)["single_person"]
+        return super().setUp()
+
+    def test_legacy_string_references(self):
+        references = get_field_plan(PrecisePerson).fields["email"].validator_func.references
+        self.assertEqual(
+            references,
+            {"first_name": FieldRef("first_name"), "last_name": FieldRef("last_name")},
+        )
+
+    def test_explicit_references(self):
+        contact = Contact(first_name="John", last_name="Doe", email="john.doe@gmail.com")
+        with self.assertRaises(ValueError):
+            contact.email = "jane.doe@gmail.com"
+        # the email is validated again and doesn't match the new name
+        with self.assertRaises(ValueError):
+            contact.first_name = "Jane"
+        self.assertEqual(contact.first_name, "John")
+        with contact.deferred_revalidation():
+            contact.first_name = "Jane"
+            contact.email = "jane.doe@gmail.com"
+        self.assertEqual(contact.email, "jane.doe@gmail.com")
+
+    def test_reference_inside_sequence(self):
+        Measurement(lower=2, value=3)
+        with self.assertRaises(ValueError):
+            Measurement(lower=4, value=3)
+        references = get_field_plan(Measurement).fields["value"].validator_func.references
+        self.assertEqual(references, {"value_range": (FieldRef("lower"), None)})
+
+    def test_unknown_reference(self):
+        @dataclass
+        class Broken(Container):
+            email: str = Validator(
+                validator_func=ArgFunctionWrapper(
+                    lambda value, other: None, other=FieldRef("missing")
+                )
+            )
+
+        with self.assertRaises(AttributeError):
+            get_field_plan(Broken)
+
+    def test_static_arguments_not_copied(self):
+        field = get_field_plan(Contact).fields["email"]
+        allowed_domains = Precise_Email_Validation.kwargs["allowed_domains"]
+        contact = Contact(first_name="John", last_name="Doe", email="john.doe@gmail.com")
+        bound = field.validator_func.resolve(contact)
+        self.assertIs(bound.kwargs["allowed_domains"], allowed_domains)
+        self.assertEqual(bound.kwargs["first_name"], "John")
+
+    def test_strings_matching_attributes_are_no_references(self):
+        self.assertEqual(get_field_plan(Pipeline).fields["stage"].validator_func.references, {})
+        for stage in ("build", "check", "deploy"):
+            self.assertEqual(Pipeline(stage=stage).stage, stage)
+        with self.assertRaises(ValueError) as context:
+            Pipeline(stage="release")
+        self.assertNotIn("bound method", str(context.exception))
@@ -0,0 +1,87 @@
+import os
+import pathlib as pl
+import tempfile
+from contextlib import nullcontext
+from unittest import TestCase
+from unittest.mock import patch
+
+import data_validation.filesystem as filesystem
+from data_validation.filesystem import DirectoryIndex, PathKind, path_kind, rglob, stat_cache
+from data_validation.validation_func import is_dir, is_file, is_optional_dir
+
+
+class Test_Stat_Cache(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = pl.Path(tmp.name)
+        (self.root / "sub" / "deep").mkdir(parents=True)
+        self.files = [self.root / f"file_{i}.txt" for i in range(5)]
+        self.files += [self.root / "sub" / "a.csv", self.root / "sub" / "deep" / "b.txt"]
+        for file in self.files:
+            file.touch()
+        return super().setUp()
+
+    def test_kinds(self):
+        for cached in (False, True):
+            with stat_cache() if cached else nullcontext():
+                self.assertIs(path_kind(self.files[0]), PathKind.FILE)
+                self.assertIs(path_kind(self.root / "sub"), PathKind.DIR)
+                self.assertIs(path_kind(self.root / "missing.txt"), PathKind.MISSING)
+                self.assertIs(path_kind(self.files[0] / "below_file"), PathKind.MISSING)
+
+    def test_directory_scanned_once(self):
+        with patch.object(filesystem.os, "stat", wraps=os.stat) as stat, patch.object(
+            filesystem.os, "scandir", wraps=os.scandir
+        ) as scandir:
+            with stat_cache():
+                for _ in range(3):
+                    for file in self.files[:5]:
+                        is_file(file)
+        # first file by stat, the rest of the folder by a single listing
+        self.assertEqual(stat.call_count, 1)
+        self.assertEqual(scandir.call_count, 1)
+
+    def test_validators(self):
+        with stat_cache():
+            is_file(self.files[0])
+            is_dir(self.root / "sub")
+            with self.assertRaises(IsADirectoryError):
+                is_file(self.root / "sub")
+            with self.assertRaises(FileNotFoundError):
+                is_file(self.root / "missing.txt")
+            with self.assertRaises(ValueError):
+                is_dir(self.files[0])
+
+    def test_created_dir_invalidated(self):
+        new_dir = self.root / "new"
+        with stat_cache():
+            self.assertIs(path_kind(new_dir), PathKind.MISSING)
+            self.assertIsNotNone(is_optional_dir(new_dir))
+            self.assertIs(path_kind(new_dir), PathKind.DIR)
+            is_dir(new_dir)
+
+    def test_created_parents_invalidated(self):
+        parent = self.root / "a"
+        new_dir = parent / "b" / "c"
+        with stat_cache():
+            self.assertIs(path_kind(parent), PathKind.MISSING)
+            self.assertIs(path_kind(parent / "b"), PathKind.MISSING)
+            is_optional_dir(new_dir)
+            self.assertIs(path_kind(parent), PathKind.DIR)
+            self.assertIs(path_kind(parent / "b"), PathKind.DIR)
+            is_dir(parent)
+
+    def test_rglob_matches_pathlib(self):
+        index = DirectoryIndex(self.root)
+        for pattern in ("*.txt", "*", "deep/*.txt", "sub/*", "*.csv", "file_[0-2].txt"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(set(index.rglob(pattern)), set(self.root.rglob(pattern)))
+
+    def test_rglob_cached(self):
+        with stat_cache() as cache:
+            self.assertEqual(len(rglob(self.root, "*.txt")), 6)
+            (self.root / "late.txt").touch()
+            self.assertEqual(len(rglob(self.root, "*.txt")), 6)
+            cache.invalidate(self.root / "late.txt")
+            self.assertEqual(len(rglob(self.root, "*.txt")), 7)
@@ -25,3 +25,9 @@ class Test_Altering(TestCase):
     def test_added_attr(self):
         with self.assertRaises(CastException):
             self.person.school_attendance = "abc"
+
+    def test_tuple_field_as_dict(self):
+        self.assertIsInstance(self.person.parents, tuple)
+        parents = self.person.as_dict()["parents"]
+        self.assertIsInstance(parents, list)
+        self.assertEqual(parents, list(self.person.parents))
@@ -0,0 +1,53 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+import data_validation.init_loggers as log_util
+from data_validation.exceptions import CastException
+from sample.example_dataclasses import Person
+from tests import TEST_FILE_PATH
+
+
+class Test_Logging(TestCase):
+    TEST_DICT: dict
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.TEST_DICT = json.load(file)["single_person"]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        log_util.LoggingConfig.set_enabled(True)
+        return super().tearDown()
+
+    def test_logger_shared_per_class(self):
+        first, second = Person(**self.TEST_DICT), Person(**self.TEST_DICT)
+        self.assertIs(first.logger, second.logger)
+        self.assertEqual(first.logger.name, "Person")
+        self.assertNotIn("logger", first.__dict__)
+        self.assertIs(log_util.get_logger(), log_util.get_logger())
+
+    def test_invalid_value_logged(self):
+        with self.assertLogs(level="ERROR") as logs:
+            with self.assertRaises(CastException):
+                Person(**dict(self.TEST_DICT, occupation="Astronaut"))
+        self.assertIn("Astronaut", logs.output[0])
+
+    def test_disabled(self):
+        log_util.LoggingConfig.set_enabled(False)
+        with patch.object(log_util, "get_logger") as get_logger:
+            with self.assertRaises(CastException):
+                Person(**dict(self.TEST_DICT, occupation="Astronaut"))
+        get_logger.assert_not_called()
+
+    def test_disabled_messages_not_formatted(self):
+        class Message:
+            formatted = 0
+
+            def __str__(self):
+                Message.formatted += 1
+                return "message"
+
+        validator = Person.__dict__["first_name"]
+        log_util.LoggingConfig.set_enabled(False)
+        validator._log_validation_msgs([Message(), Message()])
+        self.assertEqual(Message.formatted, 0)
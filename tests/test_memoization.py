@@ -0,0 +1,58 @@
+import copy
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from data_validation.data_casting_func import _cast_str_to_datetime
+from data_validation.exceptions import CastException
+from data_validation.function_wrappers import MemoizedArgFunctionWrapper
+from data_validation.validation import DefaultTypeHandler
+from sample.example_type_mapping import split_str
+
+
+class Test_Memoization(TestCase):
+    def setUp(self) -> None:
+        self.wrapper = MemoizedArgFunctionWrapper(
+            _cast_str_to_datetime, dateformat="%Y/%m/%d", maxsize=2
+        )
+        return super().setUp()
+
+    def test_hits_and_misses(self):
+        self.assertEqual(self.wrapper("2020/01/02"), datetime(2020, 1, 2))
+        self.assertEqual(self.wrapper("2020/01/02"), datetime(2020, 1, 2))
+        info = self.wrapper.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_eviction(self):
+        for value in ["2020/01/01", "2020/01/02", "2020/01/01", "2020/01/03"]:
+            self.wrapper(value)
+        info = self.wrapper.cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 2))
+        # least recently used entry was evicted
+        self.wrapper("2020/01/01")
+        self.assertEqual(self.wrapper.cache_info().hits, 2)
+
+    def test_exceptions_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(CastException):
+                self.wrapper("invalid")
+        self.assertEqual(self.wrapper.cache_info().currsize, 0)
+
+    def test_mutable_results_excluded(self):
+        wrapper = MemoizedArgFunctionWrapper(split_str, delimiter=",")
+        self.assertFalse(wrapper.cache_enabled)
+        first = wrapper("a,b")
+        self.assertIsNot(first, wrapper("a,b"))
+        self.assertEqual(wrapper.cache_info().misses, 0)
+
+    def test_bound_copy_shares_cache(self):
+        bound = self.wrapper.bind(dateformat="%d.%m.%Y")
+        self.assertEqual(bound("02.01.2020"), datetime(2020, 1, 2))
+        self.assertEqual(self.wrapper("2020/01/02"), datetime(2020, 1, 2))
+        self.assertEqual(self.wrapper.cache_info().currsize, 2)
+
+    def test_type_handler_statistics(self):
+        handler = DefaultTypeHandler(type_mapping={(str, datetime): self.wrapper})
+        handler.TYPE_MAPPING[(str, datetime)]("2020/01/02")
+        self.assertEqual(handler.cache_info()[(str, datetime)].misses, 1)
+        duplicate = copy.deepcopy(self.wrapper)
+        self.assertEqual(duplicate.cache_info().misses, 0)
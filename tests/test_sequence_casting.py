@@ -0,0 +1,40 @@
+import pathlib as pl
+from dataclasses import dataclass
+from typing import List, Tuple
+from unittest import TestCase
+import numpy as np
+from data_validation.data_parsing import Container
+from data_validation.exceptions import CastException
+from data_validation.validation import Validator
+
+
+@dataclass
+class Series_Container(Container):
+    values: List[int] = Validator()
+    paths: List[pl.Path] = Validator(default=None, allow_none=True)
+    pair: Tuple[float, ...] = Validator(default=None, allow_none=True)
+
+
+class Test_Sequence_Casting(TestCase):
+    def test_homogeneous(self):
+        instance = Series_Container(values=[1.0, 2.0, 3.0], paths=["a", "b"])
+        self.assertEqual(instance.values, [1, 2, 3])
+        self.assertIs(type(instance.values), list)
+        self.assertEqual(instance.paths, [pl.Path("a"), pl.Path("b")])
+
+    def test_mixed(self):
+        instance = Series_Container(values=[1, 2.0, np.int64(3), 4.0])
+        self.assertEqual(instance.values, [1, 2, 3, 4])
+        self.assertTrue(all(type(item) is int for item in instance.values))
+        paths = Series_Container(values=[], paths=["a", pl.Path("b"), "c"]).paths
+        self.assertEqual(paths, [pl.Path("a"), pl.Path("b"), pl.Path("c")])
+
+    def test_mixed_with_str(self):
+        self.assertEqual(Series_Container(values=[1, 2.0, "3"]).values, [1, 2, 3])
+        with self.assertRaises(CastException):
+            Series_Container(values=[1, 2.0, "x"])
+
+    def test_origin_type(self):
+        instance = Series_Container(values=(1, 2), pair=[1, 2.5])
+        self.assertEqual(instance.values, [1, 2])
+        self.assertEqual(instance.pair, (1.0, 2.5))
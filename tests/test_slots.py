@@ -2,7 +2,17 @@ import copy
 import json
 from typing import Any
 from unittest import TestCase
-from sample.example_dataclasses import Person_with_slots
+import pickle
+from dataclasses import dataclass
+from data_validation.data_parsing import Container
+from data_validation.validation import Validator
+from sample.example_dataclasses import (
+    Child,
+    Person,
+    Person_with_slots,
+    Slotted_Child,
+    Slotted_Person,
+)
 from data_validation.exceptions import CastException, UnexpectedCastException
 from tests import TEST_FILE_PATH
 
@@ -21,4 +31,63 @@ class Test_Altering(TestCase):
         pass
 
     def test_invalid(self):
-        self.person.first_name = "Bard"
\ No newline at end of file
+        self.person.first_name = "Bard"
+        self.assertEqual(self.person.first_name, "Bard")
+        self.assertFalse(hasattr(self.person, "__dict__"))
+
+
+class Test_Slotted_Container(TestCase):
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            test_dict = json.load(file)
+        self.PERSON_DICT = test_dict["single_person"]
+        self.CHILD_DICT = test_dict["example_child"]
+        return super().setUp()
+
+    def test_no_instance_dict(self):
+        for instance in (Slotted_Person(**self.PERSON_DICT), Slotted_Child(**self.CHILD_DICT)):
+            with self.subTest(cls=type(instance).__name__):
+                self.assertFalse(hasattr(instance, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    instance.unknown_attribute = 1
+        self.assertTrue(hasattr(Person(**self.PERSON_DICT), "__dict__"))
+
+    def test_same_behavior_as_regular(self):
+        for regular_cls, slotted_cls, kwargs in (
+            (Person, Slotted_Person, self.PERSON_DICT),
+            (Child, Slotted_Child, self.CHILD_DICT),
+        ):
+            with self.subTest(cls=slotted_cls.__name__):
+                regular, slotted = regular_cls(**kwargs), slotted_cls(**kwargs)
+                self.assertEqual(regular.as_dict(), slotted.as_dict())
+                self.assertEqual(regular.as_flattened_dict(), slotted.as_flattened_dict())
+                self.assertEqual(regular.dataclass_dict_repr(), slotted.dataclass_dict_repr())
+                self.assertEqual(slotted.weight, 80.0)
+
+    def test_inherited_fields_validated(self):
+        child = Slotted_Child(**self.CHILD_DICT)
+        with self.assertRaises(CastException):
+            child.gender = "something"
+        with self.assertRaises(CastException):
+            child.school_attendance = "abc"
+        kwargs = dict(self.CHILD_DICT, occupation=None)
+        self.assertEqual(Slotted_Child(**kwargs).occupation, Child(**kwargs).occupation)
+
+    def test_pickle(self):
+        child = Slotted_Child(**self.CHILD_DICT)
+        self.assertEqual(pickle.loads(pickle.dumps(child)), child)
+
+    def test_plain_default_rejected(self):
+        with self.assertRaises(TypeError):
+
+            @dataclass
+            class Broken(Container, slots=True):
+                name: str = "default"
+
+        @dataclass
+        class Plain(Container, slots=True):
+            name: str
+            count: int = Validator(default=0)
+
+        plain = Plain(name="plain")
+        self.assertEqual((plain.name, plain.count), ("plain", 0))
@@ -0,0 +1,45 @@
+import io
+import json
+from itertools import islice
+from typing import List
+from unittest import TestCase
+from sample.example_dataclasses import Person
+from data_validation.batch import RecordError
+from data_validation.streaming import iter_validate
+from tests import TEST_CSV_PATH, TEST_FILE_PATH
+
+
+class Test_Streaming(TestCase):
+    PERSONS: List[dict]
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            self.PERSONS = json.load(file)["team"]
+        lines = [json.dumps(p) for p in self.PERSONS]
+        lines.insert(1, "")
+        lines.insert(2, "{not json")
+        self.jsonl = io.StringIO("\n".join(lines) + "\n")
+        return super().setUp()
+
+    def test_jsonl(self):
+        results = list(iter_validate(self.jsonl, Person, format="jsonl"))
+        self.assertEqual(len(results), 4)
+        self.assertIsInstance(results[0], Person)
+        self.assertIsInstance(results[1], RecordError)
+        self.assertEqual(results[1].error_type, "JSONDecodeError")
+        self.assertEqual(results[3].last_name, self.PERSONS[2]["last_name"])
+
+    def test_lazy(self):
+        first = next(iter_validate(self.jsonl, Person, format="jsonl"))
+        self.assertEqual(first.first_name, self.PERSONS[0]["first_name"])
+
+    def test_csv(self):
+        results = list(islice(iter_validate(TEST_CSV_PATH, Person, chunksize=2), 3))
+        self.assertIsInstance(results[0], RecordError)
+        self.assertEqual(results[0].index, 0)
+        self.assertIsInstance(results[2], Person)
+        self.assertEqual(results[2].last_name, "Lynch")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            next(iter_validate(TEST_FILE_PATH, Person))
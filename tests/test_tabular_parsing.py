@@ -1,14 +1,35 @@
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, List
 from unittest import TestCase
+from unittest.mock import patch
 import numpy as np
 
 import pandas as pd
+from data_validation.data_casting_func import _cast_str_to_datetime
+from data_validation.data_parsing import Container
+from data_validation.frame_validation import COLUMN_CAST_MAPPING
+from data_validation.function_wrappers import MemoizedArgFunctionWrapper
+from data_validation.validation import DefaultTypeHandler, Validator
 from sample.example_dataclasses import Person
 
 from sample.example_dataclasses import Team as Team
 from tests import TEST_CSV_PATH
 
 
+@dataclass
+class Event(Container):
+    start: datetime = Validator(
+        type_handler=DefaultTypeHandler(
+            source_type=str,
+            dest_type=datetime,
+            casting_fct=MemoizedArgFunctionWrapper(
+                _cast_str_to_datetime, dateformat="%Y/%m/%d", maxsize=16
+            ),
+        )
+    )
+
+
 class Test_tabular(TestCase):
     PERSONS: List[Person]
     TEAM: Team
@@ -31,3 +52,44 @@ class Test_tabular(TestCase):
             kwargs = {k: v for k, v in row[1].items()}
             valid_values.append(Person.static_validation(**kwargs))
         self.df["valid"] = valid_values
+
+    def test_validate_frame(self):
+        valid, errors = Person.validate_frame(self.df)
+        expected = [
+            Person.static_validation(**kwargs) == "Success" for kwargs in self.PERSONS
+        ]
+        self.assertEqual(valid.tolist(), expected)
+        self.assertIsNotNone(errors.loc[0, "date_of_birth"])
+        self.assertIsNone(errors.loc[1, "date_of_birth"])
+
+    def test_validate_frame_invalid_cells(self):
+        df = self.df.astype({"is_smoker": object, "person_id": float})
+        df.loc[1, "is_smoker"] = "maybe"
+        df.loc[2, "occupation"] = "Pilot"
+        df.loc[2, "person_id"] = 30.5
+        valid, errors = Person.validate_frame(df)
+        self.assertFalse(valid.any())
+        self.assertIn("is_smoker", errors.loc[1, "is_smoker"])
+        self.assertIn("Pilot", errors.loc[2, "occupation"])
+        self.assertIn("CastException", errors.loc[2, "person_id"])
+
+    def test_validate_frame_missing_column(self):
+        valid, errors = Person.validate_frame(self.df.drop(columns="last_name"))
+        self.assertFalse(valid.any())
+        self.assertTrue(errors["last_name"].str.startswith("TypeError").all())
+
+    def test_validate_frame_memoized_cast(self):
+        df = pd.DataFrame({"start": ["2021/03/04", "2021-03-04", "2021/12/31"]})
+        column_cast = COLUMN_CAST_MAPPING[_cast_str_to_datetime]
+        dateformats = []
+
+        def recording_cast(column, dateformat=None):
+            dateformats.append(dateformat)
+            return column_cast(column, dateformat)
+
+        with patch.dict(COLUMN_CAST_MAPPING, {_cast_str_to_datetime: recording_cast}):
+            valid, errors = Event.validate_frame(df)
+        # the maxsize of the wrapper is not passed to the column cast
+        self.assertEqual(dateformats, ["%Y/%m/%d"])
+        self.assertEqual(valid.tolist(), [True, False, True])
+        self.assertIn("CastException", errors.loc[1, "start"])
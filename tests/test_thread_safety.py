@@ -0,0 +1,56 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import TestCase
+from sample.example_dataclasses import Person, PrecisePerson
+from sample.example_custom_validations import Precise_Email_Validation_dynamic
+from data_validation.function_wrappers import ArgFunctionWrapper, FunctionWrapper
+from tests import TEST_FILE_PATH
+
+
+class Test_Thread_Safety(TestCase):
+    PERSONS: List[dict]
+
+    def setUp(self) -> None:
+        with TEST_FILE_PATH.open() as file:
+            test_dict = json.load(file)
+        self.PERSONS = test_dict["team"]
+        self.SINGLE_PERSON = test_dict["single_person"]
+        return super().setUp()
+
+    def test_wrapper_not_altered(self):
+        kwargs = dict(Precise_Email_Validation_dynamic.kwargs)
+        PrecisePerson(**self.SINGLE_PERSON)
+        self.assertEqual(Precise_Email_Validation_dynamic.kwargs, kwargs)
+
+    def test_bind(self):
+        wrapper = ArgFunctionWrapper(lambda value, offset: value + offset, offset=1)
+        bound = wrapper.bind(offset=2)
+        self.assertEqual(wrapper(1), 2)
+        self.assertEqual(bound(1), 3)
+
+    def test_nested_wrapper(self):
+        wrapper = FunctionWrapper(sum, FunctionWrapper(list, range(4)))
+        self.assertEqual(wrapper(), 6)
+        self.assertEqual(wrapper(), 6)
+
+    def test_thread_pool(self):
+        records = [
+            dict(record, person_id=i, is_smoker=["true", 0][i % 2])
+            for i, record in enumerate(self.PERSONS * 200)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            persons = list(executor.map(lambda r: Person(**r), records))
+        for i, (person, record) in enumerate(zip(persons, records)):
+            self.assertEqual(person.person_id, i)
+            self.assertEqual(person.first_name, record["first_name"])
+            self.assertEqual(person.is_smoker, i % 2 == 0)
+
+    def test_thread_pool_references(self):
+        records = [
+            dict(self.SINGLE_PERSON, first_name=name, email=f"{name}.doe@gmail.com")
+            for name in ["anna", "bert", "carl", "dora"] * 50
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            persons = list(executor.map(lambda r: PrecisePerson(**r), records))
+        self.assertEqual([p.first_name for p in persons], [r["first_name"] for r in records])
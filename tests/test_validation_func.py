@@ -0,0 +1,100 @@
+import re
+from dataclasses import dataclass
+from unittest import TestCase
+from data_validation.data_parsing import Container
+from data_validation.function_wrappers import ArgFunctionWrapper, FieldRef
+from data_validation.validation import Validator
+from data_validation.validation_func import (
+    MAX_LISTED_VALUES,
+    begins_with,
+    extract_digits_from_string,
+    is_email,
+    is_in,
+    matches,
+)
+
+ALLOWED_CODES = [f"code_{i}" for i in range(20_000)]
+
+
+@dataclass
+class Order(Container):
+    fallback_code: str = Validator()
+    code: str = Validator(
+        validator_func=ArgFunctionWrapper(
+            is_in, value_list=ALLOWED_CODES[:100] + [FieldRef("fallback_code")]
+        )
+    )
+    reference: str = Validator(
+        validator_func=ArgFunctionWrapper(begins_with, start_val=["ORD-", "RET-"])
+    )
+    zip_code: str = Validator(validator_func=ArgFunctionWrapper(matches, pattern=r"\d{5}"))
+    email: str = Validator(validator_func=ArgFunctionWrapper(is_email))
+
+
+class Test_Validation_Func(TestCase):
+    ORDER = {
+        "fallback_code": "manual",
+        "code": "code_42",
+        "reference": "RET-1",
+        "zip_code": "12345",
+        "email": "john.doe@gmail.com",
+    }
+
+    def test_arguments_prepared_once(self):
+        in_list = ArgFunctionWrapper(is_in, value_list=ALLOWED_CODES)
+        self.assertIsInstance(in_list.kwargs["value_list"], frozenset)
+        pattern = ArgFunctionWrapper(matches, pattern=r"\d+")
+        self.assertIsInstance(pattern.kwargs["pattern"], re.Pattern)
+        prefixes = ArgFunctionWrapper(begins_with, start_val=["a", "b"])
+        self.assertEqual(prefixes.kwargs["start_val"], ("a", "b"))
+        # references are only known at invocation
+        ref = ArgFunctionWrapper(is_in, value_list=FieldRef("codes"))
+        self.assertEqual(ref.kwargs["value_list"], FieldRef("codes"))
+
+    def test_is_in(self):
+        in_list = ArgFunctionWrapper(is_in, value_list=ALLOWED_CODES)
+        in_list("code_19999")
+        with self.assertRaises(ValueError) as context:
+            in_list("code_20000")
+        message = str(context.exception)
+        self.assertIn(f"... ({len(ALLOWED_CODES) - MAX_LISTED_VALUES} more)", message)
+        self.assertLess(len(message), 300)
+        # the listed values keep the order of the allow-list
+        self.assertIn(", ".join(map(repr, ALLOWED_CODES[:MAX_LISTED_VALUES])), message)
+        with self.assertRaises(ValueError):
+            in_list(["unhashable"])
+        # unprepared arguments are still accepted
+        is_in("b", ["a", "b"])
+
+    def test_begins_with(self):
+        begins_with("ORD-1", ("ORD-", "RET-"))
+        begins_with("ORD-1", "ORD-")
+        with self.assertRaisesRegex(ValueError, "'ORD-' or 'RET-'"):
+            begins_with("INV-1", ["ORD-", "RET-"])
+
+    def test_matches_whole_value(self):
+        matches("12345", r"\d{5}")
+        with self.assertRaises(ValueError):
+            matches("123456", re.compile(r"\d{5}"))
+
+    def test_is_email(self):
+        is_email("john.doe@example_uni.edu")
+        for invalid in ("john.doe", "john@doe", "john doe@gmail.com", "a@b@gmail.com"):
+            with self.subTest(value=invalid), self.assertRaises(ValueError):
+                is_email(invalid)
+
+    def test_extract_digits(self):
+        self.assertEqual(extract_digits_from_string("ab12c3"), "12")
+        self.assertIsNone(extract_digits_from_string("abc"))
+
+    def test_validators_in_container(self):
+        Order(**self.ORDER)
+        Order(**dict(self.ORDER, code="manual"))
+        for field, value in (
+            ("code", "code_999"),
+            ("reference", "INV-1"),
+            ("zip_code", "1234"),
+            ("email", "john.doe"),
+        ):
+            with self.subTest(field=field), self.assertRaises(ValueError):
+                Order(**dict(self.ORDER, **{field: value}))